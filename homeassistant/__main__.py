@@ -105,6 +105,26 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Write a trace of the integration setups during startup",
+    )
+    parser.add_argument(
+        "--config-cache",
+        action="store_true",
+        help="Cache the parsed configuration to skip parsing YAML on restart",
+    )
+    parser.add_argument(
+        "--lazy-platforms",
+        action="store_true",
+        help="Only load diagnostics and system health platforms when needed",
+    )
+    parser.add_argument(
+        "--storage-snapshot",
+        action="store_true",
+        help="Load the registries from a snapshot of their storage files",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -200,6 +220,10 @@ def main() -> int:
         recovery_mode=args.recovery_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
+        config_cache=args.config_cache,
+        lazy_platforms=args.lazy_platforms,
+        storage_snapshot=args.storage_snapshot,
         safe_mode=safe_mode,
     )
 
@@ -83,10 +83,12 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.json import save_json
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -253,6 +255,20 @@ PRELOAD_STORAGE = [
     "auth_module.totp",
 ]
 
+# Storage loaded from the storage snapshot when it is enabled, files
+# which are written frequently, like restore state, are not included
+# since every change to them means rewriting the snapshot
+SNAPSHOT_STORAGE = [
+    area_registry.STORAGE_KEY,
+    category_registry.STORAGE_KEY,
+    config_entries.STORAGE_KEY,
+    device_registry.STORAGE_KEY,
+    entity_registry.STORAGE_KEY,
+    floor_registry.STORAGE_KEY,
+    issue_registry.STORAGE_KEY,
+    label_registry.STORAGE_KEY,
+]
+
 
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
@@ -279,6 +295,13 @@ async def async_setup_hass(
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
+        if runtime_config.startup_trace:
+            startup_trace.async_enable_startup_trace(hass)
+        if runtime_config.lazy_platforms:
+            loader.async_enable_lazy_platforms(hass)
+        if runtime_config.storage_snapshot:
+            get_internal_store_manager(hass).async_enable_snapshot(SNAPSHOT_STORAGE)
+
         return hass
 
     async def stop_hass(hass: core.HomeAssistant) -> None:
@@ -311,7 +334,9 @@ async def async_setup_hass(
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
         try:
-            config_dict = await conf_util.async_hass_config_yaml(hass)
+            config_dict = await conf_util.async_hass_config_yaml(
+                hass, cache=runtime_config.config_cache
+            )
         except HomeAssistantError as err:
             _LOGGER.error(
                 "Failed to parse configuration.yaml: %s. Activating recovery mode",
@@ -423,8 +448,13 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     translation.async_setup(hass)
     entity.async_setup(hass)
     template.async_setup(hass)
+    store_manager = get_internal_store_manager(hass)
+    if store_manager.snapshot_enabled:
+        # The registries are preloaded from the snapshot while the
+        # store manager initializes, they have to wait for it
+        await store_manager.async_initialize()
     await asyncio.gather(
-        create_eager_task(get_internal_store_manager(hass).async_initialize()),
+        create_eager_task(store_manager.async_initialize()),
         create_eager_task(area_registry.async_load(hass)),
         create_eager_task(category_registry.async_load(hass)),
         create_eager_task(device_registry.async_load(hass)),
@@ -921,11 +951,28 @@ async def _async_resolve_domains_to_setup(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    integrations_to_setup = [
+        integration_cache[domain]
+        for domain in domains_to_setup
+        if domain in integration_cache
+    ]
+
+    # Read the module files of the integrations in parallel so importing
+    # them one after another in the import executor does not wait on the disk
+    hass.async_create_background_task(
+        loader.async_prefetch_files(hass, integrations_to_setup),
+        "prefetch integration files",
+        eager_start=True,
+    )
+
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
+    # and import the integrations that do not depend on others.
     # We do not wait for this since its an optimization only
     hass.async_create_background_task(
-        requirements.async_load_installed_versions(hass, needed_requirements),
+        _async_import_independent_integrations(
+            hass, needed_requirements, integrations_to_setup
+        ),
         "check installed requirements",
         eager_start=True,
     )
@@ -965,6 +1012,33 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_import_independent_integrations(
+    hass: core.HomeAssistant,
+    needed_requirements: set[str],
+    integrations: list[loader.Integration],
+) -> None:
+    """Import the integrations without dependencies in a single executor job.
+
+    Their setup can start right away, importing them in one job avoids
+    scheduling an import executor job for each of them. Integrations with
+    requirements that are not installed yet are imported by their setup
+    after it installed the requirements.
+    """
+    await requirements.async_load_installed_versions(hass, needed_requirements)
+    await loader.async_import_components(
+        hass,
+        [
+            integration
+            for integration in integrations
+            if not integration.dependencies
+            and not integration.after_dependencies
+            and requirements.async_requirements_installed(
+                hass, integration.requirements
+            )
+        ],
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -1068,9 +1142,38 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    if tracer := startup_trace.async_pop_startup_tracer(hass):
+        await _async_write_startup_trace(hass, tracer)
+
+    if unused_platforms := loader.async_pop_unused_preload_platforms(hass):
+        _LOGGER.debug(
+            "Platforms preloaded during startup but never used: %s",
+            ", ".join(unused_platforms),
+        )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+
+
+async def _async_write_startup_trace(
+    hass: core.HomeAssistant, tracer: startup_trace.StartupTracer
+) -> None:
+    """Write the startup trace and log the critical path."""
+    path = hass.config.path(startup_trace.STARTUP_TRACE_FILE)
+    try:
+        await hass.async_add_executor_job(save_json, path, tracer.as_chrome_trace())
+    except HomeAssistantError as err:
+        _LOGGER.error("Unable to write startup trace: %s", err)
+        return
+    _LOGGER.warning(
+        "Startup trace written to %s, critical path: %s",
+        path,
+        " -> ".join(
+            f"{domain} ({duration:.2f}s)"
+            for domain, duration in reversed(tracer.critical_path(hass))
+        ),
+    )
@@ -48,6 +48,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import config_validation as cv, recorder, template
 from homeassistant.helpers.json import json_dumps, json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.state_snapshot import async_get_states_json
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
@@ -215,17 +216,8 @@ class APIStatesView(HomeAssistantView):
         """Get current states."""
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
-        if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
-        else:
-            entity_perm = user.permissions.check_entity
-            states = (
-                state.as_dict_json
-                for state in hass.states.async_all()
-                if entity_perm(state.entity_id, "read")
-            )
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=async_get_states_json(hass, user),
             content_type=CONTENT_TYPE_JSON,
             zlib_executor_size=32768,
         )
@@ -113,11 +113,12 @@ def _register_diagnostics_platform(
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
+    await integration_platform.async_load_lazy_integration_platforms(hass, DOMAIN)
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
     result = [
         {
@@ -139,12 +140,15 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
+    await integration_platform.async_load_lazy_integration_platforms(
+        hass, DOMAIN, (domain,)
+    )
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
 
     if (info := diagnostics_data.platforms.get(domain)) is None:
@@ -267,6 +271,9 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
+        await integration_platform.async_load_lazy_integration_platforms(
+            hass, DOMAIN, (config_entry.domain,)
+        )
         diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
         if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
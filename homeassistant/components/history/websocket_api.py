@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -55,6 +56,52 @@ class HistoryLiveStream:
     wait_sync_task: asyncio.Task | None = None
 
 
+class HistoryChunkStream:
+    """Send the chunks of a history_during_period response.
+
+    The next chunk is only read from the database once the client has
+    caught up with the messages, and reading stops once the stream is
+    unsubscribed or the connection is closed.
+    """
+
+    __slots__ = ("connection", "msg_id", "cancelled", "_drained")
+
+    def __init__(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Initialize the stream."""
+        self.connection = connection
+        self.msg_id = msg_id
+        self.cancelled = False
+        self._drained: asyncio.Future[None] | None = None
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop sending chunks."""
+        self.cancelled = True
+        self._async_release()
+
+    @callback
+    def _async_release(self) -> None:
+        """Release the sender waiting for the client."""
+        if self._drained is not None and not self._drained.done():
+            self._drained.set_result(None)
+
+    async def async_send(self, message: bytes) -> bool:
+        """Send a chunk and wait until the client has caught up.
+
+        Returns False if the stream was cancelled.
+        """
+        if self.cancelled:
+            return False
+        connection = self.connection
+        connection.send_message(message)
+        if connection.backlogged:
+            self._drained = connection.hass.loop.create_future()
+            connection.async_on_drained(self._async_release)
+            await self._drained
+            self._drained = None
+        return not self.cancelled
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
@@ -67,13 +114,33 @@ def _ws_get_significant_states(
     msg_id: int,
     start_time: dt,
     end_time: dt | None,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
+    current_attributes: dict[str, dict[str, Any]],
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
+    if max_points:
+        return json_bytes(
+            messages.result_message(
+                msg_id,
+                history.get_significant_states_downsampled(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    max_points,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    current_attributes,
+                ),
+            )
+        )
     return json_bytes(
         messages.result_message(
             msg_id,
@@ -93,6 +160,75 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    stream: HistoryChunkStream,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk is converted to json and handed to the event loop before
+    the next one is read from the database.
+    """
+    msg_id = stream.msg_id
+    send_chunk: dict[str, list[dict[str, Any]]] | None = None
+    with closing(
+        history.stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    ) as chunks:
+        for chunk in chunks:
+            if (
+                send_chunk is not None
+                and not asyncio.run_coroutine_threadsafe(
+                    stream.async_send(
+                        _generate_history_chunk_message(msg_id, send_chunk, False)
+                    ),
+                    hass.loop,
+                ).result()
+            ):
+                return
+            send_chunk = chunk
+    asyncio.run_coroutine_threadsafe(
+        stream.async_send(
+            _generate_history_chunk_message(msg_id, send_chunk or {}, True)
+        ),
+        hass.loop,
+    ).result()
+
+
+def _generate_history_chunk_message(
+    msg_id: int, states: dict[str, list[dict[str, Any]]], done: bool
+) -> bytes:
+    """Generate a message with a chunk of a history_during_period response."""
+    return json_bytes(messages.event_message(msg_id, {"states": states, "done": done}))
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history_during_period response."""
+    if not msg["chunked"]:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(_generate_history_chunk_message(msg["id"], {}, True))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +239,10 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        # Send the states in chunks of events after the result
+        vol.Optional("chunked", default=False): bool,
+        # Downsample numeric states to at most this many points per entity
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -112,6 +252,13 @@ async def ws_get_history_during_period(
     """Handle history during period websocket command."""
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
+    max_points: int | None = msg.get("max_points")
+
+    if max_points and msg["chunked"]:
+        connection.send_error(
+            msg["id"], "invalid_format", "max_points cannot be used with chunked"
+        )
+        return
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -129,7 +276,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,12 +296,44 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        stream = HistoryChunkStream(connection, msg["id"])
+        # The stream can be stopped with unsubscribe_events
+        connection.subscriptions[msg["id"]] = stream.async_cancel
+        connection.send_result(msg["id"])
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                stream,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        finally:
+            connection.subscriptions.pop(msg["id"], None)
+        return
+
+    current_attributes: dict[str, dict[str, Any]] = {}
+    if max_points:
+        # Downsampling from statistics needs the current attributes
+        # which have to be read from the state machine here
+        current_attributes = {
+            entity_id: dict(state.attributes)
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id))
+        }
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -167,6 +346,8 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
+            current_attributes,
         )
     )
 
@@ -22,6 +22,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
@@ -40,6 +41,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_PROFILE_TEMPLATES = "profile_templates"
+SERVICE_PROFILE_EVENTS = "profile_events"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,17 +66,24 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_PROFILE_TEMPLATES,
+    SERVICE_PROFILE_EVENTS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
+DEFAULT_MAX_TEMPLATES = 25
+DEFAULT_MAX_EVENT_TYPES = 25
 
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_TEMPLATES = "max_templates"
+CONF_MAX_EVENT_TYPES = "max_event_types"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+PROFILE_EVENTS_RUNNING = "profile_events_running"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -221,6 +231,11 @@ async def async_setup_entry(  # noqa: C901
                         "Cache data for sqlalchemy LRUCache %s: %s: %s", lru, key, value
                     )
 
+        _LOGGER.critical(
+            "Cache stats for compiled templates: %s",
+            template.COMPILED_TEMPLATE_CACHE.stats(),
+        )
+
         persistent_notification.create(
             hass,
             (
@@ -260,6 +275,98 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_profile_templates(call: ServiceCall) -> None:
+        """Record template renders and log the most expensive templates."""
+        if template.async_render_profiling_enabled(hass):
+            raise HomeAssistantError("Template profiling already started")
+
+        start_time = int(time.time() * 1000000)
+        persistent_notification.async_create(
+            hass,
+            (
+                "Template profiling has started. This notification will be updated"
+                " when it is complete."
+            ),
+            title="Template profiling started",
+            notification_id=f"profile_templates_{start_time}",
+        )
+        template.async_start_render_profiling(hass)
+        try:
+            await asyncio.sleep(float(call.data[CONF_SECONDS]))
+        finally:
+            report = template.async_stop_render_profiling(hass)
+
+        for profile in report[: call.data[CONF_MAX_TEMPLATES]]:
+            _LOGGER.critical(
+                "Template rendered %s times (%.2f/s) for %s in %.6fs (p99 %.6fs,"
+                " max %.6fs), triggered by %s: %s",
+                profile["renders"],
+                profile["renders_per_second"],
+                profile["source"] or "unknown",
+                profile["total_time"],
+                profile["p99_time"],
+                profile["max_time"],
+                profile["triggers"],
+                profile["template"],
+            )
+
+        persistent_notification.async_create(
+            hass,
+            (
+                f"{len(report)} templates have been profiled. See [the"
+                " logs](/config/logs) to review the most expensive templates."
+            ),
+            title="Template profiling completed",
+            notification_id=f"profile_templates_{start_time}",
+        )
+
+    async def _async_profile_events(call: ServiceCall) -> None:
+        """Record event dispatch timings and log the slowest event types."""
+        if PROFILE_EVENTS_RUNNING in domain_data:
+            raise HomeAssistantError("Event profiling already started")
+
+        start_time = int(time.time() * 1000000)
+        persistent_notification.async_create(
+            hass,
+            (
+                "Event profiling has started. This notification will be updated"
+                " when it is complete."
+            ),
+            title="Event profiling started",
+            notification_id=f"profile_events_{start_time}",
+        )
+        domain_data[PROFILE_EVENTS_RUNNING] = True
+        hass.bus.async_set_dispatch_stats(True)
+        try:
+            await asyncio.sleep(float(call.data[CONF_SECONDS]))
+        finally:
+            dispatch_stats = hass.bus.async_dispatch_stats()
+            hass.bus.async_set_dispatch_stats(False)
+            domain_data.pop(PROFILE_EVENTS_RUNNING)
+
+        report = sorted(
+            dispatch_stats.items(), key=lambda item: item[1]["total"], reverse=True
+        )
+        for event_type, stats in report[: call.data[CONF_MAX_EVENT_TYPES]]:
+            _LOGGER.critical(
+                "Event %s dispatched %s times in %.6fs (mean %.6fs, max %.6fs)",
+                event_type,
+                stats["count"],
+                stats["total"],
+                stats["mean"],
+                stats["max"],
+            )
+
+        persistent_notification.async_create(
+            hass,
+            (
+                f"{len(report)} event types have been profiled. See [the"
+                " logs](/config/logs) to review the slowest event types."
+            ),
+            title="Event profiling completed",
+            notification_id=f"profile_events_{start_time}",
+        )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +489,36 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE_TEMPLATES,
+        _async_profile_templates,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float),
+                vol.Optional(
+                    CONF_MAX_TEMPLATES, default=DEFAULT_MAX_TEMPLATES
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE_EVENTS,
+        _async_profile_events,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float),
+                vol.Optional(
+                    CONF_MAX_EVENT_TYPES, default=DEFAULT_MAX_EVENT_TYPES
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+            }
+        ),
+    )
+
     return True
 
 
@@ -54,6 +54,7 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_AUTO_PURGE_INCREMENTAL = "auto_purge_incremental"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
@@ -61,6 +62,8 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT_STATES = "bulk_insert_states"
+CONF_SPOOL_MAX_SIZE = "spool_max_size"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -96,6 +99,9 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(
+                        CONF_AUTO_PURGE_INCREMENTAL, default=False
+                    ): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -113,6 +119,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT_STATES, default=False): cv.boolean,
+                    # Maximum size of the on-disk spool in MiB, 0 disables it
+                    vol.Optional(CONF_SPOOL_MAX_SIZE, default=0): cv.positive_int,
                 }
             ),
         )
@@ -163,6 +172,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert_states=conf[CONF_BULK_INSERT_STATES],
+        spool_max_size=conf[CONF_SPOOL_MAX_SIZE] * 1024**2,
+        auto_purge_incremental=conf[CONF_AUTO_PURGE_INCREMENTAL],
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -36,6 +36,7 @@ from homeassistant.core import (
     Event,
     EventStateChangedData,
     HomeAssistant,
+    State,
     callback,
 )
 from homeassistant.helpers.event import (
@@ -61,6 +62,7 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPOOL_DIRECTORY,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -87,12 +89,14 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import IncrementalPurgeProgress
 from .queries import get_migration_changes
+from .spool import RecorderSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import StatesBulkBuffer, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -104,10 +108,13 @@ from .tasks import (
     CompileMissingStatisticsTask,
     DatabaseLockTask,
     ImportStatisticsTask,
+    IncrementalPurgeTask,
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpoolReplayTask,
+    StatisticsAggregatesTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -149,6 +156,12 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# Spooled events are written in batches
+SPOOL_WRITE_INTERVAL = 1
+# Events replayed from the spool per SpoolReplayTask so that other
+# tasks in the queue still get a turn while replaying
+SPOOL_REPLAY_MAX_EVENTS = 1000
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -173,6 +186,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert_states: bool = False,
+        spool_max_size: int = 0,
+        auto_purge_incremental: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -182,6 +198,10 @@ class Recorder(threading.Thread):
         self.recorder_and_worker_thread_ids: set[int] = set()
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
+        # Purge a bucket of time every five minutes instead of everything
+        # at once every night, must be set before creating the table managers
+        self.auto_purge_incremental = auto_purge_incremental
+        self.incremental_purge_progress = IncrementalPurgeProgress()
         self.keep_days = keep_days
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
@@ -203,6 +223,21 @@ class Recorder(threading.Thread):
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
+        # When the queue backlog grows too large new events are written
+        # to the spool on disk, in order, until the recorder catches up
+        self._spool = (
+            RecorderSpool(hass.config.path(SPOOL_DIRECTORY), spool_max_size)
+            if spool_max_size
+            else None
+        )
+        self._spooling = False
+        self._spool_buffer: list[Event] = []
+        self._spool_write_task: asyncio.Task[None] | None = None
+        self._spool_write_future: asyncio.Future[bool] | None = None
+        self._spool_replay_queued = False
+        # Events spooled before the last shutdown are waiting to be replayed
+        self._spool_loaded = False
+
         # The entity_filter is exposed on the recorder instance so that
         # it can be used to see if an entity is being recorded and is called
         # by is_entity_recorder and the sensor recorder.
@@ -215,6 +250,10 @@ class Recorder(threading.Thread):
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        # The bulk buffer is created when the event session is opened
+        # if bulk_insert_states is enabled and the database supports it
+        self.bulk_insert_states = bulk_insert_states
+        self.states_bulk_buffer: StatesBulkBuffer | None = None
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -300,9 +339,24 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        self._async_listen_events()
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            QUEUE_CHECK_INTERVAL,
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self) -> None:
+        """Listen for new events and put them in the queue or the spool."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put: Callable[[Event], None]
+        if self._spooling:
+            queue_put = self._async_spool_event
+        else:
+            queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -335,12 +389,6 @@ class Recorder(threading.Thread):
             MATCH_ALL,
             _event_listener,
         )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            QUEUE_CHECK_INTERVAL,
-            name="Recorder queue watcher",
-        )
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -372,6 +420,16 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
+        if self._spool is not None and not self._spool_loaded:
+            if not self._spooling and self.backlog >= MAX_QUEUE_BACKLOG_MIN_VALUE:
+                _LOGGER.warning(
+                    "The recorder backlog queue reached %s events; new events "
+                    "will be spooled to %s until the recorder catches up",
+                    self.backlog,
+                    self._spool.path,
+                )
+                self._async_start_spooling()
+            return
         if not self._reached_max_backlog():
             return
         _LOGGER.error(
@@ -385,6 +443,103 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_start_spooling(self) -> None:
+        """Send new events to the spool until the recorder has caught up."""
+        self._spooling = True
+        if self._event_listener:
+            self._event_listener()
+            self._async_listen_events()
+        self._async_queue_spool_replay()
+
+    @callback
+    def _async_queue_spool_replay(self) -> None:
+        """Queue replaying the spool after the events already in the queue."""
+        self._spool_replay_queued = True
+        self.queue_task(SpoolReplayTask())
+
+    @callback
+    def _async_spool_event(self, event: Event) -> None:
+        """Buffer an event to be written to the spool."""
+        self._spool_buffer.append(event)
+        if self._spool_write_task is None:
+            self._spool_write_task = self.hass.async_create_background_task(
+                self._async_write_spool(), "Recorder spool write"
+            )
+
+    async def _async_write_spool(self) -> None:
+        """Write the buffered events to the spool, one batch at a time."""
+        spool = self._spool
+        assert spool is not None
+        try:
+            await asyncio.sleep(SPOOL_WRITE_INTERVAL)
+            while events := self._spool_buffer:
+                self._spool_buffer = []
+                self._spool_write_future = self.hass.async_add_executor_job(
+                    spool.append_events, events
+                )
+                # Shielded so the batch is still written if the task is
+                # canceled at shutdown, which waits for it
+                written = await asyncio.shield(self._spool_write_future)
+                self._spool_write_future = None
+                if not written:
+                    _LOGGER.error(
+                        "Unable to add events to the recorder spool with a maximum "
+                        "size of %s bytes; "
+                        "The recorder will stop recording events",
+                        spool.max_size,
+                    )
+                    self._spool_buffer.clear()
+                    self._async_stop_queue_watcher_and_event_listener()
+                    break
+        finally:
+            self._spool_write_task = None
+        if self._spooling and not self._spool_replay_queued:
+            self._async_queue_spool_replay()
+
+    def _replay_loaded_spool(self) -> None:
+        """Replay the events spooled before the last shutdown.
+
+        They are older than any event in the queue, so they are processed
+        before the queue is drained.
+        """
+        assert self._spool is not None
+        _LOGGER.warning(
+            "Replaying %s bytes of events spooled before the last shutdown",
+            self._spool.size,
+        )
+        while self._spool.size:
+            for event in self._spool.read_events(SPOOL_REPLAY_MAX_EVENTS):
+                self._guarded_process_one_task_or_event_or_recover(event)
+        self._spool_loaded = False
+
+    def _replay_spool(self) -> None:
+        """Process the next batch of spooled events."""
+        assert self._spool is not None
+        events = self._spool.read_events(SPOOL_REPLAY_MAX_EVENTS)
+        for event in events:
+            self._guarded_process_one_task_or_event_or_recover(event)
+        self.hass.add_job(
+            self._async_spool_replayed, len(events) < SPOOL_REPLAY_MAX_EVENTS
+        )
+
+    @callback
+    def _async_spool_replayed(self, reached_end: bool) -> None:
+        """Handle a batch of spooled events being replayed."""
+        assert self._spool is not None
+        if not reached_end or self._spool.size:
+            self.queue_task(SpoolReplayTask())
+            return
+        self._spool_replay_queued = False
+        if self._spool_write_task is not None:
+            # The write task queues the next replay once it has written
+            return
+        _LOGGER.info("The recorder has caught up with the spooled events")
+        self._spooling = False
+        if self._event_listener:
+            self._event_listener()
+            self._async_listen_events()
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -452,6 +607,15 @@ class Recorder(threading.Thread):
             self._hass_started.set_result(SHUTDOWN_TASK)
         self.queue_task(StopTask())
         self._async_stop_listeners()
+        if self._spool_write_future is not None:
+            # The batch the canceled spool write task was writing
+            await self._spool_write_future
+            self._spool_write_future = None
+        if self._spool is not None and self._spool_buffer:
+            # The spool write task has been canceled with the other background
+            # tasks, the buffered events are replayed on the next start
+            events, self._spool_buffer = self._spool_buffer, []
+            await self.hass.async_add_executor_job(self._spool.append_events, events)
         await self.hass.async_add_executor_job(self.join)
 
     @callback
@@ -524,7 +688,14 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
-            self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
+            if self.auto_purge_incremental:
+                self.queue_task(
+                    IncrementalPurgeTask(purge_before, repack=repack, cleanup=True)
+                )
+            else:
+                self.queue_task(
+                    PurgeTask(purge_before, repack=repack, apply_filter=False)
+                )
         else:
             self.queue_task(PerodicCleanupTask())
 
@@ -533,6 +704,16 @@ class Recorder(threading.Thread):
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
         self.async_periodic_statistics()
+        status = statistics.get_statistics_aggregates_status(self.hass)
+        if not status.pending and not status.maintained():
+            # The time zone has changed, rebuild the daily and monthly statistics
+            status.pending = True
+            self.queue_task(StatisticsAggregatesTask())
+        if self.auto_purge and self.auto_purge_incremental:
+            purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
+            self.queue_task(
+                IncrementalPurgeTask(purge_before, repack=False, cleanup=False)
+            )
 
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
@@ -748,6 +929,10 @@ class Recorder(threading.Thread):
 
         # After non-live migration, activate the recorder
         self._activate_and_set_db_ready(schema_status)
+        if self._spool is not None and self._spool.load():
+            # Events spooled before the last shutdown are replayed
+            # before any new events, new events are not spooled until then
+            self._spool_loaded = True
         # We wait to start a live migration until startup has finished
         # since it can be cpu intensive and we do not want it to compete
         # with startup which is also cpu intensive
@@ -780,6 +965,13 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        if self._spool_loaded:
+            self._replay_loaded_spool()
+
+        # The daily and monthly statistics are checked first so the missed
+        # statistics are compiled into them while catching up
+        statistics.get_statistics_aggregates_status(self.hass).pending = True
+        self.queue_task(StatisticsAggregatesTask())
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -1023,7 +1215,10 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            if self.states_bulk_buffer is not None:
+                self._process_state_changed_event_into_bulk_buffer(event)
+            else:
+                self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
@@ -1074,14 +1269,89 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
+        if (last_used := event_data_manager.last_used) is not None:
+            last_used.mark_pending(shared_data, event.time_fired_timestamp)
+
         self._add_to_session(session, dbevent)
 
+    def _pop_committed_old_state_id(
+        self, entity_id: str, old_state: State | None
+    ) -> int | None:
+        """Return the id of the last committed state of an entity."""
+        states_manager = self.states_manager
+        if old_state_id := states_manager.pop_committed(entity_id):
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+        return old_state_id
+
+    def _map_state_changed_event(
+        self, event: Event[EventStateChangedData], session: Session
+    ) -> (
+        tuple[int | None, StatesMeta | None, int | None, StateAttributes | None] | None
+    ):
+        """Map a state_changed event to the StatesMeta and StateAttributes tables.
+
+        Returns the metadata_id or pending StatesMeta and the attributes_id
+        or pending StateAttributes of the state, or None if the state should
+        not be recorded.
+        """
+        state_attributes_manager = self.state_attributes_manager
+        states_meta_manager = self.states_meta_manager
+        entity_id = event.data["entity_id"]
+        if entity_id is None or not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return None
+
+        # Map the entity_id to the StatesMeta table
+        metadata_id: int | None = None
+        if not (states_meta := states_meta_manager.get_pending(entity_id)) and not (
+            metadata_id := states_meta_manager.get(entity_id, session, True)
+        ):
+            if states_meta_manager.active and not event.data.get("new_state"):
+                # If the entity was removed, we don't need to add it to the
+                # StatesMeta table or record it in the pending commit
+                # if it does not have a metadata_id allocated to it as
+                # it either never existed or was just renamed.
+                return None
+            states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(states_meta)
+            self._add_to_session(session, states_meta)
+
+        # Map the event data to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        attributes_id: int | None = None
+        # Matching attributes found in the pending commit
+        if not (
+            state_attributes := state_attributes_manager.get_pending(shared_attrs)
+        ) and not (
+            # Matching attributes id found in the cache
+            (attributes_id := state_attributes_manager.get_from_cache(shared_attrs))
+            or (
+                (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+                and (
+                    attributes_id := state_attributes_manager.get(
+                        shared_attrs, hash_, session
+                    )
+                )
+            )
+        ):
+            # No matching attributes found, save them in the DB
+            state_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            state_attributes_manager.add_pending(state_attributes)
+            self._add_to_session(session, state_attributes)
+
+        if (last_used := state_attributes_manager.last_used) is not None:
+            last_used.mark_pending(shared_attrs, event.time_fired_timestamp)
+
+        return metadata_id, states_meta, attributes_id, state_attributes
+
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Process a state_changed event into the session."""
-        state_attributes_manager = self.state_attributes_manager
-        states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
@@ -1096,68 +1366,75 @@ class Recorder(threading.Thread):
             dbstate.old_state = pending_state
             if old_state:
                 pending_state.last_reported_ts = old_state.last_reported_timestamp
-        elif old_state_id := states_manager.pop_committed(entity_id):
+        elif old_state_id := self._pop_committed_old_state_id(entity_id, old_state):
             dbstate.old_state_id = old_state_id
-            if old_state:
-                states_manager.update_pending_last_reported(
-                    old_state_id, old_state.last_reported_timestamp
-                )
         if entity_removed:
             dbstate.state = None
         else:
             states_manager.add_pending(entity_id, dbstate)
 
-        if states_meta_manager.active:
+        if self.states_meta_manager.active:
             dbstate.entity_id = None
 
-        if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
-        ):
+        if not (mapped := self._map_state_changed_event(event, session)):
             return
+        metadata_id, states_meta, attributes_id, state_attributes = mapped
 
-        # Map the entity_id to the StatesMeta table
-        if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
-        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+        if states_meta:
+            dbstate.states_meta_rel = states_meta
+        else:
             dbstate.metadata_id = metadata_id
-        elif states_meta_manager.active and entity_removed:
-            # If the entity was removed, we don't need to add it to the
-            # StatesMeta table or record it in the pending commit
-            # if it does not have a metadata_id allocated to it as
-            # it either never existed or was just renamed.
-            return
+        dbstate.attributes = None
+        if state_attributes:
+            dbstate.state_attributes = state_attributes
         else:
-            states_meta = StatesMeta(entity_id=entity_id)
-            states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
+            dbstate.attributes_id = attributes_id
 
-        # Map the event data to the StateAttributes table
-        shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
-        # Matching attributes found in the pending commit
-        if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
-        # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
-            and (
-                attributes_id := state_attributes_manager.get(
-                    shared_attrs, hash_, session
+        self._add_to_session(session, dbstate)
+
+    def _process_state_changed_event_into_bulk_buffer(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Process a state_changed event into the states bulk buffer.
+
+        The state row is buffered instead of being added to the session as
+        a States object. New StatesMeta and StateAttributes are still added
+        to the session.
+        """
+        states_bulk_buffer = self.states_bulk_buffer
+        assert states_bulk_buffer is not None
+        entity_id = event.data["entity_id"]
+        old_state = event.data["old_state"]
+
+        assert self.event_session is not None
+        session = self.event_session
+
+        old_state_id: int | None = None
+        old_state_index = -1
+        if (pending_index := states_bulk_buffer.pop_pending(entity_id)) is not None:
+            old_state_index = pending_index
+            if old_state:
+                states_bulk_buffer.update_pending_last_reported(
+                    pending_index, old_state.last_reported_timestamp
                 )
-            )
-        ):
-            dbstate.attributes_id = attributes_id
         else:
-            # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            old_state_id = self._pop_committed_old_state_id(entity_id, old_state)
 
-        self._add_to_session(session, dbstate)
+        if not (mapped := self._map_state_changed_event(event, session)):
+            return
+        metadata_id, states_meta, attributes_id, state_attributes = mapped
+
+        states_bulk_buffer.add(
+            event,
+            None if self.states_meta_manager.active else entity_id,
+            old_state_id,
+            old_state_index,
+            attributes_id,
+            state_attributes,
+            metadata_id,
+            states_meta,
+        )
+        self._event_session_has_pending_writes = True
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1220,6 +1497,8 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if (states_bulk_buffer := self.states_bulk_buffer) is not None:
+            states_bulk_buffer.insert(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1228,6 +1507,8 @@ class Recorder(threading.Thread):
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        if states_bulk_buffer is not None:
+            states_bulk_buffer.post_commit_pending(self.states_manager)
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1255,6 +1536,8 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        if self.states_bulk_buffer is not None:
+            self.states_bulk_buffer.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1279,6 +1562,19 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        if (
+            self.bulk_insert_states
+            and self.states_bulk_buffer is None
+            and self.engine is not None
+        ):
+            if self.engine.dialect.insert_returning:
+                self.states_bulk_buffer = StatesBulkBuffer()
+            else:
+                _LOGGER.warning(
+                    "The database does not support INSERT ... RETURNING, "
+                    "falling back to inserting states one at a time"
+                )
+                self.bulk_insert_states = False
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
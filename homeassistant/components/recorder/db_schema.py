@@ -93,6 +93,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +118,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -790,6 +794,53 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class _StatisticsAggregate(StatisticsBase):
+    """Long term statistics aggregated per day or month in the local time zone.
+
+    The rows are compiled from the hourly statistics, duration is only nominal
+    since days and months differ in length.
+    """
+
+    # The number of hourly means which are averaged into mean
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDaily(Base, _StatisticsAggregate):
+    """Long term statistics per day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, _StatisticsAggregate):
+    """Long term statistics per month."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator, Mapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -11,13 +12,15 @@ from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS, STREAM_CHUNK_SIZE
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_downsampled as _modern_get_significant_states_downsampled,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
@@ -27,8 +30,10 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_downsampled",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -115,6 +120,50 @@ def get_significant_states(
     )
 
 
+def get_significant_states_downsampled(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    max_points: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    current_attributes: Mapping[str, Mapping[str, Any]] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return a dict of significant states during a time period downsampled."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # The legacy schema is not downsampled
+        return cast(
+            dict[str, list[dict[str, Any]]],
+            get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ),
+        )
+    return _modern_get_significant_states_downsampled(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        max_points,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        current_attributes,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -152,6 +201,47 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield significant states during a time period in compressed state chunks."""
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        # The legacy schema cannot be streamed, return everything as one chunk
+        if states := get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ):
+            yield cast(dict[str, list[dict[str, Any]]], states)
+        return
+    yield from _modern_stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
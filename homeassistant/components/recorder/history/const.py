@@ -3,6 +3,13 @@
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+# The maximum number of states in each chunk of a streamed history
+STREAM_CHUNK_SIZE = 2000
+
+# Extra keys of the compressed states of downsampled history
+DOWNSAMPLED_MIN_KEY = "min"
+DOWNSAMPLED_MAX_KEY = "max"
+
 SIGNIFICANT_DOMAINS = {
     "climate",
     "device_tracker",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -21,14 +21,25 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
 from ... import recorder
 from ..const import LAST_REPORTED_SCHEMA_VERSION
-from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
+from ..db_schema import (
+    SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
+    StateAttributes,
+    States,
+    StatisticsShortTerm,
+)
 from ..filters import Filters
 from ..models import (
     LazyState,
@@ -37,12 +48,16 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..statistics import get_metadata, statistics_during_period
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    DOWNSAMPLED_MAX_KEY,
+    DOWNSAMPLED_MIN_KEY,
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
+    STREAM_CHUNK_SIZE,
 )
 
 _FIELD_MAP = {
@@ -229,6 +244,343 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield significant states in the compressed state format in chunks.
+
+    The rows are read from the database with yield_per and each chunk
+    holds at most chunk_size states, so memory use does not depend on
+    the size of the time window. The states of an entity are yielded
+    in order but may be split over multiple chunks.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        yield from _sorted_states_to_compressed_chunks(
+            session.connection().execute(stmt).yield_per(chunk_size),
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        )
+
+
+def get_significant_states_downsampled(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    max_points: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    current_attributes: Mapping[str, Mapping[str, Any]] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return significant states downsampled to at most max_points per entity.
+
+    The time period is split in max_points buckets and numeric states are
+    replaced with the mean, min and max of each bucket. When the buckets
+    are at least as long as the short term statistics period, entities in
+    current_attributes with short term statistics in their current unit
+    covering the period are read from those instead of the states. Non
+    numeric states are returned unchanged.
+
+    The states are streamed from the database and folded into the buckets
+    as they are read, so at most max_points raw states are held per entity.
+
+    current_attributes must be read from the state machine by the caller
+    since this function runs in the executor.
+    """
+    start_time_ts = start_time.timestamp()
+    end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+    bucket_size = (end_time_ts - start_time_ts) / max_points
+    result: dict[str, list[dict[str, Any]]] = {}
+    if (
+        current_attributes
+        and bucket_size >= StatisticsShortTerm.duration.total_seconds()
+    ):
+        result = _short_term_statistics_downsampled(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            start_time_ts,
+            end_time_ts,
+            bucket_size,
+            no_attributes,
+            current_attributes,
+        )
+    if remaining_entity_ids := [
+        entity_id for entity_id in entity_ids if entity_id not in result
+    ]:
+        downsamplers: dict[str, _StatesDownsampler] = {}
+        for chunk in stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            remaining_entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        ):
+            for entity_id, entity_states in chunk.items():
+                if (downsampler := downsamplers.get(entity_id)) is None:
+                    downsampler = downsamplers[entity_id] = _StatesDownsampler(
+                        max_points, start_time_ts, bucket_size
+                    )
+                for comp_state in entity_states:
+                    downsampler.add(comp_state)
+        for entity_id, downsampler in downsamplers.items():
+            result[entity_id] = downsampler.finish()
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
+
+
+class _StatesDownsampler:
+    """Fold the compressed states of an entity into buckets.
+
+    Runs of numeric states are replaced with the mean, min and max of each
+    bucket. The states are kept unchanged as long as there are no more
+    than max_points of them. States must be added sorted by last_updated.
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_bucket",
+        "_bucket_size",
+        "_bucket_start_ts",
+        "_count",
+        "_downsampling",
+        "_max",
+        "_max_points",
+        "_min",
+        "_start_time_ts",
+        "_sum",
+        "states",
+    )
+
+    def __init__(
+        self, max_points: int, start_time_ts: float, bucket_size: float
+    ) -> None:
+        """Initialize the downsampler."""
+        self.states: list[dict[str, Any]] = []
+        self._max_points = max_points
+        self._start_time_ts = start_time_ts
+        self._bucket_size = bucket_size
+        self._downsampling = False
+        self._bucket: int | None = None
+        self._bucket_start_ts = 0.0
+        self._attributes: dict[str, Any] | None = None
+        self._count = 0
+        self._sum = 0.0
+        self._min = 0.0
+        self._max = 0.0
+
+    def add(self, comp_state: dict[str, Any]) -> None:
+        """Add the next state."""
+        if self._downsampling:
+            self._fold(comp_state)
+            return
+        self.states.append(comp_state)
+        if len(self.states) <= self._max_points:
+            return
+        self._downsampling = True
+        buffered = self.states
+        self.states = []
+        for buffered_state in buffered:
+            self._fold(buffered_state)
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Return the states with the last bucket."""
+        self._flush()
+        return self.states
+
+    def _fold(self, comp_state: dict[str, Any]) -> None:
+        """Fold a state into its bucket."""
+        try:
+            value = float(comp_state[COMPRESSED_STATE_STATE])
+        except (TypeError, ValueError):
+            self._flush()
+            self._bucket = None
+            self.states.append(comp_state)
+            return
+        last_updated_ts: float = comp_state[COMPRESSED_STATE_LAST_UPDATED]
+        state_bucket = max(
+            int((last_updated_ts - self._start_time_ts) // self._bucket_size), 0
+        )
+        if state_bucket != self._bucket:
+            self._flush()
+            self._bucket = state_bucket
+            self._bucket_start_ts = last_updated_ts
+            # Keep the attributes of the first state in each bucket
+            self._attributes = comp_state.get(COMPRESSED_STATE_ATTRIBUTES)
+            self._min = self._max = value
+        elif value < self._min:
+            self._min = value
+        elif value > self._max:
+            self._max = value
+        self._count += 1
+        self._sum += value
+
+    def _flush(self) -> None:
+        """Add the state of the current bucket."""
+        if not self._count:
+            return
+        comp_state: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: str(self._sum / self._count),
+            COMPRESSED_STATE_LAST_UPDATED: self._bucket_start_ts,
+            DOWNSAMPLED_MIN_KEY: self._min,
+            DOWNSAMPLED_MAX_KEY: self._max,
+        }
+        if self._attributes is not None:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = self._attributes
+        self.states.append(comp_state)
+        self._count = 0
+        self._sum = 0.0
+
+
+def _short_term_statistics_downsampled(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    start_time_ts: float,
+    end_time_ts: float,
+    bucket_size: float,
+    no_attributes: bool,
+    current_attributes: Mapping[str, Mapping[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Return downsampled states from the short term statistics.
+
+    Only entities with short term statistics covering the whole period
+    are returned. The statistics are compiled every five minutes so up to
+    one bucket may be missing at each end of the period.
+    """
+    result: dict[str, list[dict[str, Any]]] = {}
+    # Statistics in another unit than the current state would not match
+    # the states returned for the other entities or the current attributes
+    statistic_ids = {
+        entity_id
+        for entity_id, (_, metadata) in get_metadata(
+            hass, statistic_ids=current_attributes.keys() & set(entity_ids)
+        ).items()
+        if metadata["unit_of_measurement"]
+        == current_attributes[entity_id].get(ATTR_UNIT_OF_MEASUREMENT)
+    }
+    if not statistic_ids:
+        return result
+    for entity_id, rows in statistics_during_period(
+        hass,
+        start_time,
+        end_time,
+        statistic_ids,
+        "5minute",
+        None,
+        {"max", "mean", "min"},
+    ).items():
+        if (
+            not rows
+            or rows[0]["start"] > start_time_ts + bucket_size
+            or rows[-1]["end"] < end_time_ts - bucket_size
+        ):
+            continue
+        entity_states: list[dict[str, Any]] = []
+        for _, bucket_rows_iter in groupby(
+            rows, lambda row: int((row["start"] - start_time_ts) // bucket_size)
+        ):
+            bucket_rows = [row for row in bucket_rows_iter if row["mean"] is not None]
+            if not bucket_rows:
+                continue
+            entity_states.append(
+                {
+                    COMPRESSED_STATE_STATE: str(
+                        sum(cast(float, row["mean"]) for row in bucket_rows)
+                        / len(bucket_rows)
+                    ),
+                    COMPRESSED_STATE_LAST_UPDATED: bucket_rows[0]["start"],
+                    DOWNSAMPLED_MIN_KEY: min(
+                        cast(float, row["min"]) for row in bucket_rows
+                    ),
+                    DOWNSAMPLED_MAX_KEY: max(
+                        cast(float, row["max"]) for row in bucket_rows
+                    ),
+                }
+            )
+        if not entity_states:
+            continue
+        if not no_attributes:
+            # Statistics do not keep attributes, use the current ones
+            entity_states[0][COMPRESSED_STATE_ATTRIBUTES] = dict(
+                current_attributes[entity_id]
+            )
+        result[entity_id] = entity_states
+    return result
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the significant states statement and the metadata ids it selects.
+
+    Returns None if none of the entities have been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +589,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +627,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -816,3 +1164,73 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_compressed_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Convert SQL results into chunks of compressed states.
+
+    This yields the same states as _sorted_states_to_dict does with
+    compressed_state_format, without holding more than chunk_size of
+    them in memory.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    chunk: dict[str, list[dict[str, Any]]] = {}
+    chunk_states = 0
+    for metadata_id, group in groupby(states, itemgetter(field_map["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        # With minimal response only the first state is a full state, the
+        # ones after it only provide the state and the last_updated time
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        ent_results: list[dict[str, Any]] | None = None
+        prev_state: str | None = None
+        first = True
+        for row in group:
+            state: str = row[state_idx]
+            if first or not minimal:
+                first = False
+                comp_state = row_to_compressed_state(
+                    row,
+                    attr_cache,
+                    start_time_ts,
+                    entity_id,
+                    state,
+                    row[last_updated_ts_idx],
+                    minimal and no_attributes,
+                )
+            elif state == prev_state:
+                continue
+            else:
+                comp_state = {
+                    COMPRESSED_STATE_STATE: state,
+                    COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                }
+            prev_state = state
+            if ent_results is None:
+                ent_results = chunk[entity_id] = []
+            ent_results.append(comp_state)
+            chunk_states += 1
+            if chunk_states >= chunk_size:
+                yield chunk
+                chunk = {}
+                chunk_states = 0
+                ent_results = None
+    if chunk:
+        yield chunk
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
@@ -37,6 +39,8 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_event_ts,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -53,6 +57,29 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The incremental purge deletes one bucket of this many seconds per run
+INCREMENTAL_PURGE_BUCKET = 3600
+
+
+@dataclass(slots=True)
+class IncrementalPurgeProgress:
+    """Progress of the incremental purge since the recorder started."""
+
+    purge_before: float | None = None
+    purged_before: float | None = None
+    finished: bool = False
+    runs: int = 0
+    states: int = 0
+    events: int = 0
+    state_attributes: int = 0
+    event_data: int = 0
+    # Shared data ids that were known to be in use without a database check
+    in_use_from_cache: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the progress."""
+        return asdict(self)
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -128,6 +155,154 @@ def purge_old_data(
     return True
 
 
+@retryable_database_job("incremental purge")
+def purge_old_data_incremental(
+    instance: Recorder, purge_before: datetime, repack: bool, cleanup: bool
+) -> bool:
+    """Purge the oldest bucket of events and states older than purge_before.
+
+    Rows are deleted in batches of max_bind_vars that are each committed
+    in their own transaction. Returns True once nothing older than
+    purge_before remains.
+    """
+    progress = instance.incremental_purge_progress
+    purge_before_ts = purge_before.timestamp()
+    progress.purge_before = purge_before_ts
+    progress.runs += 1
+    with session_scope(session=instance.get_session()) as session:
+        if instance.use_legacy_events_index and _purging_legacy_format(session):
+            # Legacy rows are linked by event_id and cannot be
+            # bucketed, they are purged the same way purge_old_data does
+            finished = not _purge_legacy_format(instance, session, purge_before)
+        else:
+            bucket_end = _find_incremental_purge_bucket_end(session, purge_before_ts)
+            _LOGGER.debug(
+                "Incrementally purging states and events before %s",
+                dt_util.utc_from_timestamp(bucket_end).isoformat(
+                    sep=" ", timespec="seconds"
+                ),
+            )
+            _purge_states_and_attributes_ids_before(instance, session, bucket_end)
+            _purge_events_and_data_ids_before(instance, session, bucket_end)
+            progress.purged_before = bucket_end
+            finished = bucket_end == purge_before_ts
+
+        statistics_runs = _select_statistics_runs_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
+        short_term_statistics = _select_short_term_statistics_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
+        if statistics_runs:
+            _purge_statistics_runs(session, statistics_runs)
+
+        if short_term_statistics:
+            _purge_short_term_statistics(session, short_term_statistics)
+
+        finished = finished and not statistics_runs and not short_term_statistics
+
+        if cleanup:
+            if instance.event_type_manager.active:
+                _purge_old_event_types(instance, session)
+
+            if instance.states_meta_manager.active:
+                _purge_old_entity_ids(instance, session)
+
+            _purge_old_recorder_runs(instance, session, purge_before)
+    progress.finished = finished
+    if finished and repack:
+        repack_database(instance)
+    return finished
+
+
+def _find_incremental_purge_bucket_end(session: Session, purge_before: float) -> float:
+    """Return the end of the oldest bucket with states or events to purge."""
+    oldest_ts = min(
+        (
+            timestamp
+            for timestamp in (
+                session.execute(find_oldest_state_ts()).scalar(),
+                session.execute(find_oldest_event_ts()).scalar(),
+            )
+            if timestamp is not None
+        ),
+        default=purge_before,
+    )
+    bucket_start = oldest_ts - oldest_ts % INCREMENTAL_PURGE_BUCKET
+    return min(bucket_start + INCREMENTAL_PURGE_BUCKET, purge_before)
+
+
+def _purge_states_and_attributes_ids_before(
+    instance: Recorder, session: Session, purge_before: float
+) -> None:
+    """Purge all states older than purge_before and their unused attributes ids."""
+    progress = instance.incremental_purge_progress
+    purge_before_dt = dt_util.utc_from_timestamp(purge_before)
+    attributes_ids_batch: set[int] = set()
+    while True:
+        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+            session, purge_before_dt, instance.max_bind_vars
+        )
+        if not state_ids:
+            break
+        _purge_state_ids(instance, session, state_ids)
+        session.commit()
+        progress.states += len(state_ids)
+        attributes_ids_batch |= attributes_ids
+
+    if (last_used := instance.state_attributes_manager.last_used) is not None:
+        # Attributes used by states recorded after purge_before are still
+        # in use, only the rest have to be looked up in the database
+        in_use = last_used.used_since(attributes_ids_batch, purge_before)
+        progress.in_use_from_cache += len(in_use)
+        attributes_ids_batch -= in_use
+        last_used.expire(purge_before)
+
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    if unused_attribute_ids_set := _select_unused_attributes_ids(
+        instance, session, attributes_ids_batch, database_engine
+    ):
+        _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+        session.commit()
+        progress.state_attributes += len(unused_attribute_ids_set)
+
+
+def _purge_events_and_data_ids_before(
+    instance: Recorder, session: Session, purge_before: float
+) -> None:
+    """Purge all events older than purge_before and their unused data ids."""
+    progress = instance.incremental_purge_progress
+    purge_before_dt = dt_util.utc_from_timestamp(purge_before)
+    data_ids_batch: set[int] = set()
+    while True:
+        event_ids, data_ids = _select_event_data_ids_to_purge(
+            session, purge_before_dt, instance.max_bind_vars
+        )
+        if not event_ids:
+            break
+        _purge_event_ids(session, event_ids)
+        session.commit()
+        progress.events += len(event_ids)
+        data_ids_batch |= data_ids
+
+    if (last_used := instance.event_data_manager.last_used) is not None:
+        # See _purge_states_and_attributes_ids_before
+        in_use = last_used.used_since(data_ids_batch, purge_before)
+        progress.in_use_from_cache += len(in_use)
+        data_ids_batch -= in_use
+        last_used.expire(purge_before)
+
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    if unused_data_ids_set := _select_unused_event_data_ids(
+        instance, session, data_ids_batch, database_engine
+    ):
+        _purge_batch_data_ids(instance, session, unused_data_ids_set)
+        session.commit()
+        progress.event_data += len(unused_data_ids_set)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
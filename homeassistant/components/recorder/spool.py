@@ -0,0 +1,282 @@
+"""On-disk spool for events that overflow the recorder queue."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from contextlib import suppress
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import (
+    JSON_DECODE_EXCEPTIONS,
+    JSON_ENCODE_EXCEPTIONS,
+    json_loads_object,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_SEGMENT_SUFFIX = ".spool"
+# Start a new segment file once the current one reaches this size
+SPOOL_SEGMENT_MAX_SIZE = 16 * 1024**2
+
+# Each record is a little endian uint32 length followed by a JSON object
+_RECORD_HEADER = struct.Struct("<I")
+
+
+def _state_to_record(state: State | None) -> dict[str, Any] | None:
+    """Convert a state to a spool record."""
+    if state is None:
+        return None
+    context = state.context
+    record: dict[str, Any] = {
+        "s": state.state,
+        "a": state.attributes,
+        "c": [context.id, context.user_id, context.parent_id],
+        "lc": state.last_changed_timestamp,
+        "lr": state.last_reported_timestamp,
+        "lu": state.last_updated_timestamp,
+    }
+    if state_info := state.state_info:
+        record["u"] = sorted(state_info["unrecorded_attributes"])
+    return record
+
+
+def _state_from_record(entity_id: str, record: dict[str, Any] | None) -> State | None:
+    """Convert a spool record to a state."""
+    if record is None:
+        return None
+    state_info: StateInfo | None = None
+    if "u" in record:
+        state_info = {"unrecorded_attributes": frozenset(record["u"])}
+    context_id, user_id, parent_id = record["c"]
+    last_updated_timestamp: float = record["lu"]
+    return State(
+        entity_id,
+        record["s"],
+        record["a"],
+        last_changed=dt_util.utc_from_timestamp(record["lc"]),
+        last_reported=dt_util.utc_from_timestamp(record["lr"]),
+        last_updated=dt_util.utc_from_timestamp(last_updated_timestamp),
+        context=Context(user_id, parent_id, context_id),
+        validate_entity_id=False,
+        state_info=state_info,
+        last_updated_timestamp=last_updated_timestamp,
+    )
+
+
+def event_to_spool_record(event: Event) -> bytes | None:
+    """Serialize an event to a spool record.
+
+    Returns None if the event data cannot be serialized, the recorder
+    would not be able to save such an event to the database anyway.
+    """
+    data: Any = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_to_record(data["old_state"]),
+            "new_state": _state_to_record(data["new_state"]),
+        }
+    context = event.context
+    try:
+        return json_bytes(
+            {
+                "e": event.event_type,
+                "d": data,
+                "o": event.origin.value,
+                "t": event.time_fired_timestamp,
+                "c": [context.id, context.user_id, context.parent_id],
+            }
+        )
+    except JSON_ENCODE_EXCEPTIONS as ex:
+        _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+        return None
+
+
+def event_from_spool_record(record: bytes) -> Event | None:
+    """Deserialize an event from a spool record."""
+    try:
+        record_dict: dict[str, Any] = json_loads_object(record)
+    except JSON_DECODE_EXCEPTIONS:
+        _LOGGER.exception("Error decoding spooled event")
+        return None
+    event_type = record_dict["e"]
+    data: Any = record_dict["d"]
+    if event_type == EVENT_STATE_CHANGED:
+        entity_id = data["entity_id"]
+        data = {
+            "entity_id": entity_id,
+            "old_state": _state_from_record(entity_id, data["old_state"]),
+            "new_state": _state_from_record(entity_id, data["new_state"]),
+        }
+    context_id, user_id, parent_id = record_dict["c"]
+    return Event(
+        event_type,
+        data,
+        EventOrigin(record_dict["o"]),
+        record_dict["t"],
+        Context(user_id, parent_id, context_id),
+    )
+
+
+class RecorderSpool:
+    """Append-only segment files holding events in the order they were fired.
+
+    Events are appended from an executor thread and read back by the
+    recorder thread. Segments are read with mmap and removed as soon as
+    they have been read completely.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # Segment numbers and sizes, oldest first
+        self._segments: deque[list[int]] = deque()
+        self._next_segment = 0
+        # Offset of the next record to read in the oldest segment
+        self._read_offset = 0
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Return the size of the segments on disk in bytes."""
+        return self._size
+
+    def _segment_path(self, number: int) -> str:
+        """Return the path of a segment."""
+        return os.path.join(self.path, f"{number:08d}{SPOOL_SEGMENT_SUFFIX}")
+
+    def load(self) -> bool:
+        """Load segments left over from a previous run.
+
+        Returns True if there are spooled events to replay.
+        """
+        with self._lock:
+            if not os.path.isdir(self.path):
+                return False
+            numbers = sorted(
+                int(number)
+                for name in os.listdir(self.path)
+                if name.endswith(SPOOL_SEGMENT_SUFFIX)
+                and (number := name.removesuffix(SPOOL_SEGMENT_SUFFIX)).isdigit()
+            )
+            for number in numbers:
+                segment_path = self._segment_path(number)
+                if size := os.path.getsize(segment_path):
+                    self._segments.append([number, size])
+                    self._size += size
+                else:
+                    os.remove(segment_path)
+            if numbers:
+                self._next_segment = numbers[-1] + 1
+            return bool(self._segments)
+
+    def append_events(self, events: Iterable[Event]) -> bool:
+        """Append events to the spool.
+
+        Returns False if the spool is full or could not be written, in
+        which case none of the events have been appended.
+        """
+        data = b"".join(
+            _RECORD_HEADER.pack(len(record)) + record
+            for event in events
+            if (record := event_to_spool_record(event)) is not None
+        )
+        if not data:
+            return True
+        with self._lock:
+            if self._size + len(data) > self.max_size:
+                return False
+            segment: list[int] | None = None
+            if self._segments and self._segments[-1][1] < SPOOL_SEGMENT_MAX_SIZE:
+                segment = self._segments[-1]
+                number, size = segment
+            else:
+                number, size = self._next_segment, 0
+            segment_path = self._segment_path(number)
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                with open(segment_path, "ab") as segment_file:
+                    segment_file.write(data)
+            except OSError as err:
+                _LOGGER.error(
+                    "Error writing to spool segment %s: %s", segment_path, err
+                )
+                # Drop anything partially written so the segment stays readable
+                with suppress(OSError):
+                    if size:
+                        os.truncate(segment_path, size)
+                    else:
+                        os.remove(segment_path)
+                return False
+            # A segment is only registered once it holds data,
+            # empty segments can't be read with mmap
+            if segment is None:
+                self._segments.append([number, len(data)])
+                self._next_segment += 1
+            else:
+                segment[1] += len(data)
+            self._size += len(data)
+        return True
+
+    def read_events(self, max_events: int) -> list[Event]:
+        """Read the next spooled events, oldest first.
+
+        Returns fewer than max_events if the end of the spool is reached.
+        """
+        records: list[bytes] = []
+        with self._lock:
+            while self._segments and len(records) < max_events:
+                number, size = self._segments[0]
+                segment_path = self._segment_path(number)
+                offset = self._read_offset
+                with (
+                    open(segment_path, "rb") as segment_file,
+                    mmap.mmap(
+                        segment_file.fileno(), size, access=mmap.ACCESS_READ
+                    ) as segment,
+                ):
+                    while offset < size and len(records) < max_events:
+                        start = offset + _RECORD_HEADER.size
+                        if (
+                            start > size
+                            or (
+                                end := start
+                                + _RECORD_HEADER.unpack_from(segment, offset)[0]
+                            )
+                            > size
+                        ):
+                            # Truncated record from an unclean shutdown
+                            _LOGGER.warning(
+                                "Skipping truncated record in %s", segment_path
+                            )
+                            offset = size
+                            break
+                        records.append(segment[start:end])
+                        offset = end
+                if offset < size:
+                    self._read_offset = offset
+                    break
+                os.remove(segment_path)
+                self._segments.popleft()
+                self._size -= size
+                self._read_offset = 0
+        return [
+            event
+            for record in records
+            if (event := event_from_spool_record(record)) is not None
+        ]
@@ -5,15 +5,29 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from lru import LRU
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -57,8 +71,12 @@ from .const import (
 )
 from .db_schema import (
     STATISTICS_TABLES,
+    MigrationChanges,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -155,6 +173,19 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_QUERY_CACHE = "recorder_statistics_query_cache"
+DATA_STATISTICS_AGGREGATES_STATUS = "recorder_statistics_aggregates_status"
+
+# Marks the daily and monthly statistics as complete in the migration_changes table
+STATISTICS_AGGREGATES_MIGRATION_ID = "statistics_aggregates"
+# Number of statistics to build the daily and monthly statistics for per task
+STATISTICS_AGGREGATES_BUILD_BATCH_SIZE = 10
+
+STATISTICS_QUERY_CACHE_SIZE = 256
+# Total number of rows kept by the statistics query cache
+STATISTICS_QUERY_CACHE_MAX_ROWS = 200_000
+# Results with more rows than this are not cached
+STATISTICS_QUERY_CACHE_MAX_RESULT_ROWS = 20_000
 
 
 def mean(values: list[float]) -> float | None:
@@ -198,6 +229,149 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+class StatisticsQueryCache:
+    """LRU cache of long term statistics query results.
+
+    Results are keyed by their metadata ids, period, window, units and types
+    and are invalidated when statistics of any of their metadata ids change.
+    Writers invalidate after committing their changes, a result which was read
+    while an invalidation happened is not cached as it may predate the commit.
+
+    The cache is bounded by the number of results and by the total number of
+    rows, results with more than max_result_rows rows are not cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = STATISTICS_QUERY_CACHE_SIZE,
+        max_rows: int = STATISTICS_QUERY_CACHE_MAX_ROWS,
+        max_result_rows: int = STATISTICS_QUERY_CACHE_MAX_RESULT_ROWS,
+    ) -> None:
+        """Initialize the statistics query cache."""
+        self._lock = threading.Lock()
+        self._results: LRU[tuple, dict[str, list[StatisticsRow]]] = LRU(
+            max_size, callback=lambda key, _: self._forget(key)
+        )
+        self._keys_by_metadata_id: dict[int, set[tuple]] = defaultdict(set)
+        self._max_rows = max_rows
+        self._max_result_rows = max_result_rows
+        self._rows_by_key: dict[tuple, int] = {}
+        self._rows = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Return a counter which changes on every invalidation."""
+        return self._generation
+
+    def _forget(self, key: tuple) -> None:
+        """Remove a result which is no longer cached from the indexes."""
+        self._rows -= self._rows_by_key.pop(key, 0)
+        for metadata_id in key[0]:
+            if keys := self._keys_by_metadata_id.get(metadata_id):
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_metadata_id[metadata_id]
+
+    def get(self, key: tuple) -> dict[str, list[StatisticsRow]] | None:
+        """Return a copy of a cached result.
+
+        The first item of the key must be a frozenset of the metadata ids.
+        """
+        with self._lock:
+            if (result := self._results.get(key)) is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _copy_statistics_result(result)
+
+    def set(
+        self, key: tuple, generation: int, result: dict[str, list[StatisticsRow]]
+    ) -> None:
+        """Cache a result read when the cache was at generation."""
+        rows = sum(len(statistic_rows) for statistic_rows in result.values())
+        if rows > self._max_result_rows:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            if key in self._results:
+                self._forget(key)
+            self._results[key] = _copy_statistics_result(result)
+            self._rows_by_key[key] = rows
+            self._rows += rows
+            for metadata_id in key[0]:
+                self._keys_by_metadata_id[metadata_id].add(key)
+            while self._rows > self._max_rows:
+                evict_key = self._results.peek_last_item()[0]
+                del self._results[evict_key]
+                self._forget(evict_key)
+
+    def invalidate(self, metadata_ids: Iterable[int]) -> None:
+        """Invalidate cached results of metadata_ids."""
+        with self._lock:
+            self._generation += 1
+            for metadata_id in metadata_ids:
+                for key in list(self._keys_by_metadata_id.get(metadata_id, ())):
+                    self._results.pop(key, None)
+                    self._forget(key)
+
+    def clear(self) -> None:
+        """Invalidate all cached results."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+            self._keys_by_metadata_id.clear()
+            self._rows_by_key.clear()
+            self._rows = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the size and hit rate of the cache."""
+        return {
+            "size": len(self._results),
+            "max_size": self._results.get_size(),
+            "rows": self._rows,
+            "max_rows": self._max_rows,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _copy_statistics_result(
+    result: dict[str, list[StatisticsRow]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return a copy of a result which callers are free to modify."""
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
+@dataclasses.dataclass(slots=True)
+class StatisticsAggregatesStatus:
+    """Status of the daily and monthly statistics tables."""
+
+    # The time zone the tables are complete for
+    time_zone: tzinfo | None = None
+    # The time zone the tables are being built for
+    building: tzinfo | None = None
+    # The next metadata_id to build the tables for
+    next_metadata_id: int = 0
+    # A StatisticsAggregatesTask is queued or running
+    pending: bool = False
+
+    def usable(self) -> bool:
+        """Return if the tables are complete for the current time zone."""
+        return self.time_zone == dt_util.get_default_time_zone()
+
+    def maintained(self) -> bool:
+        """Return if the tables are complete or being built for the time zone."""
+        time_zone = dt_util.get_default_time_zone()
+        return time_zone in (self.time_zone, self.building)
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -356,6 +530,48 @@ def get_start_time() -> datetime:
     return current_period - timedelta(minutes=5)
 
 
+def time_weighted_mean_min_max(
+    values: Sequence[float],
+    timestamps: Sequence[float],
+    offsets: Sequence[int],
+    start_ts: float,
+    end_ts: float,
+) -> tuple[list[float], list[float], list[float]]:
+    """Calculate the time weighted mean, min and max of many series at once.
+
+    The series are concatenated in values and timestamps, each series sorted
+    by time, and offsets holds the index at which each series starts. Every
+    series must contain at least one value.
+
+    A value is weighted by the duration until the next value of its series, or
+    until end_ts for the last one. Values older than start_ts count from
+    start_ts, if a series has no value at start_ts its mean is calculated from
+    its first value. The mean is 0.0 if that leaves a period of zero seconds.
+
+    NumPy is an optional dependency, ImportError is raised if it's not installed.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    vals = np.asarray(values, dtype=np.float64)
+    starts = np.asarray(offsets, dtype=np.intp)
+    ts = np.maximum(np.asarray(timestamps, dtype=np.float64), start_ts)
+    # Each value lasts until the next value of its series
+    next_ts = np.empty_like(ts)
+    next_ts[:-1] = ts[1:]
+    next_ts[starts[1:] - 1] = end_ts
+    next_ts[-1] = end_ts
+    accumulated = np.add.reduceat(vals * (next_ts - ts), starts)
+    period = end_ts - ts[starts]
+    means = np.divide(
+        accumulated, period, out=np.zeros_like(accumulated), where=period != 0
+    )
+    return (
+        means.tolist(),
+        np.minimum.reduceat(vals, starts).tolist(),
+        np.maximum.reduceat(vals, starts).tolist(),
+    )
+
+
 def _compile_hourly_statistics_summary_mean_stmt(
     start_time_ts: float, end_time_ts: float
 ) -> StatementLambdaElement:
@@ -387,12 +603,14 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(session: Session, start: datetime) -> set[int]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Returns the metadata_ids of the compiled statistics.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -442,6 +660,280 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return set(summary)
+
+
+def _reduce_to_statistics_aggregates(
+    rows: Iterable[Row],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> list[dict[str, Any]]:
+    """Reduce statistics to one row per statistic and period.
+
+    The rows must be sorted by metadata_id and start_ts and contain the columns
+    metadata_id, start_ts, mean, mean_count, min, max, last_reset_ts, state, sum.
+    """
+    created_ts = time.time()
+    aggregates: list[dict[str, Any]] = []
+    aggregate: dict[str, Any] = {}
+    period_end = 0.0
+    for (
+        metadata_id,
+        start_ts,
+        _mean,
+        mean_count,
+        _min,
+        _max,
+        last_reset_ts,
+        state,
+        _sum,
+    ) in rows:
+        if aggregate.get("metadata_id") != metadata_id or start_ts >= period_end:
+            period_start, period_end = period_start_end(start_ts)
+            aggregate = {
+                "metadata_id": metadata_id,
+                "created_ts": created_ts,
+                "start_ts": period_start,
+                "mean": 0.0,
+                "mean_count": 0,
+                "min": None,
+                "max": None,
+            }
+            aggregates.append(aggregate)
+        if _mean is not None and mean_count:
+            aggregate["mean"] += _mean * mean_count
+            aggregate["mean_count"] += mean_count
+        if _min is not None and (aggregate["min"] is None or _min < aggregate["min"]):
+            aggregate["min"] = _min
+        if _max is not None and (aggregate["max"] is None or _max > aggregate["max"]):
+            aggregate["max"] = _max
+        # The last statistics of the period provide the state and sum
+        aggregate["last_reset_ts"] = last_reset_ts
+        aggregate["state"] = state
+        aggregate["sum"] = _sum
+
+    for aggregate in aggregates:
+        if aggregate["mean_count"]:
+            aggregate["mean"] /= aggregate["mean_count"]
+        else:
+            aggregate["mean"] = aggregate["mean_count"] = None
+    return aggregates
+
+
+def _replace_statistics_aggregates(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    metadata_ids: Iterable[int],
+    start_ts: float,
+    end_ts: float,
+    aggregates: list[dict[str, Any]],
+) -> None:
+    """Replace the daily or monthly statistics of metadata_ids in a period."""
+    session.execute(
+        delete(table)
+        .where(table.metadata_id.in_(metadata_ids))
+        .where(table.start_ts >= start_ts)
+        .where(table.start_ts < end_ts)
+        .execution_options(synchronize_session=False)
+    )
+    if aggregates:
+        session.execute(insert(table), aggregates)
+
+
+def _compile_statistics_aggregates(
+    session: Session, metadata_ids: set[int], first_ts: float, last_ts: float
+) -> None:
+    """Compile daily and monthly statistics from the hourly statistics.
+
+    The days and months from the one containing first_ts until the one
+    containing last_ts are compiled in the current time zone and replace the
+    existing daily and monthly statistics of metadata_ids.
+    """
+    if not metadata_ids:
+        return
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    day_start_ts = day_start_end(first_ts)[0]
+    day_end_ts = day_start_end(last_ts)[1]
+    hourly_rows = session.execute(
+        select(
+            Statistics.metadata_id,
+            Statistics.start_ts,
+            Statistics.mean,
+            literal(1),
+            Statistics.min,
+            Statistics.max,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+        )
+        .where(Statistics.metadata_id.in_(metadata_ids))
+        .where(Statistics.start_ts >= day_start_ts)
+        .where(Statistics.start_ts < day_end_ts)
+        .order_by(Statistics.metadata_id, Statistics.start_ts)
+    )
+    _replace_statistics_aggregates(
+        session,
+        StatisticsDaily,
+        metadata_ids,
+        day_start_ts,
+        day_end_ts,
+        _reduce_to_statistics_aggregates(hourly_rows, day_start_end),
+    )
+
+    # Months are compiled from the daily statistics
+    month_start_ts = month_start_end(first_ts)[0]
+    month_end_ts = month_start_end(last_ts)[1]
+    daily_rows = session.execute(
+        select(
+            StatisticsDaily.metadata_id,
+            StatisticsDaily.start_ts,
+            StatisticsDaily.mean,
+            StatisticsDaily.mean_count,
+            StatisticsDaily.min,
+            StatisticsDaily.max,
+            StatisticsDaily.last_reset_ts,
+            StatisticsDaily.state,
+            StatisticsDaily.sum,
+        )
+        .where(StatisticsDaily.metadata_id.in_(metadata_ids))
+        .where(StatisticsDaily.start_ts >= month_start_ts)
+        .where(StatisticsDaily.start_ts < month_end_ts)
+        .order_by(StatisticsDaily.metadata_id, StatisticsDaily.start_ts)
+    )
+    _replace_statistics_aggregates(
+        session,
+        StatisticsMonthly,
+        metadata_ids,
+        month_start_ts,
+        month_end_ts,
+        _reduce_to_statistics_aggregates(daily_rows, month_start_end),
+    )
+
+
+def _update_statistics_aggregates(
+    hass: HomeAssistant,
+    session: Session,
+    metadata_ids: set[int],
+    first_ts: float,
+    last_ts: float,
+) -> None:
+    """Update the daily and monthly statistics after hourly statistics changed.
+
+    Nothing is done if the tables are not maintained for the current time
+    zone, they are rebuilt once the time zone is known to have changed.
+    """
+    if get_statistics_aggregates_status(hass).maintained():
+        session.flush()
+        _compile_statistics_aggregates(session, metadata_ids, first_ts, last_ts)
+
+
+def _statistics_aggregates_complete(session: Session, time_zone: tzinfo) -> bool:
+    """Return if the daily and monthly statistics were compiled for time_zone.
+
+    The tables must have been built and the newest monthly statistics must
+    start at midnight on the first day of a month in the time zone.
+    """
+    if not session.execute(
+        select(MigrationChanges.version).where(
+            MigrationChanges.migration_id == STATISTICS_AGGREGATES_MIGRATION_ID
+        )
+    ).first():
+        return False
+    newest_month_start_ts = session.execute(
+        select(func.max(StatisticsMonthly.start_ts))
+    ).scalar()
+    if newest_month_start_ts is None:
+        return session.execute(select(Statistics.id).limit(1)).first() is None
+    month_start = datetime.fromtimestamp(newest_month_start_ts, tz=time_zone)
+    return month_start == month_start.replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def _catch_up_statistics_aggregates(session: Session) -> None:
+    """Compile the hourly statistics since the newest daily statistics.
+
+    Hours compiled while the tables were not maintained, for example when
+    missing statistics are compiled after a restart or by an older version,
+    are added to the daily and monthly statistics.
+    """
+    if (
+        newest_day_start_ts := session.execute(
+            select(func.max(StatisticsDaily.start_ts))
+        ).scalar()
+    ) is None:
+        return
+    metadata_ids = set(
+        session.execute(
+            select(Statistics.metadata_id)
+            .where(Statistics.start_ts >= newest_day_start_ts)
+            .distinct()
+        ).scalars()
+    )
+    if not metadata_ids:
+        return
+    last_ts = session.execute(select(func.max(Statistics.start_ts))).scalar()
+    _compile_statistics_aggregates(session, metadata_ids, newest_day_start_ts, last_ts)
+
+
+@retryable_database_job("build daily and monthly statistics")
+def build_statistics_aggregates(instance: Recorder) -> bool:
+    """Build the daily and monthly statistics for the current time zone.
+
+    The tables are rebuilt from the hourly statistics if they are incomplete
+    or were compiled in another time zone, a batch of statistics at a time.
+    Returns False if there are more statistics to build the tables for.
+    """
+    status = get_statistics_aggregates_status(instance.hass)
+    time_zone = dt_util.get_default_time_zone()
+    with session_scope(session=instance.get_session()) as session:
+        if status.building != time_zone:
+            status.time_zone = None
+            if _statistics_aggregates_complete(session, time_zone):
+                _catch_up_statistics_aggregates(session)
+                status.time_zone = time_zone
+                status.building = None
+                return True
+            _LOGGER.debug("Building daily and monthly statistics for %s", time_zone)
+            session.execute(
+                delete(MigrationChanges).where(
+                    MigrationChanges.migration_id == STATISTICS_AGGREGATES_MIGRATION_ID
+                )
+            )
+            session.execute(delete(StatisticsDaily))
+            session.execute(delete(StatisticsMonthly))
+            status.building = time_zone
+            status.next_metadata_id = 0
+
+        metadata_ids = list(
+            session.execute(
+                select(StatisticsMeta.id)
+                .where(StatisticsMeta.id >= status.next_metadata_id)
+                .order_by(StatisticsMeta.id)
+                .limit(STATISTICS_AGGREGATES_BUILD_BATCH_SIZE)
+            ).scalars()
+        )
+        if metadata_ids:
+            first_ts, last_ts = session.execute(
+                select(
+                    func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+                ).where(Statistics.metadata_id.in_(metadata_ids))
+            ).one()
+            if first_ts is not None:
+                _compile_statistics_aggregates(
+                    session, set(metadata_ids), first_ts, last_ts
+                )
+            status.next_metadata_id = metadata_ids[-1] + 1
+        if len(metadata_ids) == STATISTICS_AGGREGATES_BUILD_BATCH_SIZE:
+            return False
+        session.merge(
+            MigrationChanges(migration_id=STATISTICS_AGGREGATES_MIGRATION_ID, version=1)
+        )
+
+    _LOGGER.debug("Daily and monthly statistics built for %s", time_zone)
+    status.time_zone = time_zone
+    status.building = None
+    return True
 
 
 @retryable_database_job("compile missing statistics")
@@ -455,6 +947,8 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     start = start.replace(minute=0, second=0, microsecond=0)
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
+    query_cache = get_statistics_query_cache(instance.hass)
+    invalidated_metadata_ids: set[int] = set()
 
     with session_scope(
         session=instance.get_session(),
@@ -474,14 +968,17 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             end = start + timedelta(minutes=period_size)
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
             modified_statistic_ids = _compile_statistics(
-                instance, session, start, end >= last_period
+                instance, session, start, end >= last_period, invalidated_metadata_ids
             )
             if periods_without_commit == commit_interval or modified_statistic_ids:
                 session.commit()
                 session.expunge_all()
                 periods_without_commit = 0
+                query_cache.invalidate(invalidated_metadata_ids)
+                invalidated_metadata_ids.clear()
             start = end
 
+    query_cache.invalidate(invalidated_metadata_ids)
     return True
 
 
@@ -496,6 +993,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # filter_unique_constraint_integrity_error which would make
     # modified_statistic_ids unbound.
     modified_statistic_ids: set[str] | None = None
+    invalidated_metadata_ids: set[int] = set()
 
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
@@ -505,8 +1003,9 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
         ),
     ) as session:
         modified_statistic_ids = _compile_statistics(
-            instance, session, start, fire_events
+            instance, session, start, fire_events, invalidated_metadata_ids
         )
+    get_statistics_query_cache(instance.hass).invalidate(invalidated_metadata_ids)
 
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
@@ -525,13 +1024,21 @@ def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
 
 
 def _compile_statistics(
-    instance: Recorder, session: Session, start: datetime, fire_events: bool
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    invalidated_metadata_ids: set[int],
 ) -> set[str]:
     """Compile 5-minute statistics for all integrations with a recorder platform.
 
     This is a helper function for compile_statistics and compile_missing_statistics
     that does not retry on database errors since both callers already retry.
 
+    Adds the metadata_ids of modified metadata and compiled hourly statistics to
+    invalidated_metadata_ids, the callers invalidate them in the statistics query
+    cache once the session is committed.
+
     returns a set of modified statistic_ids if any were modified.
     """
     assert start.tzinfo == dt_util.UTC, "start must be in UTC"
@@ -577,6 +1084,7 @@ def _compile_statistics(
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
+            invalidated_metadata_ids.add(metadata_id)
         updated_metadata_ids.add(metadata_id)
         if new_stat := _insert_statistics(
             session,
@@ -588,7 +1096,12 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        hourly_metadata_ids = _compile_hourly_statistics(session, start)
+        invalidated_metadata_ids |= hourly_metadata_ids
+        hour_start_ts = start.replace(minute=0).timestamp()
+        _update_statistics_aggregates(
+            instance.hass, session, hourly_metadata_ids, hour_start_ts, hour_start_ts
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -735,6 +1248,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_query_cache(instance.hass).clear()
 
 
 def update_statistics_metadata(
@@ -760,6 +1274,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_query_cache(instance.hass).clear()
 
 
 async def async_list_statistic_ids(
@@ -1686,6 +2201,56 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_query_cache_key(
+    hass: HomeAssistant,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple:
+    """Return the key of a statistics_during_period result in the query cache.
+
+    The statistics are converted to the unit of the current state, so the key
+    includes the state units next to the metadata ids.
+    """
+    state_units: list[tuple[int, str | None]] = []
+    for statistic_id, (metadata_id, stats_metadata) in metadata.items():
+        state_unit = stats_metadata["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        state_units.append((metadata_id, state_unit))
+    return (
+        frozenset(metadata_id for metadata_id, _ in state_units),
+        frozenset(state_units),
+        start_time,
+        end_time,
+        dt_util.get_default_time_zone(),
+        period,
+        frozenset(units.items()) if units else None,
+        frozenset(types),
+    )
+
+
+def _statistics_aggregates_table(
+    hass: HomeAssistant, period: str
+) -> tuple[type[StatisticsBase], Callable[[float], tuple[float, float]]] | None:
+    """Return the pre-aggregated table to read a period from, if usable.
+
+    Days and months are read from the daily and monthly statistics instead of
+    being reduced from the hourly statistics when those are up to date for the
+    configured time zone.
+    """
+    if period not in ("day", "month") or not (
+        get_statistics_aggregates_status(hass).usable()
+    ):
+        return None
+    if period == "day":
+        return StatisticsDaily, reduce_day_ts_factory()[1]
+    return StatisticsMonthly, reduce_month_ts_factory()[1]
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1753,17 +2318,35 @@ def _statistics_during_period_with_session(
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
 
+    # Long term statistics only change when they are compiled or modified,
+    # which invalidates the cached results of the modified statistics
+    query_cache: StatisticsQueryCache | None = None
+    if metadata_ids is not None and period != "5minute":
+        query_cache = get_statistics_query_cache(hass)
+        cache_key = _statistics_query_cache_key(
+            hass, metadata, start_time, end_time, period, units, _types
+        )
+        cache_generation = query_cache.generation
+        if (cached_result := query_cache.get(cache_key)) is not None:
+            return cached_result
+
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
+    query_table: type[StatisticsBase] = table
+    aggregate_start_end: Callable[[float], tuple[float, float]] | None = None
+    if aggregates := _statistics_aggregates_table(hass, period):
+        query_table, aggregate_start_end = aggregates
     stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
+        start_time, end_time, metadata_ids, query_table, types
     )
     stats = cast(
         Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
     )
 
     if not stats:
+        if query_cache is not None:
+            query_cache.set(cache_key, cache_generation, {})
         return {}
 
     result = _sorted_statistics_to_dict(
@@ -1772,18 +2355,23 @@ def _statistics_during_period_with_session(
         statistic_ids,
         metadata,
         True,
-        table,
+        query_table,
         units,
         types,
     )
 
-    if period == "day":
+    if aggregate_start_end is not None:
+        # Days and months differ in length
+        for rows in result.values():
+            for row in rows:
+                row["end"] = aggregate_start_end(row["start"])[1]
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
 
     if period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    if period == "month" and aggregate_start_end is None:
         result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
@@ -1791,6 +2379,9 @@ def _statistics_during_period_with_session(
             hass, session, start_time, units, _types, table, metadata, result
         )
 
+    if query_cache is not None:
+        query_cache.set(cache_key, cache_generation, result)
+
     # Return statistics combined with metadata
     return result
 
@@ -2309,8 +2900,11 @@ def _import_statistics_with_session(
     metadata: StatisticMetaData,
     statistics: Iterable[StatisticData],
     table: type[StatisticsBase],
-) -> bool:
-    """Import statistics to the database."""
+) -> int:
+    """Import statistics to the database.
+
+    Returns the metadata_id of the imported statistics.
+    """
     statistics_meta_manager = instance.statistics_meta_manager
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
@@ -2318,14 +2912,24 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_timestamps: list[float] = []
     for stat in statistics:
+        start_timestamps.append(stat["start"].timestamp())
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
     if table != StatisticsShortTerm:
-        return True
+        if start_timestamps:
+            _update_statistics_aggregates(
+                instance.hass,
+                session,
+                {metadata_id},
+                min(start_timestamps),
+                max(start_timestamps),
+            )
+        return metadata_id
 
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
@@ -2334,7 +2938,21 @@ def _import_statistics_with_session(
         run_cache, session, metadata_id
     )
 
-    return True
+    return metadata_id
+
+
+@singleton(DATA_STATISTICS_AGGREGATES_STATUS)
+def get_statistics_aggregates_status(
+    hass: HomeAssistant,
+) -> StatisticsAggregatesStatus:
+    """Get the status of the daily and monthly statistics."""
+    return StatisticsAggregatesStatus()
+
+
+@singleton(DATA_STATISTICS_QUERY_CACHE)
+def get_statistics_query_cache(hass: HomeAssistant) -> StatisticsQueryCache:
+    """Get the statistics query cache."""
+    return StatisticsQueryCache()
 
 
 @singleton(DATA_SHORT_TERM_STATISTICS_RUN_CACHE)
@@ -2403,16 +3021,19 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
-
+    metadata_id: int | None = None
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        metadata_id = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
+    if metadata_id is not None:
+        get_statistics_query_cache(instance.hass).invalidate((metadata_id,))
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2454,6 +3075,32 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        if get_statistics_aggregates_status(instance.hass).maintained():
+            # Adjust the days and months after the adjusted hour, and compile
+            # the day and month of the adjusted hour again
+            hour_start_ts = start_time.replace(minute=0).timestamp()
+            _, day_start_end = reduce_day_ts_factory()
+            _, month_start_end = reduce_month_ts_factory()
+            for table, period_end_ts in (
+                (StatisticsDaily, day_start_end(hour_start_ts)[1]),
+                (StatisticsMonthly, month_start_end(hour_start_ts)[1]),
+            ):
+                _adjust_sum_statistics(
+                    session,
+                    table,
+                    metadata[statistic_id][0],
+                    dt_util.utc_from_timestamp(period_end_ts),
+                    sum_adjustment,
+                )
+            _update_statistics_aggregates(
+                instance.hass,
+                session,
+                {metadata[statistic_id][0]},
+                hour_start_ts,
+                hour_start_ts,
+            )
+
+    get_statistics_query_cache(instance.hass).invalidate((metadata[statistic_id][0],))
     return True
 
 
@@ -2514,6 +3161,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -2522,6 +3171,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    get_statistics_query_cache(instance.hass).invalidate((metadata_id,))
+
 
 @callback
 def async_change_statistics_unit(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
@@ -11,6 +12,10 @@ from homeassistant.util.event_type import EventType
 if TYPE_CHECKING:
     from ..core import Recorder
 
+# The number of shared data ids to track the last use of for
+# the incremental purge, about 100 bytes of memory each
+LAST_USED_IDS_MAX_SIZE = 200_000
+
 
 class BaseTableManager[_DataT]:
     """Base class for table managers."""
@@ -74,3 +79,106 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class LastUsedIds:
+    """Track the newest timestamp each shared data id was used at.
+
+    The incremental purge uses this to skip the database scan for ids that
+    are known to be referenced by rows newer than what is being purged.
+    Ids are kept in the order they were last used so expired ids can be
+    dropped from the front. When the tracker is full the least recently used
+    ids are dropped, which only means they will be checked in the database.
+    """
+
+    __slots__ = ("_last_used", "_max_size", "_pending")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the tracker."""
+        self._last_used: dict[int, float] = {}
+        self._max_size = max_size
+        # Shared data used by rows that have not been committed yet
+        self._pending: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked ids."""
+        return len(self._last_used)
+
+    def mark(self, id_: int, timestamp: float) -> None:
+        """Mark an id as used by a row with the given timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        if (previous := last_used.pop(id_, None)) is not None and previous > timestamp:
+            timestamp = previous
+        last_used[id_] = timestamp
+        if len(last_used) > self._max_size:
+            del last_used[next(iter(last_used))]
+
+    def mark_pending(self, shared_data: str, timestamp: float) -> None:
+        """Mark shared data as used by a row that will be committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        pending = self._pending
+        if (previous := pending.get(shared_data)) is None or previous < timestamp:
+            pending[shared_data] = timestamp
+
+    def post_commit_pending(self, get_id: Callable[[str], int | None]) -> None:
+        """Mark the ids of the committed shared data as used.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for shared_data, timestamp in self._pending.items():
+            if (id_ := get_id(shared_data)) is not None:
+                self.mark(id_, timestamp)
+        self._pending.clear()
+
+    def used_since(self, ids: Iterable[int], timestamp: float) -> set[int]:
+        """Return the ids that are used by rows newer than timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        return {
+            id_
+            for id_ in ids
+            if (used := last_used.get(id_)) is not None and used >= timestamp
+        }
+
+    def expire(self, timestamp: float) -> None:
+        """Drop ids that have not been used since timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        while last_used:
+            id_ = next(iter(last_used))
+            if last_used[id_] >= timestamp:
+                break
+            del last_used[id_]
+
+    def discard(self, ids: Iterable[int]) -> None:
+        """Stop tracking ids that have been purged.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        for id_ in ids:
+            last_used.pop(id_, None)
+
+    def clear(self) -> None:
+        """Stop tracking all ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_used.clear()
+        self._pending.clear()
@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import EventData
 from ..queries import get_shared_event_datas
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import LAST_USED_IDS_MAX_SIZE, BaseLRUTableManager, LastUsedIds
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -32,6 +32,12 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # Only tracked when the incremental purge needs it
+        self.last_used = (
+            LastUsedIds(LAST_USED_IDS_MAX_SIZE)
+            if recorder.auto_purge_incremental
+            else None
+        )
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -124,6 +130,8 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
         self._pending.clear()
+        if (last_used := self.last_used) is not None:
+            last_used.post_commit_pending(self._id_map.get)
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
@@ -138,3 +146,15 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         # Evict any purged data from the cache
         for purged_data_id in data_ids.intersection(event_data_ids_reversed):
             id_map.pop(event_data_ids_reversed[purged_data_id], None)
+        if (last_used := self.last_used) is not None:
+            last_used.discard(data_ids)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        if (last_used := self.last_used) is not None:
+            last_used.clear()
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -15,9 +15,11 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import LAST_USED_IDS_MAX_SIZE, BaseLRUTableManager, LastUsedIds
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,11 +39,32 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # Only tracked when the incremental purge needs it
+        self.last_used = (
+            LastUsedIds(LAST_USED_IDS_MAX_SIZE)
+            if recorder.auto_purge_incremental
+            else None
+        )
+        # The last serialized attributes of each entity, the state machine
+        # shares the attributes object between the states of an entity
+        # as long as they do not change.
+        self._serialized: dict[
+            str, tuple[Mapping[str, Any], StateInfo | None, bytes]
+        ] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        entity_id = event.data["entity_id"]
+        if (state := event.data["new_state"]) is None:
+            self._serialized.pop(entity_id, None)
+        elif (
+            (serialized := self._serialized.get(entity_id))
+            and serialized[0] is state.attributes
+            and serialized[1] is state.state_info
+        ):
+            return serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +74,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if state is not None:
+            self._serialized[entity_id] = (
+                state.attributes,
+                state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -135,6 +165,8 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
+        if (last_used := self.last_used) is not None:
+            last_used.post_commit_pending(self._id_map.get)
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -152,3 +184,15 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+        if (last_used := self.last_used) is not None:
+            last_used.discard(attributes_ids)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        if (last_used := self.last_used) is not None:
+            last_used.clear()
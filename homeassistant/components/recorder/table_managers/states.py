@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any, NamedTuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
 
 
 class StatesManager:
@@ -45,6 +53,14 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_committed(self, entity_id: str, state_id: int) -> None:
+        """Add a committed state.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_committed_id[entity_id] = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -102,3 +118,226 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+class _PendingStatesRow(NamedTuple):
+    """A States row that has not been inserted yet."""
+
+    entity_id: str | None
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    origin_idx: int
+    context_id_bin: bytes | None
+    context_user_id_bin: bytes | None
+    context_parent_id_bin: bytes | None
+    old_state_id: int | None
+    # Index of the old state in the buffer when it is pending, otherwise -1
+    old_state_index: int
+    attributes_id: int | None
+    state_attributes: StateAttributes | None
+    metadata_id: int | None
+    states_meta: StatesMeta | None
+
+
+class StatesBulkBuffer:
+    """Buffer new States rows and insert them without the ORM.
+
+    Rows are kept as plain tuples instead of States objects which avoids
+    the cost of instrumented attributes and identity tracking in the
+    session. The rows are inserted with executemany INSERT ... RETURNING
+    statements when the event session is committed, so the database must
+    support RETURNING.
+
+    An entity can have several states in the buffer between commits, each
+    one linking to the previous one by its index. Only the index of the
+    latest buffered state of each entity is kept as pending.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._rows: list[_PendingStatesRow] = []
+        # last_reported_ts is kept outside the rows as it is updated
+        # when the next state for the entity is reported
+        self._last_reported_ts: list[float | None] = []
+        self._pending: dict[str, int] = {}
+        self._state_ids: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._rows)
+
+    def pop_pending(self, entity_id: str) -> int | None:
+        """Pop the buffer index of the latest buffered state for an entity.
+
+        The state may be in any generation of the buffer.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending.pop(entity_id, None)
+
+    def update_pending_last_reported(
+        self, index: int, last_reported_timestamp: float
+    ) -> None:
+        """Update the last reported timestamp for a pending state.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_reported_ts[index] = last_reported_timestamp
+
+    def add(
+        self,
+        event: Event[EventStateChangedData],
+        legacy_entity_id: str | None,
+        old_state_id: int | None,
+        old_state_index: int,
+        attributes_id: int | None,
+        state_attributes: StateAttributes | None,
+        metadata_id: int | None,
+        states_meta: StatesMeta | None,
+    ) -> None:
+        """Add a state_changed event to the buffer.
+
+        The caller is responsible for resolving the old state, the
+        attributes and the states meta for the event.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        state = event.data["new_state"]
+        state_value: str | None
+        # None state means the state was removed from the state machine
+        if state is None:
+            state_value = None
+            last_updated_ts = event.time_fired_timestamp
+            last_changed_ts = None
+            last_reported_ts = None
+        else:
+            state_value = state.state
+            last_updated_ts = state.last_updated_timestamp
+            if state.last_updated == state.last_changed:
+                last_changed_ts = None
+            else:
+                last_changed_ts = state.last_changed_timestamp
+            if state.last_updated == state.last_reported:
+                last_reported_ts = None
+            else:
+                last_reported_ts = state.last_reported_timestamp
+        context = event.context
+        if state is not None:
+            self._pending[event.data["entity_id"]] = len(self._rows)
+        self._rows.append(
+            _PendingStatesRow(
+                legacy_entity_id,
+                state_value,
+                last_updated_ts,
+                last_changed_ts,
+                event.origin.idx,
+                ulid_to_bytes_or_none(context.id),
+                uuid_hex_to_bytes_or_none(context.user_id),
+                ulid_to_bytes_or_none(context.parent_id),
+                old_state_id,
+                old_state_index,
+                attributes_id,
+                state_attributes,
+                metadata_id,
+                states_meta,
+            )
+        )
+        self._last_reported_ts.append(last_reported_ts)
+
+    def insert(self, session: Session) -> None:
+        """Insert the buffered rows into the session's transaction.
+
+        The session is flushed first so pending StateAttributes and
+        StatesMeta have been assigned ids. A state can only be inserted
+        once its old state has an id, so the rows are inserted in
+        generations where each generation only links to committed states
+        or to states inserted by an earlier generation. There are as many
+        generations as the most states buffered for a single entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (rows := self._rows):
+            return
+        session.flush()
+        generations: list[list[int]] = []
+        row_generations: list[int] = []
+        for index, row in enumerate(rows):
+            if (old_state_index := row.old_state_index) == -1:
+                generation = 0
+            else:
+                generation = row_generations[old_state_index] + 1
+            row_generations.append(generation)
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(index)
+
+        state_ids = [0] * len(rows)
+        last_reported_ts = self._last_reported_ts
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        for indexes in generations:
+            params: list[dict[str, Any]] = []
+            for index in indexes:
+                row = rows[index]
+                params.append(
+                    {
+                        "entity_id": row.entity_id,
+                        "state": row.state,
+                        "last_updated_ts": row.last_updated_ts,
+                        "last_changed_ts": row.last_changed_ts,
+                        "last_reported_ts": last_reported_ts[index],
+                        "origin_idx": row.origin_idx,
+                        "context_id_bin": row.context_id_bin,
+                        "context_user_id_bin": row.context_user_id_bin,
+                        "context_parent_id_bin": row.context_parent_id_bin,
+                        "old_state_id": (
+                            row.old_state_id
+                            if row.old_state_index == -1
+                            else state_ids[row.old_state_index]
+                        ),
+                        "attributes_id": (
+                            row.attributes_id
+                            if row.state_attributes is None
+                            else row.state_attributes.attributes_id
+                        ),
+                        "metadata_id": (
+                            row.metadata_id
+                            if row.states_meta is None
+                            else row.states_meta.metadata_id
+                        ),
+                    }
+                )
+            for index, state_id in zip(
+                indexes, session.execute(stmt, params).scalars(), strict=True
+            ):
+                state_ids[index] = state_id
+        self._state_ids = state_ids
+
+    def post_commit_pending(self, states_manager: StatesManager) -> None:
+        """Call after commit to load the state_id of the new states into committed.
+
+        The state_id of the latest buffered state of each entity is loaded,
+        whichever generation it was inserted in.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        state_ids = self._state_ids
+        for entity_id, index in self._pending.items():
+            states_manager.add_committed(entity_id, state_ids[index])
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._rows.clear()
+        self._last_reported_ts.clear()
+        self._pending.clear()
+        self._state_ids = []
@@ -127,6 +127,29 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class IncrementalPurgeTask(RecorderTask):
+    """Object to store information about an incremental purge task.
+
+    Each task purges a single bucket of time, the task is queued
+    every five minutes to spread the purge over the day.
+    """
+
+    purge_before: datetime
+    repack: bool
+    cleanup: bool
+
+    def run(self, instance: Recorder) -> None:
+        """Purge the oldest bucket of the database."""
+        purge.purge_old_data_incremental(
+            instance, self.purge_before, self.repack, self.cleanup
+        )
+        if self.cleanup:
+            with instance.get_session() as session:
+                instance.recorder_runs_manager.load_from_db(session)
+            periodic_db_cleanups(instance)
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -181,6 +204,19 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class StatisticsAggregatesTask(RecorderTask):
+    """An object to insert into the recorder queue to build daily and monthly statistics."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to build daily and monthly statistics."""
+        if statistics.build_statistics_aggregates(instance):
+            statistics.get_statistics_aggregates_status(instance.hass).pending = False
+            return
+        # Schedule a new statistics task if this one didn't finish
+        instance.queue_task(StatisticsAggregatesTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
@@ -291,6 +327,17 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class SpoolReplayTask(RecorderTask):
+    """Replay the next batch of spooled events."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spool()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
@@ -40,6 +40,7 @@ from .statistics import (
     async_change_statistics_unit,
     async_import_statistics,
     async_list_statistic_ids,
+    get_statistics_query_cache,
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
@@ -79,6 +80,8 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_purge_progress)
+    websocket_api.async_register_command(hass, ws_statistics_cache_info)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
@@ -475,3 +478,30 @@ def ws_import_statistics(
     else:
         async_add_external_statistics(hass, metadata, stats)
     connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command({vol.Required("type"): "recorder/purge_progress"})
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress of the incremental purge."""
+    instance = get_instance(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": instance.auto_purge and instance.auto_purge_incremental,
+            **instance.incremental_purge_progress.as_dict(),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "recorder/statistics_cache_info"}
+)
+@callback
+def ws_statistics_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the size and hit rate of the statistics query cache."""
+    connection.send_result(msg["id"], get_statistics_query_cache(hass).as_dict())
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Callable, Iterable
+from contextlib import suppress
 import datetime
 import itertools
 import logging
@@ -73,6 +74,9 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Compile mean, min and max of all sensors in one vectorized pass once there are
+# enough of them for it to be cheaper than calculating them sensor by sensor
+BATCH_COMPILE_MIN_ENTITIES = 20
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -141,6 +145,28 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _batch_mean_min_max(
+    fstates_by_entity: dict[str, list[tuple[float, State]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, tuple[float, float, float]]:
+    """Calculate the time weighted average, min and max of many sensors at once."""
+    values: list[float] = []
+    timestamps: list[float] = []
+    offsets: list[int] = []
+    for fstates in fstates_by_entity.values():
+        offsets.append(len(values))
+        for fstate, state in fstates:
+            values.append(fstate)
+            timestamps.append(state.last_updated_timestamp)
+    means, mins, maxs = statistics.time_weighted_mean_min_max(
+        values, timestamps, offsets, start.timestamp(), end.timestamp()
+    )
+    return dict(
+        zip(fstates_by_entity, zip(means, mins, maxs, strict=True), strict=True)
+    )
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -469,6 +495,17 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    batch_compiled: dict[str, tuple[float, float, float]] = {}
+    to_batch = {
+        entity_id: valid_float_states
+        for entity_id, _, _, valid_float_states in to_process
+        if wanted_statistics[entity_id] >= {"mean", "min", "max"}
+    }
+    if len(to_batch) >= BATCH_COMPILE_MIN_ENTITIES:
+        # Without NumPy the statistics are calculated sensor by sensor
+        with suppress(ImportError):
+            batch_compiled = _batch_mean_min_max(to_batch, start, end)
+
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -512,19 +549,24 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
+        if entity_id in batch_compiled:
+            stat["mean"], stat["min"], stat["max"] = batch_compiled[entity_id]
+            wanted = wanted_statistics[entity_id] - {"mean", "min", "max"}
+        else:
+            wanted = wanted_statistics[entity_id]
+        if "max" in wanted:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
             )
-        if "min" in wanted_statistics[entity_id]:
+        if "min" in wanted:
             stat["min"] = min(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
             )
 
-        if "mean" in wanted_statistics[entity_id]:
+        if "mean" in wanted:
             stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
-        if "sum" in wanted_statistics[entity_id]:
+        if "sum" in wanted:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
@@ -481,6 +481,7 @@ class TemplateEntity(Entity):
             self._handle_results,
             log_fn=log_fn,
             has_super_template=has_availability_template,
+            source=self.entity_id,
         )
         self.async_on_remove(result_info.async_remove)
         self._template_result_info = result_info
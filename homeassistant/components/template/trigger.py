@@ -152,6 +152,7 @@ async def async_attach_trigger(
         hass,
         [TrackTemplate(value_template, trigger_info["variables"])],
         template_listener,
+        source=f"{trigger_info['domain']} {trigger_info['name']}",
     )
     unsub = info.async_remove
 
@@ -16,6 +16,7 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
+from .const import ENCODING_JSON, ENCODINGS
 from .error import Disconnect
 
 if TYPE_CHECKING:
@@ -32,15 +33,26 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        # Unknown encodings are ignored so newer clients fall back to JSON
+        vol.Optional("encoding"): str,
     }
 )
 
 AUTH_OK_MESSAGE = json_bytes({"type": TYPE_AUTH_OK, "ha_version": __version__})
 AUTH_REQUIRED_MESSAGE = json_bytes(
-    {"type": TYPE_AUTH_REQUIRED, "ha_version": __version__}
+    {"type": TYPE_AUTH_REQUIRED, "ha_version": __version__, "encodings": ENCODINGS}
 )
 
 
+def auth_ok_message(encoding: str) -> bytes:
+    """Return an auth_ok message confirming the negotiated encoding."""
+    if encoding == ENCODING_JSON:
+        return AUTH_OK_MESSAGE
+    return json_bytes(
+        {"type": TYPE_AUTH_OK, "ha_version": __version__, "encoding": encoding}
+    )
+
+
 def auth_invalid_message(message: str) -> bytes:
     """Return an auth_invalid message."""
     return json_bytes({"type": TYPE_AUTH_INVALID, "message": message})
@@ -90,12 +102,14 @@ class AuthPhase:
                 refresh_token.user,
                 refresh_token,
             )
+            if (encoding := valid_msg.get("encoding")) in ENCODINGS:
+                conn.encoding = encoding
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
                     refresh_token.id, self._cancel_ws
                 )
             )
-            await self._send_bytes_text(AUTH_OK_MESSAGE)
+            await self._send_bytes_text(auth_ok_message(conn.encoding))
             self._logger.debug("Auth OK")
             process_success_login(self._request)
             return conn
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
 import logging
+from operator import attrgetter
 from typing import Any, cast
 
 import voluptuous as vol
@@ -19,6 +21,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -53,6 +56,10 @@ from homeassistant.helpers.json import (
     json_fragment,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.state_snapshot import (
+    async_get_states_encoded,
+    async_get_states_json,
+)
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -60,6 +67,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +75,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+_ENTITY_SUBSCRIPTIONS: HassKey[_EntitySubscriptions] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,6 +100,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_render_template_profile)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -315,13 +327,20 @@ def _async_get_allowed_states(
 ) -> list[State]:
     user = connection.user
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
-    entity_perm = connection.user.permissions.check_entity
-    return [
-        state
-        for state in hass.states.async_all()
-        if entity_perm(state.entity_id, POLICY_READ)
-    ]
+        states = hass.states.async_all()
+    else:
+        entity_perm = connection.user.permissions.check_entity
+        states = [
+            state
+            for state in hass.states.async_all()
+            if entity_perm(state.entity_id, POLICY_READ)
+        ]
+    if connection.compressed:
+        # Entities of the same domain share most of their attribute keys,
+        # keeping them next to each other lets deflate find the repeats
+        # within its 32 KiB window.
+        states.sort(key=attrgetter("entity_id"))
+    return states
 
 
 @callback
@@ -330,68 +349,220 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
-
-    try:
-        serialized_states = [state.as_dict_json for state in states]
-    except (ValueError, TypeError):
-        pass
-    else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
-        return
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized_states = []
-    for state in states:
-        try:
-            serialized_states.append(state.as_dict_json)
-        except (ValueError, TypeError):
-            connection.logger.error(
-                "Unable to serialize to JSON. Bad data found at %s",
-                format_unserializable_data(
-                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+    if connection.encoding == const.ENCODING_MSGPACK:
+        connection.send_message(
+            messages.msgpack_result_message(
+                msg["id"],
+                async_get_states_encoded(
+                    hass,
+                    connection.user,
+                    messages.MSGPACK_STATES_ENCODER,
+                    connection.compressed,
                 ),
             )
+        )
+        return
 
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
-
-
-def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
-) -> None:
-    """Send handle get states response."""
     connection.send_message(
         construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
+            msg["id"],
+            async_get_states_json(hass, connection.user, connection.compressed),
         )
     )
 
 
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "connection",
+        "entity_ids",
+        "entity_filter",
+        "message_id_as_bytes",
+        "pending",
+        "held",
+    )
+
+    def __init__(
+        self,
+        connection: ActiveConnection,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.connection = connection
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.message_id_as_bytes = message_id_as_bytes
+        # The state changes not sent yet and their serialized changes
+        self.pending: dict[
+            str, tuple[Event[EventStateChangedData], tuple[bytes, bytes] | None]
+        ] = {}
+        # The latest states, None if removed, held back while the
+        # connection is backlogged
+        self.held: dict[str, State | None] = {}
+
+    @callback
+    def async_allows(self, entity_id: str, allowed: dict[int, bool]) -> bool:
+        """Return if the state changes of an entity are sent.
+
+        allowed caches the permission checks of the entity by permissions.
+        """
+        if (self.entity_ids and entity_id not in self.entity_ids) or (
+            self.entity_filter and not self.entity_filter(entity_id)
+        ):
+            return False
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        user = self.connection.user
+        if user.is_admin:
+            return True
+        permissions = user.permissions
+        if (result := allowed.get(id(permissions))) is None:
+            result = allowed[id(permissions)] = permissions.access_all_entities(
+                POLICY_READ
+            ) or permissions.check_entity(entity_id, POLICY_READ)
+        return result
+
+    @callback
+    def async_flush(self) -> None:
+        """Send the pending state changes."""
+        if not (pending := self.pending):
+            return
+        self.pending = {}
+        send_message = self.connection.send_message
+        changes = [change for _, change in pending.values() if change is not None]
+        if len(changes) == len(pending):
+            send_message(
+                messages.state_diffs_message(self.message_id_as_bytes, changes)
+            )
+            return
+        for event, _ in pending.values():
+            send_message(
+                messages.cached_state_diff_message(self.message_id_as_bytes, event)
+            )
+
+    @callback
+    def async_hold(self, event: Event[EventStateChangedData]) -> None:
+        """Hold back a state change until the connection has caught up.
+
+        Only the latest state of an entity is kept, it replaces the
+        state known by the client so earlier changes are dropped.
+        """
+        entity_id = event.data["entity_id"]
+        if not self.held:
+            self.connection.async_on_drained(self.async_send_held)
+        self.pending.pop(entity_id, None)
+        self.held.pop(entity_id, None)
+        self.held[entity_id] = event.data["new_state"]
+
+    @callback
+    def async_send_held(self) -> None:
+        """Send the states held back while the connection was backlogged."""
+        if not (held := self.held):
+            return
+        self.held = {}
+        self.async_flush()
+        changes: list[tuple[bytes, bytes]] = []
+        for entity_id, state in held.items():
+            try:
+                changes.append(messages.state_replace_change(entity_id, state))
+            except (ValueError, TypeError):
+                self.connection.logger.error(
+                    "Unable to serialize to JSON. Bad data found at %s",
+                    format_unserializable_data(
+                        find_paths_unserializable_data(state, dump=JSON_DUMP)
+                    ),
+                )
+        if changes:
+            self.connection.send_message(
+                messages.state_diffs_message(self.message_id_as_bytes, changes)
+            )
+
+
+class _EntitySubscriptions:
+    """Forward state changes to the subscribe_entities subscriptions.
+
+    A single listener serves all subscriptions so the change of a state is
+    serialized and checked against each permission scope once. The changes
+    fired in the same iteration of the event loop are sent to a subscription
+    as one message, unless an entity changes more than once. While a
+    connection is backlogged only the latest state of each entity is kept
+    for it, and sent once the client has caught up.
+    """
+
+    __slots__ = ("hass", "_subscriptions", "_pending", "_flush_handle", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self.hass = hass
+        self._subscriptions: set[_EntitySubscription] = set()
+        self._pending: set[_EntitySubscription] = set()
+        self._flush_handle: asyncio.Handle | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, subscription: _EntitySubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+        self._subscriptions.add(subscription)
+        return partial(self._async_remove, subscription)
+
+    @callback
+    def _async_remove(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        self._subscriptions.discard(subscription)
+        self._pending.discard(subscription)
+        subscription.pending.clear()
+        subscription.held.clear()
+        if not self._subscriptions and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue a state change for the subscriptions allowed to see it."""
+        entity_id = event.data["entity_id"]
+        allowed: dict[int, bool] = {}
+        change: tuple[bytes, bytes] | None = None
+        serialized = False
+        for subscription in self._subscriptions:
+            if not subscription.async_allows(entity_id, allowed):
+                continue
+            if subscription.connection.backlogged:
+                subscription.async_hold(event)
+                continue
+            if not serialized:
+                change = messages.cached_state_diff_change(event)
+                serialized = True
+            if entity_id in subscription.pending:
+                # The changes of an entity are relative to its previous state
+                subscription.async_flush()
+            subscription.pending[entity_id] = (event, change)
+            self._pending.add(subscription)
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the state changes queued in this iteration of the event loop."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = set()
+        for subscription in pending:
+            subscription.async_flush()
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _async_entity_subscriptions(hass: HomeAssistant) -> _EntitySubscriptions:
+    """Return the subscribe_entities subscriptions."""
+    if (subscriptions := hass.data.get(_ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[_ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(hass)
+    return subscriptions
 
 
 @callback
@@ -415,33 +586,41 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = _async_entity_subscriptions(hass).async_add(
+        _EntitySubscription(connection, entity_ids, entity_filter, message_id_as_bytes)
     )
     connection.send_result(msg_id)
 
+    if entity_ids or entity_filter:
+        states = [
+            state
+            for state in states
+            if (not entity_ids or state.entity_id in entity_ids)
+            and (not entity_filter or entity_filter(state.entity_id))
+        ]
+
+    if connection.encoding == const.ENCODING_MSGPACK and (
+        binary_message := messages.message_to_msgpack_or_none(
+            messages.event_message(
+                msg_id,
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: state.as_compressed_state for state in states
+                    }
+                },
+            )
+        )
+    ):
+        # Only the initial states are sent as MessagePack, the changes
+        # that follow are small and reuse the cached JSON diffs.
+        connection.send_message(binary_message)
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
-        if entity_ids or entity_filter:
-            serialized_states = [
-                state.as_compressed_state_json
-                for state in states
-                if (not entity_ids or state.entity_id in entity_ids)
-                and (not entity_filter or entity_filter(state.entity_id))
-            ]
-        else:
-            # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
+        serialized_states = [state.as_compressed_state_json for state in states]
     except (ValueError, TypeError):
         pass
     else:
@@ -671,6 +850,7 @@ async def handle_render_template(
             _template_listener,
             strict=msg["strict"],
             log_fn=log_fn,
+            source=f"websocket subscription {msg['id']}",
         )
     except TemplateError as ex:
         connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
@@ -683,6 +863,38 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "render_template/profile",
+        vol.Optional("enabled"): bool,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    }
+)
+@decorators.require_admin
+def handle_render_template_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle render template profile command.
+
+    Optionally starts or stops profiling and returns the templates
+    recorded so far, the most expensive first.
+    """
+    if msg.get("enabled"):
+        template.async_start_render_profiling(hass)
+    if msg.get("enabled") is False:
+        templates = template.async_stop_render_profiling(hass)[: msg.get("limit")]
+    else:
+        templates = template.async_render_profile_report(hass, msg.get("limit"))
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": template.async_render_profiling_enabled(hass),
+            "templates": templates,
+        },
+    )
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
@@ -42,9 +42,13 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "compressed",
+        "encoding",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "backlogged",
+        "_drained_callbacks",
     )
 
     def __init__(
@@ -64,11 +68,16 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.compressed = False
+        self.encoding = const.ENCODING_JSON
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Set while the client is not reading messages as fast as they are sent
+        self.backlogged = False
+        self._drained_callbacks: list[Callable[[], None]] = []
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -123,6 +132,20 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    @callback
+    def async_on_drained(self, drained: Callable[[], None]) -> None:
+        """Call a callback once the client has caught up with the messages."""
+        self._drained_callbacks.append(drained)
+
+    @callback
+    def async_handle_drained(self) -> None:
+        """Handle the client having caught up with the messages."""
+        self.backlogged = False
+        drained_callbacks = self._drained_callbacks
+        self._drained_callbacks = []
+        for drained in drained_callbacks:
+            drained()
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -244,6 +267,7 @@ class ActiveConnection:
                     "Error unsubscribing from subscription: %s", unsub
                 )
         self.subscriptions.clear()
+        self._drained_callbacks.clear()
         self.send_message = self._connect_closed_error
         current_request.set(None)
         current_connection.set(None)
@@ -34,6 +34,16 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages from which the updates of an entity are
+# merged, instead of queued, until the client has caught up.
+PENDING_MSG_COALESCE: Final = 512
+
+# Encodings a client can ask for in the auth message, large results are
+# sent as binary frames when MessagePack has been negotiated.
+ENCODING_JSON: Final = "json"
+ENCODING_MSGPACK: Final = "msgpack"
+ENCODINGS: Final = (ENCODING_JSON, ENCODING_MSGPACK)
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
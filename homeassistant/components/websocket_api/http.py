@@ -24,7 +24,9 @@ from homeassistant.util.json import json_loads
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
+    ENCODING_JSON,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -33,7 +35,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import BinaryMessage, message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -128,6 +130,7 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -138,10 +141,15 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        can_send_binary = connection.encoding != ENCODING_JSON
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
+                if not message_queue and connection.backlogged:
+                    # Send the entity updates merged while the client was slow
+                    connection.async_handle_drained()
+
                 if not message_queue:
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
@@ -157,7 +165,18 @@ class WebSocketHandler:
                     message = message_queue.popleft()
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if type(message) is BinaryMessage:
+                        await send_bytes_binary(message)
+                    else:
+                        await send_bytes_text(message)
+                    continue
+
+                if can_send_binary and any(
+                    type(message) is BinaryMessage for message in message_queue
+                ):
+                    # Binary frames cannot be coalesced into a JSON array,
+                    # send the ready messages one by one instead
+                    ready_message_count = 1
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
@@ -217,6 +236,12 @@ class WebSocketHandler:
             self._cancel()
             return
 
+        if (
+            queue_size_after_add >= PENDING_MSG_COALESCE
+            and (connection := self._connection) is not None
+        ):
+            connection.backlogged = True
+
         if self._release_ready_queue_size == 0:
             # Try to coalesce more messages to reduce the number of writes
             self._release_ready_queue_size = queue_size_after_add
@@ -329,6 +354,7 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send, binary=False)
+        send_bytes_binary = partial(writer.send, binary=True)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -336,7 +362,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection, send_bytes_text)
         except asyncio.CancelledError:
@@ -371,6 +399,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -401,7 +430,12 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        # permessage-deflate is negotiated by aiohttp when the client offers
+        # it, frames larger than a few KiB are compressed in the executor.
+        connection.compressed = bool(self._wsock.compress)
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
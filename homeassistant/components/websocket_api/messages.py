@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
-from typing import Any, Final
+from typing import Any, Final, cast
 
+import ormsgpack
 import voluptuous as vol
 
 from homeassistant.const import (
@@ -15,13 +17,15 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
     find_paths_unserializable_data,
     json_bytes,
+    json_encoder_default,
 )
+from homeassistant.helpers.state_snapshot import StatesEncoder
 from homeassistant.util.json import format_unserializable_data
 
 from . import const
@@ -44,6 +48,16 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+_ENTITY_EVENT_ADD_BYTES = ENTITY_EVENT_ADD.encode()
+_ENTITY_EVENT_REMOVE_BYTES = ENTITY_EVENT_REMOVE.encode()
+
+
+class BinaryMessage(bytes):
+    """A serialized message sent to the client in a binary frame."""
+
+    __slots__ = ()
+
+
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
     "success": False,
@@ -177,6 +191,65 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+@lru_cache(maxsize=128)
+def cached_state_diff_change(
+    event: Event[EventStateChangedData],
+) -> tuple[bytes, bytes] | None:
+    """Return the kind and the JSON of the change in a state diff message.
+
+    The change can be joined with the changes of other entities into one
+    message by state_diffs_message. Returns None if the event cannot be
+    serialized.
+    """
+    kind, change = next(iter(_state_diff_event(event).items()))
+    if kind == ENTITY_EVENT_REMOVE:
+        # {"r": [entity_id]}
+        return _ENTITY_EVENT_REMOVE_BYTES, json_bytes(event.data["entity_id"])
+    # {"a": {entity_id: compressed_state}} or {"c": {entity_id: diff}}
+    if (
+        change_json := _message_to_json_bytes_or_none(cast(dict[str, Any], change))
+    ) is None:
+        return None
+    # Strip the braces to keep the entity_id key value pair
+    return kind.encode(), change_json[1:-1]
+
+
+def state_replace_change(entity_id: str, state: State | None) -> tuple[bytes, bytes]:
+    """Return the kind and the JSON of a change replacing the state of an entity.
+
+    Raises ValueError or TypeError if the state cannot be serialized.
+    """
+    if state is None:
+        return _ENTITY_EVENT_REMOVE_BYTES, json_bytes(entity_id)
+    return _ENTITY_EVENT_ADD_BYTES, state.as_compressed_state_json
+
+
+def state_diffs_message(
+    message_id_as_bytes: bytes, changes: Iterable[tuple[bytes, bytes]]
+) -> bytes:
+    """Return an event message with the changes of several state changed events.
+
+    The changes must be those of different entities.
+    """
+    changes_by_kind: dict[bytes, list[bytes]] = {}
+    for kind, change in changes:
+        changes_by_kind.setdefault(kind, []).append(change)
+    return b"".join(
+        (
+            b'{"id":',
+            message_id_as_bytes,
+            b',"type":"event","event":{',
+            b",".join(
+                b"".join((b'"', kind, b'":[', b",".join(kind_changes), b"]"))
+                if kind == _ENTITY_EVENT_REMOVE_BYTES
+                else b"".join((b'"', kind, b'":{', b",".join(kind_changes), b"}"))
+                for kind, kind_changes in changes_by_kind.items()
+            ),
+            b"}}",
+        )
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -259,3 +332,62 @@ def message_to_json_bytes(message: dict[str, Any]) -> bytes:
             message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
         )
     )
+
+
+def message_to_msgpack_or_none(message: dict[str, Any]) -> BinaryMessage | None:
+    """Serialize a websocket message to MessagePack or return None.
+
+    Callers fall back to JSON, which logs where the bad data is found.
+    """
+    try:
+        return BinaryMessage(
+            ormsgpack.packb(
+                message,
+                default=json_encoder_default,
+                option=ormsgpack.OPT_NON_STR_KEYS,
+            )
+        )
+    except TypeError:
+        return None
+
+
+def msgpack_result_message(iden: int, payload: bytes) -> BinaryMessage:
+    """Construct a success result message MessagePack from a packed payload."""
+    # The result is the last key of the map, strip its packed nil
+    return BinaryMessage(
+        ormsgpack.packb(
+            {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": None}
+        )[:-1]
+        + payload
+    )
+
+
+class MsgpackStatesEncoder(StatesEncoder):
+    """Serialize the states of a snapshot as a MessagePack array."""
+
+    __slots__ = ()
+
+    def serialize(self, state: State) -> bytes | None:
+        """Serialize a state or return None if it cannot be serialized."""
+        try:
+            return ormsgpack.packb(
+                state.as_dict(),
+                default=json_encoder_default,
+                option=ormsgpack.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            _LOGGER.error("Unable to serialize %s to MessagePack", state.entity_id)
+            return None
+
+    def join(self, serialized: list[bytes]) -> bytes:
+        """Join the serialized states into an array."""
+        if (length := len(serialized)) < 16:
+            header = bytes((0x90 | length,))
+        elif length < 0x10000:
+            header = b"\xdc" + length.to_bytes(2, "big")
+        else:
+            header = b"\xdd" + length.to_bytes(4, "big")
+        return b"".join((header, *serialized))
+
+
+MSGPACK_STATES_ENCODER = MsgpackStatesEncoder()
@@ -10,11 +10,13 @@ from dataclasses import dataclass
 from enum import StrEnum
 from functools import partial, reduce
 import logging
+import math
 import operator
 import os
 from pathlib import Path
 import re
 import shutil
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -65,16 +67,27 @@ from .exceptions import ConfigValidationError, HomeAssistantError
 from .generated.currencies import HISTORIC_CURRENCIES
 from .helpers import config_validation as cv, issue_registry as ir
 from .helpers.entity_values import EntityValues
+from .helpers.json import json_bytes
+from .helpers.storage import STORAGE_DIR
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.async_ import create_eager_task
+from .util.file import WriteError, write_utf8_file
 from .util.hass_dict import HassKey
+from .util.json import json_loads
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
-from .util.yaml.objects import NodeStrClass
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlDependencies,
+    YamlTypeError,
+    load_yaml_dict,
+    track_dependencies,
+)
+from .util.yaml.objects import NodeDictClass, NodeListClass, NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,6 +95,7 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+CONFIG_CACHE_FILE = "core.config_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 
@@ -441,22 +455,34 @@ def _write_default_config(config_dir: str) -> bool:
     return True
 
 
-async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
+async def async_hass_config_yaml(hass: HomeAssistant, cache: bool = False) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
     This function allows a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
+
+    If cache is set, the parsed YAML is loaded from and stored in the
+    config cache.
     """
     secrets = Secrets(Path(hass.config.config_dir))
 
     # Not using async_add_executor_job because this is an internal method.
     try:
-        config = await hass.loop.run_in_executor(
-            None,
-            load_yaml_config_file,
-            hass.config.path(YAML_CONFIG_FILE),
-            secrets,
-        )
+        if cache:
+            config = await hass.loop.run_in_executor(
+                None,
+                load_cached_yaml_config_file,
+                hass.config.path(YAML_CONFIG_FILE),
+                hass.config.path(STORAGE_DIR, CONFIG_CACHE_FILE),
+                secrets,
+            )
+        else:
+            config = await hass.loop.run_in_executor(
+                None,
+                load_yaml_config_file,
+                hass.config.path(YAML_CONFIG_FILE),
+                secrets,
+            )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
             raise
@@ -523,6 +549,119 @@ def load_yaml_config_file(
     return conf_dict
 
 
+def load_cached_yaml_config_file(
+    config_path: str, cache_path: str, secrets: Secrets | None = None
+) -> dict[Any, Any]:
+    """Parse a YAML configuration file, using the config cache if it is valid.
+
+    The cache holds the parsed YAML with includes and secrets resolved, it is
+    valid as long as none of the files, directories and environment variables
+    it was loaded from changed and Home Assistant was not updated.
+
+    Raises FileNotFoundError or HomeAssistantError.
+
+    This method needs to run in an executor.
+    """
+    start = time.monotonic()
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cache = json_loads(cache_file.read())
+        dependencies = YamlDependencies(cache["paths"], cache["env"])
+        if cache["version"] == __version__ and not dependencies.changed():
+            config = _decode_config_node(cache["config"])
+            load_time = time.monotonic() - start
+            _LOGGER.info(
+                "Loaded configuration from cache in %.3f seconds, saving %.3f seconds",
+                load_time,
+                cache["parse_time"] - load_time,
+            )
+            return config  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        pass
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Ignoring unreadable config cache %s", cache_path, exc_info=True)
+
+    start = time.monotonic()
+    with track_dependencies() as dependencies:
+        config = load_yaml_config_file(config_path, secrets)
+    parse_time = time.monotonic() - start
+
+    try:
+        cache_data = json_bytes(
+            {
+                "version": __version__,
+                "parse_time": parse_time,
+                "paths": dependencies.paths,
+                "env": dependencies.env,
+                "config": _encode_config_node(config),
+            }
+        )
+    except TypeError as err:
+        _LOGGER.debug("Unable to cache the configuration: %s", err)
+        return config
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # The cache contains resolved secrets, only the owner can read it
+        write_utf8_file(cache_path, cache_data, private=True, mode="wb")
+    except (OSError, WriteError):
+        pass
+    return config
+
+
+def _encode_config_node(node: Any) -> Any:
+    """Encode parsed YAML as JSON, keeping the file and line of the nodes.
+
+    Strings, lists and dicts are encoded as objects tagged with "s", "a"
+    and "d" so the file and line they were loaded from can be stored next
+    to them. Raises TypeError for values JSON cannot represent.
+    """
+    if node is None or type(node) in (bool, int, str):
+        return node
+    if type(node) is float:
+        if not math.isfinite(node):
+            raise TypeError(f"Unable to cache float {node}")
+        return node
+    encoded: dict[str, Any]
+    if isinstance(node, str):
+        encoded = {"s": str(node)}
+    elif isinstance(node, dict):
+        encoded = {
+            "d": [
+                [_encode_config_node(key), _encode_config_node(value)]
+                for key, value in node.items()
+            ]
+        }
+    elif isinstance(node, list):
+        encoded = {"a": [_encode_config_node(item) for item in node]}
+    else:
+        raise TypeError(f"Unable to cache {type(node).__name__}")
+    if (config_file := getattr(node, "__config_file__", None)) is not None:
+        encoded["f"] = config_file
+        encoded["l"] = getattr(node, "__line__", None)
+    return encoded
+
+
+def _decode_config_node(encoded: Any) -> Any:
+    """Decode parsed YAML encoded by _encode_config_node."""
+    if not isinstance(encoded, dict):
+        return encoded
+    node: NodeStrClass | NodeDictClass | NodeListClass
+    if "s" in encoded:
+        node = NodeStrClass(encoded["s"])
+    elif "d" in encoded:
+        node = NodeDictClass(
+            (_decode_config_node(key), _decode_config_node(value))
+            for key, value in encoded["d"]
+        )
+    else:
+        node = NodeListClass(_decode_config_node(item) for item in encoded["a"])
+    if "f" in encoded:
+        node.__config_file__ = encoded["f"]
+        node.__line__ = encoded["l"]
+    return node
+
+
 def process_ha_config_upgrade(hass: HomeAssistant) -> None:
     """Upgrade configuration if necessary.
 
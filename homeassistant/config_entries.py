@@ -57,6 +57,7 @@ from .helpers.event import (
 )
 from .helpers.frame import report
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_trace import SPAN_FORWARD, async_trace_setup
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
 from .loader import async_suggest_report_issue
 from .setup import (
@@ -2185,7 +2186,10 @@ class ConfigEntries:
                     await integration.async_get_platform(domain)
 
         integration = loader.async_get_loaded_integration(self.hass, domain)
-        await entry.async_setup(self.hass, integration=integration)
+        with async_trace_setup(
+            self.hass, f"{SPAN_FORWARD} {domain}", entry.domain, entry.entry_id
+        ):
+            await entry.async_setup(self.hass, integration=integration)
         return True
 
     async def async_unload_platforms(
@@ -1405,6 +1405,33 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+# Keyed listeners, indexed by event data key name and then by key value
+_KeyedListenersType = dict[str, dict[str, list[_FilterableJobType[Any]]]]
+
+
+@dataclass(slots=True)
+class _EventDispatchStats:
+    """Dispatch timing counters for an event type."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        """Record a dispatch."""
+        self.count += 1
+        self.total += elapsed
+        self.max = max(elapsed, self.max)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else 0.0,
+        }
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1434,6 +1461,25 @@ class _OneTimeListener(Generic[_DataT]):
 EMPTY_LIST: list[Any] = []
 
 
+def _keyed_listeners_for_event(
+    keyed_listeners: _KeyedListenersType, event_data: Mapping[str, Any]
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listeners matching the event data.
+
+    A listener keyed on ``domain`` also matches events that only carry
+    an ``entity_id``, such as state_changed events.
+    """
+    matched: list[_FilterableJobType[Any]] = []
+    for key_name, listeners_by_key in keyed_listeners.items():
+        key = event_data.get(key_name)
+        if key is None and key_name == "domain":
+            if type(entity_id := event_data.get("entity_id")) is str:
+                key = entity_id.partition(".")[0]
+        if type(key) is str and (key_listeners := listeners_by_key.get(key)):
+            matched.extend(key_listeners)
+    return matched
+
+
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1444,15 +1490,26 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch_stats",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._keyed_listeners: dict[EventType[Any] | str, _KeyedListenersType] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._dispatch_stats: (
+            defaultdict[EventType[Any] | str, _EventDispatchStats] | None
+        ) = None
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1468,13 +1525,50 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(jobs) for key, jobs in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            # A keyed listener is indexed once per key it listens for
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {
+                    id(filterable_job)
+                    for listeners_by_key in keyed_listeners.values()
+                    for key_listeners in listeners_by_key.values()
+                    for filterable_job in key_listeners
+                }
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners."""
         return run_callback_threadsafe(self._hass.loop, self.async_listeners).result()
 
+    @callback
+    def async_set_dispatch_stats(self, enabled: bool) -> None:
+        """Enable or disable collecting per event type dispatch timings.
+
+        Enabling resets any previously collected timings.
+
+        This method must be run in the event loop.
+        """
+        self._dispatch_stats = defaultdict(_EventDispatchStats) if enabled else None
+
+    @callback
+    def async_dispatch_stats(self) -> dict[EventType[Any] | str, dict[str, float]]:
+        """Return the dispatch timings per event type.
+
+        Timings are in seconds and only cover the time spent filtering and
+        running or scheduling listeners in async_fire_internal.
+
+        This method must be run in the event loop.
+        """
+        if self._dispatch_stats is None:
+            return {}
+        return {
+            event_type: stats.as_dict()
+            for event_type, stats in self._dispatch_stats.items()
+        }
+
     def fire(
         self,
         event_type: EventType[_DataT] | str,
@@ -1533,7 +1627,18 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
+        if (dispatch_stats := self._dispatch_stats) is not None:
+            start = time.perf_counter()
+
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            # One dict lookup per key name instead of calling every filter,
+            # keyed listeners are called after the unkeyed ones
+            listeners = listeners + _keyed_listeners_for_event(
+                keyed_listeners, event_data
+            )
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1563,6 +1668,9 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if dispatch_stats is not None:
+            dispatch_stats[event_type].record(time.perf_counter() - start)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1631,11 +1739,43 @@ class EventBus:
         self,
         event_type: EventType[_DataT] | str,
         filterable_job: _FilterableJobType[_DataT],
+        event_key: tuple[str, str | Iterable[str]] | None = None,
     ) -> CALLBACK_TYPE:
-        """Listen for all events or events of a specific type."""
-        self._listeners[event_type].append(filterable_job)
+        """Listen for all events or events of a specific type.
+
+        An optional event_key of (key name, key values) indexes the listener
+        so it is only considered for events where the event data value for
+        the key name, for example ``entity_id`` or ``device_id``, is one of
+        the key values. The key name ``domain`` also matches the domain of
+        the ``entity_id`` in the event data. Any event_filter in the
+        filterable job still runs for matching events.
+
+        Keyed listeners of an event type are called after all of its
+        unkeyed listeners, regardless of the order they were registered in.
+        """
+        if event_key is None:
+            self._listeners[event_type].append(filterable_job)
+            return functools.partial(
+                self._async_remove_listener, event_type, filterable_job
+            )
+
+        key_name, keys = event_key
+        # Deduplicate so the job runs at most once per event
+        keys = (keys,) if isinstance(keys, str) else tuple(dict.fromkeys(keys))
+        listeners_by_key = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            key_name, {}
+        )
+        for key in keys:
+            if key_listeners := listeners_by_key.get(key):
+                key_listeners.append(filterable_job)
+            else:
+                listeners_by_key[key] = [filterable_job]
         return functools.partial(
-            self._async_remove_listener, event_type, filterable_job
+            self._async_remove_keyed_listener,
+            event_type,
+            key_name,
+            keys,
+            filterable_job,
         )
 
     def listen_once(
@@ -1726,6 +1866,39 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_name: str,
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            listeners_by_key = keyed_listeners[key_name]
+            for key in keys:
+                key_listeners = listeners_by_key[key]
+                key_listeners.remove(filterable_job)
+                if not key_listeners:
+                    del listeners_by_key[key]
+        except (KeyError, ValueError):
+            # KeyError is key event_type, key name or key did not exist
+            # ValueError if listener did not exist within the key
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        if not listeners_by_key:
+            del keyed_listeners[key_name]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1878,10 +2051,21 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @cached_property
+    def attributes_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes.
+
+        The fragment is shared with the next state of the entity
+        when its attributes did not change.
+        """
+        return json_fragment(json_bytes(self.attributes))
+
     @cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        as_dict = self._as_dict.copy()
+        as_dict["attributes"] = self.attributes_json_fragment
+        return json_bytes(as_dict)
 
     @cached_property
     def json_fragment(self) -> json_fragment:
@@ -1924,7 +2108,11 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state: dict[str, Any] = {
+            **self.as_compressed_state,
+            COMPRESSED_STATE_ATTRIBUTES: self.attributes_json_fragment,
+        }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2342,6 +2530,17 @@ class StateMachine:
             timestamp,
         )
         if old_state is not None:
+            if (
+                same_attr
+                and (
+                    attributes_json_fragment := old_state.__dict__.get(
+                        "attributes_json_fragment"
+                    )
+                )
+                is not None
+            ):
+                # The attributes are shared with the old state, so is their JSON
+                state.__dict__["attributes_json_fragment"] = attributes_json_fragment
             old_state.expire()
         self._states[entity_id] = state
         state_changed_data: EventStateChangedData = {
@@ -27,14 +27,12 @@ from homeassistant.core import (
     Event,
     # Explicit reexport of 'EventStateChangedData' for backwards compatibility
     EventStateChangedData as EventStateChangedData,  # noqa: PLC0414
-    EventStateEventData,
     EventStateReportedData,
     HassJob,
     HassJobType,
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
@@ -54,27 +52,22 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import (
+    RenderInfo,
+    StatesAggregate,
+    Template,
+    async_states_aggregate,
+    result_as_boolean,
+    template_render_source_cv,
+)
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
 _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventEntityRegistryUpdatedData]
 ] = HassKey("track_entity_registry_updated_data")
-_TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventDeviceRegistryUpdatedData]
-] = HassKey("track_device_registry_updated_data")
+_TRACK_TEMPLATE_SCHEDULER: HassKey[_TemplateScheduler] = HassKey(
+    "track_template_scheduler"
+)
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -90,7 +83,6 @@ RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
-_StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
 
 @dataclass(slots=True, frozen=True)
@@ -117,6 +109,17 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
     ]
 
 
+@dataclass(slots=True, frozen=True)
+class _BusKeyedEventTracker(Generic[_TypedDictT]):
+    """Class to track events by a key indexed by the event bus."""
+
+    event_type: EventType[_TypedDictT] | str
+    key_name: str
+    event_filter: Callable[[_TypedDictT], bool] | None = None
+    dispatch_soon: bool = False
+    match_all: bool = False
+
+
 @dataclass(slots=True, frozen=True)
 class _KeyedEventData(Generic[_TypedDictT]):
     """Class to track data for events by key."""
@@ -328,51 +331,11 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
-@callback
-def _async_dispatch_entity_id_event_soon(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
+_KEYED_TRACK_STATE_CHANGE = _BusKeyedEventTracker[EventStateChangedData](
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    key_name="entity_id",
+    # Dispatch soon to ensure one event loop runs before dispatch
+    dispatch_soon=True,
 )
 
 
@@ -384,16 +347,13 @@ def _async_track_state_change_event(
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
+    return _async_track_bus_keyed_event(
         _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
     )
 
 
-_KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
-    event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+_KEYED_TRACK_STATE_REPORT = _BusKeyedEventTracker[EventStateReportedData](
+    event_type=EVENT_STATE_REPORTED, key_name="entity_id"
 )
 
 
@@ -404,7 +364,7 @@ def async_track_state_report_event(
     job_type: HassJobType | None = None,
 ) -> CALLBACK_TYPE:
     """Track EVENT_STATE_REPORTED by entity_id without lowercasing."""
-    return _async_track_event(
+    return _async_track_bus_keyed_event(
         _KEYED_TRACK_STATE_REPORT, hass, entity_ids, action, job_type
     )
 
@@ -480,6 +440,118 @@ def _async_track_event(
     return partial(_remove_listener, hass, tracker, keys, job, callbacks)
 
 
+@callback
+def _async_run_tracked_job(
+    hass: HomeAssistant,
+    job: HassJob[[Event[_TypedDictT]], Any],
+    event: Event[_TypedDictT],
+) -> None:
+    """Run a tracked job and log any exception."""
+    try:
+        hass.async_run_hass_job(job, event)
+    except Exception:
+        _LOGGER.exception("Error while dispatching event %s to %s", event, job)
+
+
+@dataclass(slots=True)
+class _TrackedJobSoon(Generic[_TypedDictT]):
+    """A tracked job run soon to ensure one event loop runs before dispatch.
+
+    The listener can be removed before the job runs, so it is checked
+    again when the job is dispatched.
+    """
+
+    hass: HomeAssistant
+    job: HassJob[[Event[_TypedDictT]], Any]
+    registered: bool = True
+
+    @callback
+    def async_schedule(self, event: Event[_TypedDictT]) -> None:
+        """Schedule the job to run soon."""
+        self.hass.loop.call_soon(self._async_dispatch, event)
+
+    @callback
+    def _async_dispatch(self, event: Event[_TypedDictT]) -> None:
+        """Run the job if the listener is still registered."""
+        if self.registered:
+            _async_run_tracked_job(self.hass, self.job, event)
+
+    @callback
+    def async_remove(self, remove: CALLBACK_TYPE) -> None:
+        """Remove the listener and skip any scheduled run."""
+        self.registered = False
+        remove()
+
+
+@callback
+def _remove_listeners(listeners: list[CALLBACK_TYPE]) -> None:
+    """Remove listeners."""
+    for listener in listeners:
+        listener()
+
+
+# tracker, not hass is intentionally the first argument here since its
+# constant and may be used in a partial in the future
+def _async_track_bus_keyed_event(
+    tracker: _BusKeyedEventTracker[_TypedDictT],
+    hass: HomeAssistant,
+    keys: str | Iterable[str],
+    action: Callable[[Event[_TypedDictT]], Any],
+    job_type: HassJobType | None,
+) -> CALLBACK_TYPE:
+    """Track an event by a specific key using the keyed listeners of the bus.
+
+    The bus looks the listener up by the value of the tracker key name in
+    the event data, so no filter runs for events of other keys. If the
+    tracker allows it, a MATCH_ALL key is registered as a regular listener
+    of the event type.
+
+    This function is intended for internal use only.
+    """
+    if not keys:
+        return _remove_empty_listener
+
+    job: HassJob[[Event[_TypedDictT]], Any] = HassJob(
+        action, f"track {tracker.event_type} event {keys}", job_type=job_type
+    )
+    tracked_soon: _TrackedJobSoon[_TypedDictT] | None = None
+    if tracker.dispatch_soon:
+        tracked_soon = _TrackedJobSoon(hass, job)
+        job = HassJob(
+            tracked_soon.async_schedule, job.name, job_type=HassJobType.Callback
+        )
+    filterable_job = (job, tracker.event_filter)
+    bus = hass.bus
+    remove: CALLBACK_TYPE
+    if not tracker.match_all or (isinstance(keys, str) and keys != MATCH_ALL):
+        # Almost all calls to this function use a single key
+        remove = bus._async_listen_filterable_job(  # noqa: SLF001
+            tracker.event_type, filterable_job, (tracker.key_name, keys)
+        )
+    else:
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        removes: list[CALLBACK_TYPE] = []
+        if MATCH_ALL in keys:
+            keys = [key for key in keys if key != MATCH_ALL]
+            removes.append(
+                bus._async_listen_filterable_job(  # noqa: SLF001
+                    tracker.event_type, filterable_job
+                )
+            )
+        if keys:
+            removes.append(
+                bus._async_listen_filterable_job(  # noqa: SLF001
+                    tracker.event_type, filterable_job, (tracker.key_name, keys)
+                )
+            )
+        remove = (
+            removes[0] if len(removes) == 1 else partial(_remove_listeners, removes)
+        )
+    if tracked_soon is not None:
+        return partial(tracked_soon.async_remove, remove)
+    return remove
+
+
 @callback
 def _async_dispatch_old_entity_id_or_entity_id_event(
     hass: HomeAssistant,
@@ -541,42 +613,9 @@ def async_track_entity_registry_updated_event(
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
-
-
-_KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
-    event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
-)
+_KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _BusKeyedEventTracker[
+    EventDeviceRegistryUpdatedData
+](event_type=EVENT_DEVICE_REGISTRY_UPDATED, key_name="device_id")
 
 
 @callback
@@ -590,42 +629,15 @@ def async_track_device_registry_updated_event(
 
     Similar to async_track_entity_registry_updated_event.
     """
-    return _async_track_event(
+    return _async_track_bus_keyed_event(
         _KEYED_TRACK_DEVICE_REGISTRY_UPDATED, hass, device_ids, action, job_type
     )
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes to entities being added."""
+    return event_data["old_state"] is None
 
 
 @bind_hass
@@ -641,11 +653,11 @@ def async_track_state_added_domain(
     return _async_track_state_added_domain(hass, domains, action, job_type)
 
 
-_KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
+_KEYED_TRACK_STATE_ADDED_DOMAIN = _BusKeyedEventTracker[EventStateChangedData](
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
+    key_name="domain",
+    event_filter=_async_domain_added_filter,
+    match_all=True,
 )
 
 
@@ -657,32 +669,22 @@ def _async_track_state_added_domain(
     job_type: HassJobType | None,
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is added to domains."""
-    return _async_track_event(
+    return _async_track_bus_keyed_event(
         _KEYED_TRACK_STATE_ADDED_DOMAIN, hass, domains, action, job_type
     )
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changes to entities being removed."""
+    return event_data["new_state"] is None
 
 
-_KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
+_KEYED_TRACK_STATE_REMOVED_DOMAIN = _BusKeyedEventTracker[EventStateChangedData](
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+    key_name="domain",
+    event_filter=_async_domain_removed_filter,
+    match_all=True,
 )
 
 
@@ -694,7 +696,7 @@ def async_track_state_removed_domain(
     job_type: HassJobType | None = None,
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is removed from domains."""
-    return _async_track_event(
+    return _async_track_bus_keyed_event(
         _KEYED_TRACK_STATE_REMOVED_DOMAIN, hass, domains, action, job_type
     )
 
@@ -962,6 +964,139 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateScheduler:
+    """Schedule the re-renders of all tracked templates.
+
+    A reverse index from entity ids and domains to the trackers depending
+    on them means a state change only looks at the trackers it affects.
+    Re-renders are coalesced until the next iteration of the event loop,
+    so each tracker renders its templates at most once per iteration no
+    matter how many of the states it depends on have changed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._track_states: dict[TrackTemplateResultInfo, TrackStates] = {}
+        self._by_entity: defaultdict[str, set[TrackTemplateResultInfo]] = defaultdict(
+            set
+        )
+        self._by_domain: defaultdict[str, set[TrackTemplateResultInfo]] = defaultdict(
+            set
+        )
+        self._all: set[TrackTemplateResultInfo] = set()
+        self._pending: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self, tracker: TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Start scheduling re-renders of a tracker."""
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+        self._index(tracker, track_states)
+
+    @callback
+    def async_update(
+        self, tracker: TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Update the states a tracker depends on."""
+        if self._track_states.get(tracker) == track_states:
+            return
+        self._unindex(tracker)
+        self._index(tracker, track_states)
+
+    @callback
+    def async_remove(self, tracker: TrackTemplateResultInfo) -> None:
+        """Stop scheduling re-renders of a tracker."""
+        self._unindex(tracker)
+        self._pending.pop(tracker, None)
+        if self._track_states or self._unsub is None:
+            return
+        self._unsub()
+        self._unsub = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    @callback
+    def _index(
+        self, tracker: TrackTemplateResultInfo, track_states: TrackStates
+    ) -> None:
+        """Add a tracker to the reverse index."""
+        self._track_states[tracker] = track_states
+        if track_states.all_states:
+            self._all.add(tracker)
+            return
+        for entity_id in track_states.entities:
+            self._by_entity[entity_id].add(tracker)
+        for domain in track_states.domains:
+            self._by_domain[domain].add(tracker)
+
+    @callback
+    def _unindex(self, tracker: TrackTemplateResultInfo) -> None:
+        """Remove a tracker from the reverse index."""
+        if (track_states := self._track_states.pop(tracker, None)) is None:
+            return
+        if track_states.all_states:
+            self._all.discard(tracker)
+            return
+        for key, index in (
+            (track_states.entities, self._by_entity),
+            (track_states.domains, self._by_domain),
+        ):
+            for value in key:
+                trackers = index[value]
+                trackers.discard(tracker)
+                if not trackers:
+                    del index[value]
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue the trackers depending on the changed state."""
+        entity_id = event.data["entity_id"]
+        by_entity = self._by_entity.get(entity_id)
+        by_domain = self._by_domain.get(entity_id.partition(".")[0])
+        if not (self._all or by_entity or by_domain):
+            return
+        pending = self._pending
+        for trackers in (self._all, by_entity, by_domain):
+            if not trackers:
+                continue
+            for tracker in trackers:
+                if (events := pending.get(tracker)) is None:
+                    pending[tracker] = [event]
+                elif events[-1] is not event:
+                    events.append(event)
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Re-render the trackers queued since the last iteration."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        for tracker, events in pending.items():
+            # A tracker may have been removed by the action of another one
+            if tracker in self._track_states:
+                tracker.async_refresh_from_events(events)
+
+
+@callback
+def _async_template_scheduler(hass: HomeAssistant) -> _TemplateScheduler:
+    """Return the scheduler for tracked templates."""
+    if (scheduler := hass.data.get(_TRACK_TEMPLATE_SCHEDULER)) is None:
+        scheduler = hass.data[_TRACK_TEMPLATE_SCHEDULER] = _TemplateScheduler(hass)
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -971,10 +1106,12 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        source: str | None = None,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._job = HassJob(action, f"track template result {track_templates}")
+        self._source = source
 
         self._track_templates = track_templates
         self._has_super_template = has_super_template
@@ -999,8 +1136,12 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
-        self._track_state_changes: _TrackStateChangeFiltered | None = None
+        self._scheduler = _async_template_scheduler(hass)
+        self._track_states: TrackStates | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
+        # Templates aggregating states are updated incrementally, None if
+        # a template cannot be
+        self._aggregates: dict[Template, StatesAggregate | None] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -1019,8 +1160,8 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                "setup", template.async_render_to_info, variables, strict, log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -1040,9 +1181,10 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                "setup", template.async_render_to_info, variables, strict, log_fn
             )
+            self._setup_aggregate(track_template_, info)
 
             if info.exception:
                 if not log_fn:
@@ -1054,9 +1196,8 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
-        )
+        self._track_states = _render_infos_to_track_states(self._info.values())
+        self._scheduler.async_add(self, self._track_states)
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1071,12 +1212,54 @@ class TrackTemplateResultInfo:
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
         """State changes that will cause a re-render."""
-        assert self._track_state_changes
+        assert self._track_states
+        track_states = self._track_states
         return {
-            **self._track_state_changes.listeners,
+            _ALL_LISTENER: track_states.all_states,
+            _ENTITIES_LISTENER: track_states.entities,
+            _DOMAINS_LISTENER: track_states.domains,
             "time": bool(self._time_listeners),
         }
 
+    @callback
+    def _setup_aggregate(
+        self, track_template_: TrackTemplate, info: RenderInfo
+    ) -> None:
+        """Set up or reset the aggregate of a template after a complete render."""
+        template = track_template_.template
+        if template not in self._aggregates:
+            if info.exception or not (info.all_states or info.domains):
+                return
+            variables = track_template_.variables
+            self._aggregates[template] = (
+                async_states_aggregate(template)
+                if track_template_.rate_limit is None
+                and not (variables and "states" in variables)
+                else None
+            )
+        if (aggregate := self._aggregates[template]) is None:
+            return
+        try:
+            aggregate.async_reset()
+        except TemplateError as ex:
+            _LOGGER.debug("Template %s cannot be aggregated: %s", template, ex)
+            self._aggregates[template] = None
+
+    @callback
+    def _apply_to_aggregates(
+        self, events: Iterable[Event[EventStateChangedData]]
+    ) -> None:
+        """Update the aggregates from state changes."""
+        for template, aggregate in self._aggregates.items():
+            if aggregate is None:
+                continue
+            try:
+                for event in events:
+                    aggregate.async_apply(event)
+            except TemplateError as ex:
+                _LOGGER.debug("Template %s cannot be aggregated: %s", template, ex)
+                self._aggregates[template] = None
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1110,8 +1293,8 @@ class TrackTemplateResultInfo:
     @callback
     def async_remove(self) -> None:
         """Cancel the listener."""
-        assert self._track_state_changes
-        self._track_state_changes.async_remove()
+        assert self._track_states
+        self._scheduler.async_remove(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -1121,6 +1304,27 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_from_events(
+        self, events: list[Event[EventStateChangedData]]
+    ) -> None:
+        """Recalculate the templates for the state changes of one loop iteration."""
+        self._refresh(events[-1], coalesced_events=events)
+
+    @callback
+    def _async_render_to_info(
+        self,
+        trigger: str,
+        render: Callable[..., RenderInfo],
+        *args: Any,
+    ) -> RenderInfo:
+        """Render a template, naming its source and trigger for profiling."""
+        token = template_render_source_cv.set((self._source, trigger))
+        try:
+            return render(*args)
+        finally:
+            template_render_source_cv.reset(token)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1138,6 +1342,7 @@ class TrackTemplateResultInfo:
         generates a new result.
         """
         template = track_template_.template
+        aggregate = self._aggregates.get(template)
 
         if event:
             info = self._info[template]
@@ -1165,9 +1370,17 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        trigger = event.data["entity_id"] if event else "refresh"
+        if event and aggregate:
+            info = self._async_render_to_info(
+                trigger, aggregate.async_render_to_info, self._info[template]
+            )
+        else:
+            info = self._async_render_to_info(
+                trigger, template.async_render_to_info, track_template_.variables
+            )
+            self._setup_aggregate(track_template_, info)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1217,6 +1430,7 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        coalesced_events: Sequence[Event[EventStateChangedData]] = (),
     ) -> None:
         """Refresh the template.
 
@@ -1229,6 +1443,10 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        coalesced_events are the state_changed events fired during the
+        same iteration of the event loop, ending with event. Each template
+        is rendered at most once, for the last of them that concerns it.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
@@ -1239,9 +1457,18 @@ class TrackTemplateResultInfo:
 
         track_templates = track_templates or self._track_templates
 
+        if event and not replayed and self._aggregates:
+            self._apply_to_aggregates(coalesced_events or (event,))
+
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template,
+                now,
+                _last_rerender_event(
+                    event, coalesced_events, self._info.get(super_template.template)
+                ),
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1264,6 +1491,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                coalesced_events = ()
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1272,23 +1500,32 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_,
+                    now,
+                    _last_rerender_event(
+                        event,
+                        coalesced_events,
+                        self._info.get(track_template_.template),
+                    ),
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
 
         if info_changed:
-            assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(info)
-                        if self._rate_limit.async_has_timer(template)
-                        else info
-                        for template, info in self._info.items()
-                    ]
-                )
+            self._track_states = _render_infos_to_track_states(
+                [
+                    # Aggregates keep listening to apply the state changes
+                    # while their render is rate limited
+                    _suppress_domain_all_in_render_info(info)
+                    if self._rate_limit.async_has_timer(template)
+                    and not self._aggregates.get(template)
+                    else info
+                    for template, info in self._info.items()
+                ]
             )
+            self._scheduler.async_update(self, self._track_states)
             _LOGGER.debug(
                 (
                     "Template group %s listens for %s, re-render blocked by super"
@@ -1336,6 +1573,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    source: str | None = None,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1367,13 +1605,18 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    source
+        If not None, names what the templates are rendered for, such as an
+        entity id, in template render profiles.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, source
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
@@ -1974,6 +2217,21 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _last_rerender_event(
+    event: Event[EventStateChangedData] | None,
+    coalesced_events: Sequence[Event[EventStateChangedData]],
+    info: RenderInfo | None,
+) -> Event[EventStateChangedData] | None:
+    """Return the last of the coalesced events which re-renders a template."""
+    if len(coalesced_events) < 2 or info is None:
+        return event
+    for coalesced_event in reversed(coalesced_events):
+        if _event_triggers_rerender(coalesced_event, info):
+            return coalesced_event
+    return event
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
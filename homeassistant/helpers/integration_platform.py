@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
@@ -16,6 +16,7 @@ from homeassistant.loader import (
     Integration,
     async_get_integrations,
     async_get_loaded_integration,
+    async_is_lazy_platform,
     async_register_preload_platform,
     bind_hass,
 )
@@ -36,6 +37,9 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    # Components to process on demand, None if the platform is not lazy
+    lazy_components: set[str] | None = None
+    lazy_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
 @callback
@@ -55,6 +59,9 @@ def _async_integration_platform_component_loaded(
         if component_name in integration_platform.seen_components:
             continue
         integration_platform.seen_components.add(component_name)
+        if integration_platform.lazy_components is not None:
+            integration_platform.lazy_components.add(component_name)
+            continue
         integration_platforms_by_name[integration_platform.platform_name] = (
             integration_platform
         )
@@ -184,6 +191,18 @@ async def async_process_integration_platforms(
         ),
         f"process_platform {platform_name}",
     )
+    if async_is_lazy_platform(hass, platform_name):
+        # The platforms are processed when they are needed, see
+        # async_load_lazy_integration_platforms
+        integration_platforms.append(
+            IntegrationPlatform(
+                platform_name,
+                process_job,
+                top_level_components,
+                top_level_components.copy(),
+            )
+        )
+        return
     integration_platform = IntegrationPlatform(
         platform_name, process_job, top_level_components
     )
@@ -218,6 +237,34 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_load_lazy_integration_platforms(
+    hass: HomeAssistant, platform_name: str, domains: Iterable[str] | None = None
+) -> None:
+    """Process the lazy integration platforms that were not processed yet.
+
+    Processes the platforms of all loaded integrations if domains is None.
+    Does nothing if the platform is not lazy.
+    """
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if (
+            integration_platform.platform_name != platform_name
+            or (lazy_components := integration_platform.lazy_components) is None
+        ):
+            continue
+        # Callers wait until the platforms processed by a concurrent call are done
+        async with integration_platform.lazy_lock:
+            if domains is None:
+                pending = lazy_components.copy()
+            else:
+                pending = lazy_components.intersection(domains)
+            if not pending:
+                continue
+            lazy_components.difference_update(pending)
+            await _async_process_integration_platforms(
+                hass, platform_name, pending, integration_platform.process_job
+            )
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
     platform_name: str,
@@ -0,0 +1,146 @@
+"""Trace the setup of integrations during startup."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+import contextlib
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TRACER: HassKey[StartupTracer] = HassKey("startup_tracer")
+
+STARTUP_TRACE_FILE = "startup_trace.json"
+
+# The span covering the whole setup of an integration, including
+# the time spent waiting for its dependencies
+SPAN_COMPONENT = "component"
+SPAN_FORWARD = "forward"
+SPAN_IMPORT = "import"
+SPAN_REQUIREMENTS = "requirements"
+SPAN_WAIT_DEPENDENCIES = "wait_dependencies"
+
+
+@dataclass(slots=True)
+class TraceSpan:
+    """A span of time spent on the setup of an integration."""
+
+    name: str
+    domain: str
+    group: str | None
+    start: float
+    end: float
+
+
+class StartupTracer:
+    """Record spans of integration setups until startup is done."""
+
+    __slots__ = ("spans", "_started")
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        self.spans: list[TraceSpan] = []
+        self._started = time.monotonic()
+
+    @contextlib.contextmanager
+    def trace(self, name: str, domain: str, group: str | None) -> Generator[None]:
+        """Record a span for the code inside the context manager."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.spans.append(TraceSpan(name, domain, group, start, time.monotonic()))
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Each integration gets its own track, the file can be opened
+        with chrome://tracing or https://ui.perfetto.dev
+        """
+        tracks: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in self.spans:
+            if (track := tracks.get(span.domain)) is None:
+                track = tracks[span.domain] = len(tracks) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": track,
+                        "args": {"name": span.domain},
+                    }
+                )
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.domain,
+                "ph": "X",
+                "pid": 1,
+                "tid": track,
+                "ts": round((span.start - self._started) * 1_000_000),
+                "dur": round((span.end - span.start) * 1_000_000),
+            }
+            if span.group is not None:
+                event["args"] = {"group": span.group}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def critical_path(self, hass: HomeAssistant) -> list[tuple[str, float]]:
+        """Return the integrations that delayed the end of startup the most.
+
+        Starts from the integration that finished last and walks back
+        through the dependency that finished last, the time of each
+        integration is the time it took after that dependency was done.
+        """
+        components = {
+            span.domain: span for span in self.spans if span.name == SPAN_COMPONENT
+        }
+        path: list[tuple[str, float]] = []
+        domain: str | None = max(
+            components, key=lambda domain: components[domain].end, default=None
+        )
+        while domain is not None:
+            span = components.pop(domain)
+            try:
+                integration = loader.async_get_loaded_integration(hass, domain)
+            except loader.IntegrationNotLoaded:
+                dependencies: set[str] = set()
+            else:
+                dependencies = {
+                    *integration.dependencies,
+                    *integration.after_dependencies,
+                } & components.keys()
+            domain = max(
+                dependencies, key=lambda domain: components[domain].end, default=None
+            )
+            ready = span.start if domain is None else components[domain].end
+            path.append((span.domain, span.end - max(span.start, ready)))
+        return path
+
+
+@callback
+def async_enable_startup_trace(hass: HomeAssistant) -> None:
+    """Start recording the setup of integrations."""
+    hass.data[DATA_STARTUP_TRACER] = StartupTracer()
+
+
+@callback
+def async_pop_startup_tracer(hass: HomeAssistant) -> StartupTracer | None:
+    """Stop recording and return the tracer if the trace is enabled."""
+    return hass.data.pop(DATA_STARTUP_TRACER, None)
+
+
+@contextlib.contextmanager
+def async_trace_setup(
+    hass: HomeAssistant, name: str, domain: str, group: str | None = None
+) -> Generator[None]:
+    """Record a span of the setup of an integration if the trace is enabled."""
+    if (tracer := hass.data.get(DATA_STARTUP_TRACER)) is None:
+        yield
+        return
+    with tracer.trace(name, domain, group):
+        yield
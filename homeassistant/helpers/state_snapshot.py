@@ -0,0 +1,246 @@
+"""Cached serialized snapshots of all states a user is allowed to read."""
+
+from __future__ import annotations
+
+import logging
+from operator import attrgetter
+import time
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import format_unserializable_data
+
+from .json import JSON_DUMP, find_paths_unserializable_data
+from .singleton import singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_SNAPSHOTS: HassKey[StateSnapshots] = HassKey("state_snapshots")
+
+_ENTITY_ID = attrgetter("entity_id")
+
+# Snapshots not requested for this many seconds are dropped
+SNAPSHOT_IDLE_TIMEOUT = 600
+
+
+class StatesEncoder:
+    """Serialize the states of a snapshot, as a JSON array by default.
+
+    Subclasses provide other encodings. Snapshots are kept per encoder
+    instance so each encoder should only be instantiated once.
+    """
+
+    __slots__ = ()
+
+    def serialize(self, state: State) -> bytes | None:
+        """Serialize a state or return None if it cannot be serialized."""
+        return _serialize_state(state)
+
+    def join(self, serialized: list[bytes]) -> bytes:
+        """Join the serialized states into an array."""
+        return b"".join((b"[", b",".join(serialized), b"]"))
+
+
+JSON_STATES_ENCODER = StatesEncoder()
+
+
+class _StatesSnapshot:
+    """Serialized states of one permission scope.
+
+    Each state is kept serialized per entity so a state change only
+    replaces the slice of that entity. The joined array is rebuilt the
+    next time it is requested.
+    """
+
+    __slots__ = (
+        "changed",
+        "encoder",
+        "last_requested",
+        "payload",
+        "permissions",
+        "serialized",
+        "sort_by_entity_id",
+    )
+
+    def __init__(
+        self,
+        permissions: AbstractPermissions | None,
+        sort_by_entity_id: bool,
+        encoder: StatesEncoder,
+        states: list[State],
+    ) -> None:
+        """Initialize the snapshot."""
+        self.permissions = permissions
+        self.sort_by_entity_id = sort_by_entity_id
+        self.encoder = encoder
+        self.serialized: dict[str, bytes] = {}
+        self.changed: dict[str, State] = {}
+        self.payload: bytes | None = None
+        self.last_requested = time.time()
+        if permissions is not None:
+            entity_perm = permissions.check_entity
+            states = [
+                state for state in states if entity_perm(state.entity_id, POLICY_READ)
+            ]
+        if sort_by_entity_id:
+            states.sort(key=_ENTITY_ID)
+        serialize = encoder.serialize
+        for state in states:
+            if (state_bytes := serialize(state)) is not None:
+                self.serialized[state.entity_id] = state_bytes
+
+    @callback
+    def async_update(self, entity_id: str, new_state: State | None) -> None:
+        """Replace the state of an entity."""
+        if new_state is None:
+            self.changed.pop(entity_id, None)
+            if self.serialized.pop(entity_id, None) is not None:
+                self.payload = None
+            return
+        if self.permissions is not None and not self.permissions.check_entity(
+            entity_id, POLICY_READ
+        ):
+            return
+        self.changed[entity_id] = new_state
+        self.payload = None
+
+    @callback
+    def async_get(self) -> bytes:
+        """Return the serialized array of the states."""
+        if self.payload is not None:
+            return self.payload
+        serialized = self.serialized
+        if changed := self.changed:
+            added = False
+            serialize = self.encoder.serialize
+            for entity_id, state in changed.items():
+                if entity_id not in serialized:
+                    added = True
+                if (state_bytes := serialize(state)) is None:
+                    serialized.pop(entity_id, None)
+                else:
+                    serialized[entity_id] = state_bytes
+            changed.clear()
+            if added and self.sort_by_entity_id:
+                self.serialized = serialized = dict(sorted(serialized.items()))
+        self.payload = self.encoder.join(list(serialized.values()))
+        return self.payload
+
+
+class StateSnapshots:
+    """Serialized lists of states, updated per entity when a state changes.
+
+    Snapshots are kept per permission scope: one for users that can read
+    every entity and one per user that can only read some of them. A
+    snapshot that has not been requested for SNAPSHOT_IDLE_TIMEOUT is
+    dropped on the next state change.
+    """
+
+    __slots__ = ("_hass", "_snapshots")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshots."""
+        self._hass = hass
+        self._snapshots: dict[
+            tuple[str | None, bool, StatesEncoder], _StatesSnapshot
+        ] = {}
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the state of the entity in the snapshots."""
+        if not self._snapshots:
+            return
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        idle_before = event.time_fired_timestamp - SNAPSHOT_IDLE_TIMEOUT
+        idle: list[tuple[str | None, bool, StatesEncoder]] = []
+        for key, snapshot in self._snapshots.items():
+            if snapshot.last_requested < idle_before:
+                idle.append(key)
+            else:
+                snapshot.async_update(entity_id, new_state)
+        for key in idle:
+            del self._snapshots[key]
+
+    @callback
+    def async_get(
+        self,
+        user: User,
+        sort_by_entity_id: bool = False,
+        encoder: StatesEncoder = JSON_STATES_ENCODER,
+    ) -> bytes:
+        """Return a serialized array of the states the user is allowed to read."""
+        permissions: AbstractPermissions | None = None
+        scope: str | None = None
+        if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+            permissions = user.permissions
+            scope = user.id
+
+        key = (scope, sort_by_entity_id, encoder)
+        # A new permissions object is created when the policy of a user changes
+        if (
+            snapshot := self._snapshots.get(key)
+        ) is None or snapshot.permissions is not permissions:
+            snapshot = self._snapshots[key] = _StatesSnapshot(
+                permissions, sort_by_entity_id, encoder, self._hass.states.async_all()
+            )
+        else:
+            snapshot.last_requested = time.time()
+        return snapshot.async_get()
+
+
+def _serialize_state(state: State) -> bytes | None:
+    """Serialize a state or return None if it cannot be serialized."""
+    try:
+        return state.as_dict_json
+    except (ValueError, TypeError):
+        _LOGGER.error(
+            "Unable to serialize to JSON. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(state, dump=JSON_DUMP)
+            ),
+        )
+    return None
+
+
+@callback
+@singleton(DATA_STATE_SNAPSHOTS)
+def _async_get_state_snapshots(hass: HomeAssistant) -> StateSnapshots:
+    """Return the state snapshots."""
+    return StateSnapshots(hass)
+
+
+@callback
+def async_get_states_json(
+    hass: HomeAssistant, user: User, sort_by_entity_id: bool = False
+) -> bytes:
+    """Return a JSON array of the states the user is allowed to read.
+
+    The result is shared by all callers until a state changes.
+    """
+    return _async_get_state_snapshots(hass).async_get(user, sort_by_entity_id)
+
+
+@callback
+def async_get_states_encoded(
+    hass: HomeAssistant,
+    user: User,
+    encoder: StatesEncoder,
+    sort_by_entity_id: bool = False,
+) -> bytes:
+    """Return the states the user is allowed to read serialized by encoder.
+
+    The result is shared by all callers until a state changes.
+    """
+    return _async_get_state_snapshots(hass).async_get(user, sort_by_entity_id, encoder)
@@ -10,8 +10,10 @@ from functools import cached_property
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
 import os
 from pathlib import Path
+import sys
 from typing import Any
 
 from homeassistant.const import (
@@ -31,7 +33,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -48,6 +50,12 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# A copy of the data of frequently loaded storage files that is faster to decode
+STORAGE_SNAPSHOT_FILE = "core.storage_snapshot"
+STORAGE_SNAPSHOT_VERSION = 1
+# marshal data is only guaranteed to be readable by the same Python version
+_STORAGE_SNAPSHOT_HEADER = (STORAGE_SNAPSHOT_VERSION, sys.version_info[:2])
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -116,15 +124,41 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._initialized = False
+        self._snapshot_keys: list[str] | None = None
+        self._snapshot_pending: bytes | None = None
+
+    @property
+    def snapshot_enabled(self) -> bool:
+        """Return if the storage snapshot is used."""
+        return self._snapshot_keys is not None
+
+    @callback
+    def async_enable_snapshot(self, keys: Iterable[str]) -> None:
+        """Preload the keys from the storage snapshot when initializing.
+
+        The JSON files stay the source of truth, a key is only loaded from
+        the snapshot if its file did not change since the snapshot was
+        written. Must be called before async_initialize.
+        """
+        self._snapshot_keys = list(keys)
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
+        if self._initialized:
+            return
+        self._initialized = True
         hass = self._hass
         await hass.async_add_executor_job(self._initialize_files)
         hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STARTED,
             self._async_schedule_cleanup,
         )
+        if self._snapshot_pending is not None:
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED,
+                self._async_schedule_snapshot_write,
+            )
 
     @callback
     def async_invalidate(self, key: str) -> None:
@@ -185,6 +219,14 @@ class _StoreManager:
             self._async_cancel_and_cleanup,
         )
 
+    @callback
+    def _async_schedule_snapshot_write(self, _event: Event) -> None:
+        """Write the updated storage snapshot once startup is done."""
+        if (snapshot := self._snapshot_pending) is None:
+            return
+        self._snapshot_pending = None
+        self._hass.async_add_executor_job(self._write_snapshot, snapshot)
+
     @callback
     def _async_cancel_and_cleanup(self, _event: Event) -> None:
         """Cancel the cleanup of old files."""
@@ -224,6 +266,61 @@ class _StoreManager:
         """Initialize the cache."""
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
+            if self._snapshot_keys:
+                self._preload_snapshot(self._files.intersection(self._snapshot_keys))
+
+    def _preload_snapshot(self, keys: set[str]) -> None:
+        """Cache the keys from the snapshot and prepare an update if needed."""
+        snapshot_file = self._storage_path.joinpath(STORAGE_SNAPSHOT_FILE)
+        snapshot: dict[str, tuple[str, json_util.JsonValueType]] = {}
+        try:
+            header, snapshot = marshal.loads(snapshot_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("Error loading storage snapshot: %s", ex)
+        else:
+            if header != _STORAGE_SNAPSHOT_HEADER:
+                snapshot = {}
+
+        updated: dict[str, tuple[str, json_util.JsonValueType]] = {}
+        for key in keys:
+            storage_file = self._storage_path.joinpath(key)
+            try:
+                stat_result = storage_file.stat()
+                signature = f"{stat_result.st_mtime_ns}:{stat_result.st_size}"
+                if (entry := snapshot.get(key)) and entry[0] == signature:
+                    updated[key] = entry
+                else:
+                    updated[key] = (signature, json_util.load_json(storage_file))
+            except Exception as ex:  # noqa: BLE001
+                _LOGGER.debug("Error loading %s: %s", key, ex)
+
+        if updated != snapshot:
+            # The snapshot is serialized before the data is handed to
+            # the stores since they may modify the data they load, it
+            # is written after startup to keep it off the critical path
+            try:
+                self._snapshot_pending = marshal.dumps(
+                    (_STORAGE_SNAPSHOT_HEADER, updated)
+                )
+            except ValueError as ex:
+                _LOGGER.debug("Error serializing storage snapshot: %s", ex)
+
+        for key, (_, data) in updated.items():
+            self._data_preload[key] = data
+
+    def _write_snapshot(self, snapshot: bytes) -> None:
+        """Write the storage snapshot."""
+        try:
+            write_utf8_file(
+                str(self._storage_path.joinpath(STORAGE_SNAPSHOT_FILE)),
+                snapshot,
+                private=True,
+                mode="wb",
+            )
+        except WriteError as ex:
+            _LOGGER.debug("Error writing storage snapshot: %s", ex)
 
 
 @bind_hass
@@ -5,15 +5,18 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import Counter, deque
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
+import copy
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -21,6 +24,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import monotonic, perf_counter
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -28,7 +32,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -50,6 +54,8 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Context,
+    Event,
+    EventStateChangedData,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -99,6 +105,7 @@ _ENVIRONMENT_LIMITED: HassKey[TemplateEnvironment] = HassKey(
 _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
+_RENDER_PROFILER: HassKey[TemplateRenderProfiler] = HassKey("template.render_profiler")
 _HASS_LOADER = "template.hass_loader"
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -132,6 +139,12 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
 )
 
+# The owner of the templates being rendered, for example an entity id,
+# and what triggered the render. Only used when profiling renders.
+template_render_source_cv: ContextVar[tuple[str | None, str] | None] = ContextVar(
+    "template_render_source_cv", default=None
+)
+
 #
 # CACHED_TEMPLATE_STATES is a rough estimate of the number of entities
 # on a typical system. It is used as the initial size of the LRU cache
@@ -157,6 +170,13 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+# Number of compiled templates kept alive after the last template
+# using them has been garbage collected
+COMPILED_TEMPLATE_CACHE_SIZE = 512
+
+# Number of render times kept per profiled template to estimate the p99
+RENDER_PROFILE_SAMPLES = 1000
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -488,6 +508,169 @@ class RenderInfo:
             self.filter = _false
 
 
+class CompiledTemplateCache:
+    """Process wide cache of compiled template code.
+
+    Templates with the same source compiled for the same kind of
+    environment share their code. Code in use by a template is held
+    weakly, recently compiled code is kept alive by an LRU so templates
+    that are recreated, for example when automations are reloaded, do
+    not have to be compiled again.
+    """
+
+    __slots__ = ("_code", "_recent", "compiles", "hits", "misses")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._code: weakref.WeakValueDictionary[tuple[str, str], CodeType] = (
+            weakref.WeakValueDictionary()
+        )
+        self._recent: LRU[tuple[str, str], CodeType] = LRU(size)
+        self.compiles = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str, flavor: str) -> CodeType | None:
+        """Return the compiled code for a template source."""
+        key = (source, flavor)
+        if (code := self._code.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._recent[key] = code
+        return code
+
+    def set(self, source: str, flavor: str, code: CodeType) -> None:
+        """Store the compiled code for a template source."""
+        key = (source, flavor)
+        self.compiles += 1
+        self._code[key] = code
+        self._recent[key] = code
+
+    def clear(self) -> None:
+        """Drop the recently compiled code."""
+        self._recent.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        return {
+            "size": len(self._code),
+            "recent": len(self._recent),
+            "max_recent": self._recent.get_size(),
+            "compiles": self.compiles,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+COMPILED_TEMPLATE_CACHE = CompiledTemplateCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+class TemplateRenderProfile:
+    """Render times of a template for one source."""
+
+    __slots__ = ("renders", "total_time", "max_time", "_times", "triggers")
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.renders = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._times: deque[float] = deque(maxlen=RENDER_PROFILE_SAMPLES)
+        self.triggers: Counter[str] = Counter()
+
+    def record(self, duration: float, trigger: str | None) -> None:
+        """Record a render."""
+        self.renders += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self._times.append(duration)
+        if trigger is not None:
+            self.triggers[trigger] += 1
+
+    def p99_time(self) -> float:
+        """Return the 99th percentile of the recent render times."""
+        times = sorted(self._times)
+        return times[math.ceil(len(times) * 0.99) - 1]
+
+
+class TemplateRenderProfiler:
+    """Collect the render times of templates while profiling is enabled."""
+
+    __slots__ = ("_profiles", "_started")
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._profiles: dict[tuple[str, str | None], TemplateRenderProfile] = {}
+        self._started = monotonic()
+
+    @callback
+    def async_record(self, template: str, duration: float) -> None:
+        """Record the render of a template."""
+        source: str | None = None
+        trigger: str | None = None
+        if render_source := template_render_source_cv.get():
+            source, trigger = render_source
+        key = (template, source)
+        if (profile := self._profiles.get(key)) is None:
+            profile = self._profiles[key] = TemplateRenderProfile()
+        profile.record(duration, trigger)
+
+    @callback
+    def async_report(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return the profiles, the most expensive first."""
+        profiles = sorted(
+            self._profiles.items(),
+            key=lambda item: item[1].total_time,
+            reverse=True,
+        )
+        elapsed = max(monotonic() - self._started, 1)
+        return [
+            {
+                "template": template,
+                "source": source,
+                "renders": profile.renders,
+                "renders_per_second": profile.renders / elapsed,
+                "total_time": profile.total_time,
+                "mean_time": profile.total_time / profile.renders,
+                "p99_time": profile.p99_time(),
+                "max_time": profile.max_time,
+                "triggers": dict(profile.triggers.most_common(5)),
+            }
+            for (template, source), profile in profiles[:limit]
+        ]
+
+
+@callback
+def async_start_render_profiling(hass: HomeAssistant) -> None:
+    """Start recording the render times of templates."""
+    hass.data.setdefault(_RENDER_PROFILER, TemplateRenderProfiler())
+
+
+@callback
+def async_stop_render_profiling(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Stop recording the render times of templates and return the report."""
+    if (profiler := hass.data.pop(_RENDER_PROFILER, None)) is None:
+        return []
+    return profiler.async_report()
+
+
+@callback
+def async_render_profiling_enabled(hass: HomeAssistant) -> bool:
+    """Return if the render times of templates are being recorded."""
+    return _RENDER_PROFILER in hass.data
+
+
+@callback
+def async_render_profile_report(
+    hass: HomeAssistant, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Return the render times recorded so far, the most expensive first."""
+    if (profiler := hass.data.get(_RENDER_PROFILER)) is None:
+        return []
+    return profiler.async_report(limit)
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -504,6 +687,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_native",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -538,6 +722,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._native: NativeTemplate | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -565,14 +750,15 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        env = self._env
+        if compiled := COMPILED_TEMPLATE_CACHE.get(self.template, env.flavor):
             self._compiled_code = compiled
             return
 
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
-                self._compiled_code = self._env.compile(self.template)
+                self._compiled_code = env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
@@ -627,10 +813,18 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        profiler = self.hass.data.get(_RENDER_PROFILER) if self.hass else None
+        start = perf_counter() if profiler else 0.0
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (native := self._native) is not None and native.names.isdisjoint(kwargs):
+                render_result = _render_native_with_context(self.template, native)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
+        finally:
+            if profiler:
+                profiler.async_record(self.template, perf_counter() - start)
 
         if len(render_result) > MAX_TEMPLATE_OUTPUT:
             raise TemplateError(
@@ -849,6 +1043,8 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if not limited:
+            self._native = native_template(env, self.template)
 
         return self._compiled
 
@@ -1213,6 +1409,288 @@ def _state_generator(
         yield _template_state_no_collect(hass, state)
 
 
+# Filters applied to the states one at a time, in order
+_AGGREGATE_ITEM_FILTERS = {"map", "reject", "rejectattr", "select", "selectattr"}
+# Filters and tests which only depend on their arguments
+_AGGREGATE_PURE_FILTERS = {
+    "abs",
+    "bool",
+    "float",
+    "int",
+    "lower",
+    "replace",
+    "round",
+    "string",
+    "trim",
+    "upper",
+}
+_AGGREGATE_PURE_TESTS = {
+    "!=",
+    "<",
+    "<=",
+    "==",
+    ">",
+    ">=",
+    "boolean",
+    "contains",
+    "defined",
+    "divisibleby",
+    "eq",
+    "equalto",
+    "even",
+    "false",
+    "float",
+    "ge",
+    "greaterthan",
+    "gt",
+    "in",
+    "integer",
+    "le",
+    "lessthan",
+    "lt",
+    "match",
+    "ne",
+    "none",
+    "number",
+    "odd",
+    "search",
+    "string",
+    "true",
+    "undefined",
+}
+# Filters aggregating the states, which give the same result for a
+# generator as for a list
+_AGGREGATE_FILTERS = {"average", "join", "list", "max", "min", "sum"}
+
+
+def _is_aggregate_item_filter(node: nodes.Filter) -> bool:
+    """Return if a filter can be applied to the states one at a time."""
+    if node.name not in _AGGREGATE_ITEM_FILTERS:
+        return False
+    if node.name == "map":
+        if not node.args:
+            return [kwarg.key for kwarg in node.kwargs] in (
+                ["attribute"],
+                ["attribute", "default"],
+            )
+        return node.args[0].value in _AGGREGATE_PURE_FILTERS  # type: ignore[attr-defined]
+    test_arg = 1 if node.name.endswith("attr") else 0
+    return (
+        len(node.args) <= test_arg or node.args[test_arg].value in _AGGREGATE_PURE_TESTS  # type: ignore[attr-defined]
+    )
+
+
+def _has_constant_arguments(node: nodes.Filter) -> bool:
+    """Return if all arguments of a filter are constants."""
+    return (
+        node.dyn_args is None
+        and node.dyn_kwargs is None
+        and all(isinstance(arg, nodes.Const) for arg in node.args)
+        and all(isinstance(kwarg.value, nodes.Const) for kwarg in node.kwargs)
+    )
+
+
+class StatesAggregate:
+    """Aggregate over all states or the states of a domain.
+
+    Templates such as
+    ``{{ states.sensor | selectattr(...) | map(attribute='state') | list | count }}``
+    depend on every state of a domain. Instead of iterating all states each
+    time one of them changes, the filters applied to the states one at a
+    time are evaluated once per state and updated from state changes. Only
+    the aggregate itself is rendered, which is still rate limited like any
+    other template depending on a domain or all states.
+    """
+
+    __slots__ = ("hass", "domain", "_template", "_item", "_tail", "_items")
+
+    def __init__(
+        self,
+        template: Template,
+        domain: str | None,
+        item: jinja2.Template,
+        tail: jinja2.Template,
+    ) -> None:
+        """Initialize the aggregate.
+
+        The item and tail templates must use the environment of template.
+        """
+        assert template.hass is not None
+        self.hass = template.hass
+        self.domain = domain
+        self._template = template
+        self._item = item
+        self._tail = tail
+        # The filtered items of each state, in the order of the state machine
+        self._items: dict[str, list[Any]] = {}
+
+    def _evaluate(self, state: TemplateState) -> list[Any]:
+        """Apply the filters to a single state."""
+        context = self._item.new_context({"__item": state})
+        try:
+            for _ in self._item.root_render_func(context):
+                pass
+        except Exception as err:
+            raise TemplateError(err) from err
+        return cast(list[Any], context.vars["result"])
+
+    @callback
+    def async_reset(self) -> None:
+        """Evaluate the filters for all states."""
+        self._items = {
+            state.entity_id: self._evaluate(state)
+            for state in _state_generator(self.hass, self.domain)
+        }
+
+    @callback
+    def async_apply(self, event: Event[EventStateChangedData]) -> None:
+        """Update the filtered items from a state change."""
+        entity_id = event.data["entity_id"]
+        if self.domain is not None and split_entity_id(entity_id)[0] != self.domain:
+            return
+        if (new_state := event.data["new_state"]) is None:
+            self._items.pop(entity_id, None)
+            return
+        if event.data["old_state"] is None:
+            # Added states are iterated last
+            self._items.pop(entity_id, None)
+        self._items[entity_id] = self._evaluate(
+            _template_state_no_collect(self.hass, new_state)
+        )
+
+    def _render(self) -> Any:
+        """Render the aggregate from the filtered items."""
+        template = self._template
+        try:
+            render_result = _render_with_context(
+                template.template,
+                self._tail,
+                __values=[value for items in self._items.values() for value in items],
+            )
+        except Exception as err:
+            raise TemplateError(err) from err
+
+        if len(render_result) > MAX_TEMPLATE_OUTPUT:
+            raise TemplateError(
+                f"Template output exceeded maximum size of {MAX_TEMPLATE_OUTPUT} characters"
+            )
+
+        render_result = render_result.strip()
+
+        if self.hass.config.legacy_templates:
+            return render_result
+
+        return template._parse_result(render_result)  # noqa: SLF001
+
+    @callback
+    def async_render_to_info(self, render_info: RenderInfo) -> RenderInfo:
+        """Render the aggregate.
+
+        The states and domains to track are taken from render_info, the
+        result of the last complete render of the template.
+        """
+        aggregate_info = copy.copy(render_info)
+        aggregate_info.exception = None
+        try:
+            aggregate_info._result = self._render()  # noqa: SLF001
+        except TemplateError as ex:
+            aggregate_info._result = None  # noqa: SLF001
+            aggregate_info.exception = ex
+        return aggregate_info
+
+
+def async_states_aggregate(template: Template) -> StatesAggregate | None:
+    """Return an incremental aggregate for a template, if it has one.
+
+    Only templates made of one expression filtering ``states`` or
+    ``states.<domain>`` have one.
+    """
+    if template.is_static or template.hass is None:
+        return None
+    env = template._env  # noqa: SLF001
+    try:
+        ast = env.parse(template.template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(ast.body) != 1
+        or not isinstance(output := ast.body[0], nodes.Output)
+        or len(output.nodes) != 1
+    ):
+        return None
+
+    filters: list[nodes.Filter] = []
+    node = output.nodes[0]
+    while isinstance(node, nodes.Filter):
+        if node.node is None or not _has_constant_arguments(node):
+            return None
+        filters.append(node)
+        node = node.node
+    filters.reverse()
+
+    domain: str | None
+    if isinstance(node, nodes.Name) and node.name == "states":
+        domain = None
+    elif (
+        isinstance(node, nodes.Getattr)
+        and isinstance(node.node, nodes.Name)
+        and node.node.name == "states"
+        and node.attr not in _RESERVED_NAMES
+        and valid_domain(node.attr)
+    ):
+        domain = node.attr
+    else:
+        return None
+
+    split = 0
+    while split < len(filters) and _is_aggregate_item_filter(filters[split]):
+        split += 1
+    if split == len(filters) or filters[split].name not in _AGGREGATE_FILTERS:
+        return None
+
+    def _chain(expr: nodes.Expr, chain: Iterable[nodes.Filter]) -> nodes.Expr:
+        for node in chain:
+            expr = nodes.Filter(
+                expr, node.name, node.args, node.kwargs, None, None, lineno=1
+            )
+        return expr
+
+    item_expr = nodes.Filter(
+        _chain(
+            nodes.List([nodes.Name("__item", "load", lineno=1)], lineno=1),
+            filters[:split],
+        ),
+        "list",
+        [],
+        [],
+        None,
+        None,
+        lineno=1,
+    )
+    item_ast = nodes.Template(
+        [nodes.Assign(nodes.Name("result", "store", lineno=1), item_expr, lineno=1)],
+        lineno=1,
+    )
+    tail_ast = nodes.Template(
+        [
+            nodes.Output(
+                [_chain(nodes.Name("__values", "load", lineno=1), filters[split:])],
+                lineno=1,
+            )
+        ],
+        lineno=1,
+    )
+    for tree in (item_ast, tail_ast):
+        tree.set_environment(env)
+        tree.set_lineno(1)
+    try:
+        item = env.from_string(item_ast)
+        tail = env.from_string(tail_ast)
+    except jinja2.TemplateError:
+        return None
+    return StatesAggregate(template, domain, item, tail)
+
+
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
     state = hass.states.get(entity_id)
     if state is None and not valid_entity_id(entity_id):
@@ -2727,6 +3205,252 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _render_native_with_context(template_str: str, native: NativeTemplate) -> str:
+    """Store template being rendered in a ContextVar to aid error handling."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return native.render()
+
+
+# Globals which can be called by native templates
+_NATIVE_GLOBALS = {
+    "bool",
+    "float",
+    "has_value",
+    "int",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "states",
+}
+# Globals which are passed the Jinja context but do not use it
+_NATIVE_CONTEXT_GLOBALS = {"has_value", "is_state", "is_state_attr", "state_attr"}
+_NATIVE_BINARY_OPERATORS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mul: operator.mul,
+    nodes.Sub: operator.sub,
+}
+_NATIVE_UNARY_OPERATORS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Neg: operator.neg,
+    nodes.Not: operator.not_,
+    nodes.Pos: operator.pos,
+}
+_NATIVE_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "in": lambda left, right: left in right,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "ne": operator.ne,
+    "notin": lambda left, right: left not in right,
+}
+
+type _NativeExpression = Callable[[], Any]
+
+
+class NativeTemplate:
+    """Template evaluated without Jinja.
+
+    Simple templates, such as ``{{ states('sensor.x') | float(0) * 2 }}``,
+    are evaluated by closures calling the same globals and filters the
+    compiled Jinja template would call. This skips the creation of the
+    Jinja context and the sandbox for every render.
+    """
+
+    __slots__ = ("render", "names")
+
+    def __init__(self, render: Callable[[], str], names: frozenset[str]) -> None:
+        """Initialize the native template."""
+        self.render = render
+        # Variables with these names shadow the globals used by the template
+        self.names = names
+
+
+def _native_arguments(
+    env: TemplateEnvironment, node: nodes.Call | nodes.Filter, names: set[str]
+) -> tuple[list[_NativeExpression], dict[str, _NativeExpression]] | None:
+    """Return native expressions for the arguments of a call or filter."""
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        return None
+    args: list[_NativeExpression] = []
+    for arg in node.args:
+        if (native_arg := _native_expression(env, arg, names)) is None:
+            return None
+        args.append(native_arg)
+    kwargs: dict[str, _NativeExpression] = {}
+    for kwarg in node.kwargs:
+        if (native_arg := _native_expression(env, kwarg.value, names)) is None:
+            return None
+        kwargs[kwarg.key] = native_arg
+    return args, kwargs
+
+
+def _native_call(
+    func: Callable[..., Any],
+    value: _NativeExpression | None,
+    args: list[_NativeExpression],
+    kwargs: dict[str, _NativeExpression],
+) -> _NativeExpression:
+    """Return a native expression calling a global or filter."""
+    if value is None:
+        if not args and not kwargs:
+            return func
+        if not kwargs:
+            return lambda: func(*[arg() for arg in args])
+        return lambda: func(
+            *[arg() for arg in args], **{key: arg() for key, arg in kwargs.items()}
+        )
+    if not kwargs:
+        return lambda: func(value(), *[arg() for arg in args])
+    return lambda: func(
+        value(),
+        *[arg() for arg in args],
+        **{key: arg() for key, arg in kwargs.items()},
+    )
+
+
+def _native_expression(  # noqa: C901
+    env: TemplateEnvironment, node: nodes.Node, names: set[str]
+) -> _NativeExpression | None:
+    """Return a native expression for a Jinja expression, if supported."""
+    if isinstance(node, nodes.Const):
+        const = node.value
+        return lambda: const
+
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        items: list[_NativeExpression] = []
+        for item in node.items:
+            if (native_item := _native_expression(env, item, names)) is None:
+                return None
+            items.append(native_item)
+        if isinstance(node, nodes.Tuple):
+            return lambda: tuple(item() for item in items)
+        return lambda: [item() for item in items]
+
+    if isinstance(node, nodes.Call):
+        if (
+            not isinstance(node.node, nodes.Name)
+            or (name := node.node.name) not in _NATIVE_GLOBALS
+            or (func := env.globals.get(name)) is None
+            or not env.is_safe_callable(func)
+            or (arguments := _native_arguments(env, node, names)) is None
+        ):
+            return None
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            if name not in _NATIVE_CONTEXT_GLOBALS:
+                return None
+            func = partial(func, None)
+        names.add(name)
+        return _native_call(func, None, *arguments)
+
+    if isinstance(node, nodes.Filter):
+        if (
+            node.node is None
+            or (func := env.filters.get(node.name)) is None
+            or getattr(func, "jinja_pass_arg", None) is not None
+            or (value := _native_expression(env, node.node, names)) is None
+            or (arguments := _native_arguments(env, node, names)) is None
+        ):
+            return None
+        return _native_call(func, value, *arguments)
+
+    if isinstance(node, (nodes.And, nodes.Or)):
+        if (left := _native_expression(env, node.left, names)) is None or (
+            right := _native_expression(env, node.right, names)
+        ) is None:
+            return None
+        if isinstance(node, nodes.And):
+            return lambda: left() and right()
+        return lambda: left() or right()
+
+    if isinstance(node, nodes.BinExpr):
+        if (
+            (binary_operator := _NATIVE_BINARY_OPERATORS.get(type(node))) is None
+            or (left := _native_expression(env, node.left, names)) is None
+            or (right := _native_expression(env, node.right, names)) is None
+        ):
+            return None
+        return lambda: binary_operator(left(), right())
+
+    if isinstance(node, nodes.UnaryExpr):
+        if (unary_operator := _NATIVE_UNARY_OPERATORS.get(type(node))) is None or (
+            operand := _native_expression(env, node.node, names)
+        ) is None:
+            return None
+        return lambda: unary_operator(operand())
+
+    if isinstance(node, nodes.Compare):
+        if (first := _native_expression(env, node.expr, names)) is None:
+            return None
+        operands: list[tuple[Callable[[Any, Any], Any], _NativeExpression]] = []
+        for operand_node in node.ops:
+            if (compare := _NATIVE_COMPARE_OPERATORS.get(operand_node.op)) is None or (
+                native_operand := _native_expression(env, operand_node.expr, names)
+            ) is None:
+                return None
+            operands.append((compare, native_operand))
+
+        def _compare() -> Any:
+            left = first()
+            for compare, native_operand in operands:
+                right = native_operand()
+                if not (result := compare(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _compare
+
+    if isinstance(node, nodes.CondExpr) and node.expr2 is not None:
+        if (
+            (test := _native_expression(env, node.test, names)) is None
+            or (expr1 := _native_expression(env, node.expr1, names)) is None
+            or (expr2 := _native_expression(env, node.expr2, names)) is None
+        ):
+            return None
+        return lambda: expr1() if test() else expr2()
+
+    return None
+
+
+def native_template(env: TemplateEnvironment, source: str) -> NativeTemplate | None:
+    """Return a native template for a template source, if it is supported.
+
+    Only templates made of text and expressions calling state globals,
+    filters, operators and constants are supported. They render to the same
+    result and collect the same render info as the Jinja template.
+    """
+    if "{%" in source or "{#" in source:
+        return None
+    try:
+        ast = env.parse(source)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if len(ast.body) != 1 or not isinstance(output := ast.body[0], nodes.Output):
+        return None
+
+    names: set[str] = set()
+    pieces: list[_NativeExpression] = []
+    for node in output.nodes:
+        if isinstance(node, nodes.TemplateData):
+            data = node.data
+            pieces.append(lambda data=data: data)  # type: ignore[misc]
+        elif (expression := _native_expression(env, node, names)) is not None:
+            pieces.append(expression)
+        else:
+            return None
+
+    if len(pieces) == 1:
+        piece = pieces[0]
+        return NativeTemplate(lambda: str(piece()), frozenset(names))
+    return NativeTemplate(
+        lambda: "".join([str(piece()) for piece in pieces]), frozenset(names)
+    )
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2846,9 +3570,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        # The kind of environment, compiled code is shared by environments
+        # of the same kind
+        self.flavor = "limited" if limited else "strict" if strict else "normal"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3202,7 +3926,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         compiled = super().compile(source)
-        self.template_cache[source] = compiled
+        if isinstance(source, str):
+            COMPILED_TEMPLATE_CACHE.set(source, self.flavor, compiled)
         return compiled
 
 
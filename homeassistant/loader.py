@@ -13,10 +13,12 @@ from dataclasses import dataclass
 import functools as ft
 from functools import cached_property
 import importlib
+from importlib.util import cache_from_source
 import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -30,7 +32,7 @@ import voluptuous as vol
 
 from . import generated
 from .const import Platform
-from .core import HomeAssistant, callback
+from .core import CoreState, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -41,6 +43,7 @@ from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED
+from .util.collection import chunked
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
@@ -80,6 +83,17 @@ BASE_PRELOAD_PLATFORMS = [
     "trigger",
 ]
 
+#
+# Platforms that are only needed when a user asks for them. When lazy
+# platforms are enabled they are not preloaded and their integration
+# platforms are only processed when the integration that consumes them
+# calls async_load_lazy_integration_platforms.
+#
+BASE_LAZY_PLATFORMS = [
+    "diagnostics",
+    "system_health",
+]
+
 
 @dataclass
 class BlockedIntegration:
@@ -132,6 +146,16 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_LAZY_PLATFORMS: HassKey[set[str]] = HassKey("lazy_platforms")
+DATA_UNUSED_PRELOAD_PLATFORMS: HassKey[set[str]] = HassKey("unused_preload_platforms")
+# Guards DATA_UNUSED_PRELOAD_PLATFORMS, platforms are preloaded and used
+# from the import executor as well as the event loop
+_UNUSED_PRELOAD_PLATFORMS_LOCK = threading.Lock()
+# Number of integrations whose files are read by each prefetch executor job
+PREFETCH_CHUNK_SIZE = 10
+# Number of integrations imported by each import executor job of
+# async_import_components, so other imports can run between the jobs
+IMPORT_CHUNK_SIZE = 10
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -269,6 +293,9 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_UNUSED_PRELOAD_PLATFORMS] = set()
+    if DATA_LAZY_PLATFORMS in hass.data:
+        async_enable_lazy_platforms(hass)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -647,10 +674,43 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
 def async_register_preload_platform(hass: HomeAssistant, platform_name: str) -> None:
     """Register a platform to be preloaded."""
     preload_platforms = hass.data[DATA_PRELOAD_PLATFORMS]
-    if platform_name not in preload_platforms:
+    if platform_name not in preload_platforms and not async_is_lazy_platform(
+        hass, platform_name
+    ):
         preload_platforms.append(platform_name)
 
 
+@callback
+def async_enable_lazy_platforms(hass: HomeAssistant) -> None:
+    """Stop preloading the platforms that are only needed on demand."""
+    lazy_platforms = hass.data[DATA_LAZY_PLATFORMS] = set(BASE_LAZY_PLATFORMS)
+    preload_platforms = hass.data[DATA_PRELOAD_PLATFORMS]
+    preload_platforms[:] = [
+        platform_name
+        for platform_name in preload_platforms
+        if platform_name not in lazy_platforms
+    ]
+
+
+@callback
+def async_is_lazy_platform(hass: HomeAssistant, platform_name: str) -> bool:
+    """Return if a platform is only loaded on demand."""
+    return platform_name in hass.data.get(DATA_LAZY_PLATFORMS, ())
+
+
+@callback
+def async_pop_unused_preload_platforms(hass: HomeAssistant) -> list[str]:
+    """Return the platforms preloaded during startup that were never used.
+
+    Only platforms preloaded before Home Assistant started running are tracked.
+    """
+    unused_platforms = hass.data[DATA_UNUSED_PRELOAD_PLATFORMS]
+    with _UNUSED_PRELOAD_PLATFORMS_LOCK:
+        unused = sorted(unused_platforms)
+        unused_platforms.clear()
+    return unused
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -775,6 +835,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._unused_preload_platforms = hass.data[DATA_UNUSED_PRELOAD_PLATFORMS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1039,6 +1100,89 @@ class Integration:
 
         return comp
 
+    @callback
+    def async_reserve_batch_import(self) -> asyncio.Future[ComponentProtocol] | None:
+        """Reserve importing the component as part of a batch.
+
+        Returns None if the component is imported or being imported already.
+        Otherwise async_get_component waits for the returned future, which
+        is resolved once import_component_for_batch imported the component.
+        """
+        if (
+            not self.import_executor
+            or self.domain in self._cache
+            or self._component_future is not None
+            or self.pkg_path in sys.modules
+        ):
+            return None
+        self._component_future = self.hass.loop.create_future()
+        return self._component_future
+
+    def import_component_for_batch(
+        self, future: asyncio.Future[ComponentProtocol]
+    ) -> None:
+        """Import the component reserved with async_reserve_batch_import.
+
+        This method must be run in the import executor.
+        """
+        comp: ComponentProtocol | None
+        try:
+            comp = self._get_component(True)
+        except Exception:  # noqa: BLE001
+            comp = None
+        self.hass.loop.call_soon_threadsafe(self._async_batch_import_done, future, comp)
+
+    def prefetch_files(self) -> None:
+        """Read the bytecode or the source of the top level modules.
+
+        This method must be run in the executor.
+        """
+        for file_name in self._top_level_files:
+            if not file_name.endswith(".py"):
+                continue
+            source_path = os.path.join(self.file_path, file_name)
+            for path in (cache_from_source(source_path), source_path):
+                try:
+                    with open(path, "rb") as module_file:
+                        module_file.read()
+                except OSError:
+                    continue
+                break
+
+    @callback
+    def _async_batch_import_done(
+        self,
+        future: asyncio.Future[ComponentProtocol],
+        comp: ComponentProtocol | None,
+    ) -> None:
+        """Resolve the future of a component imported by async_import_components."""
+        if self._component_future is future:
+            self._component_future = None
+        if comp is not None:
+            future.set_result(comp)
+            return
+        # Import it again outside the batch so the error is raised and
+        # reported the same way as when async_get_component imports it
+        self.hass.async_create_task_internal(
+            self._async_resolve_component_future(future),
+            f"import {self.domain}",
+            eager_start=True,
+        )
+
+    async def _async_resolve_component_future(
+        self, future: asyncio.Future[ComponentProtocol]
+    ) -> None:
+        """Resolve the future of a component with the result of importing it."""
+        try:
+            future.set_result(await self.async_get_component())
+        except BaseException as ex:  # noqa: BLE001
+            future.set_exception(ex)
+            with suppress(BaseException):
+                # Set the exception retrieved flag on the future since
+                # it will never be retrieved unless there
+                # are concurrent calls to async_get_component
+                future.result()
+
     def get_component(self) -> ComponentProtocol:
         """Return the component.
 
@@ -1078,12 +1222,24 @@ class Integration:
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
         if preload_platforms:
+            track_unused = self.hass.state is CoreState.not_running
             for platform_name in self.platforms_exists(self._platforms_to_preload):
+                full_name = f"{domain}.{platform_name}"
+                if full_name in cache:
+                    continue
                 with suppress(ImportError):
-                    self.get_platform(platform_name)
+                    self._load_platform(platform_name)
+                    if track_unused:
+                        with _UNUSED_PRELOAD_PLATFORMS_LOCK:
+                            self._unused_preload_platforms.add(full_name)
 
         return cache[domain]
 
+    def _discard_unused_preload_platform(self, full_name: str) -> None:
+        """Mark a preloaded platform as used."""
+        with _UNUSED_PRELOAD_PLATFORMS_LOCK:
+            self._unused_preload_platforms.discard(full_name)
+
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
         """Load platforms for an integration."""
         return {
@@ -1095,7 +1251,9 @@ class Integration:
         """Return a platform for an integration."""
         # Fast path for a single platform when it is already cached.
         # This is the common case.
-        if platform := self._cache.get(f"{self.domain}.{platform_name}"):
+        if platform := self._cache.get(full_name := f"{self.domain}.{platform_name}"):
+            if self._unused_preload_platforms:
+                self._discard_unused_preload_platform(full_name)
             return platform  # type: ignore[return-value]
         platforms = await self.async_get_platforms((platform_name,))
         return platforms[platform_name]
@@ -1200,6 +1358,8 @@ class Integration:
         """Return a platform for an integration from cache."""
         full_name = f"{self.domain}.{platform_name}"
         if full_name in self._cache:
+            if self._unused_preload_platforms:
+                self._discard_unused_preload_platform(full_name)
             # the cache is either a ModuleType or a ComponentProtocol
             # but we only care about the ModuleType here
             return self._cache[full_name]  # type: ignore[return-value]
@@ -1219,7 +1379,10 @@ class Integration:
 
     def get_platform_cached(self, platform_name: str) -> ModuleType | None:
         """Return a platform for an integration from cache."""
-        return self._cache.get(f"{self.domain}.{platform_name}")  # type: ignore[return-value]
+        full_name = f"{self.domain}.{platform_name}"
+        if self._unused_preload_platforms:
+            self._discard_unused_preload_platform(full_name)
+        return self._cache.get(full_name)  # type: ignore[return-value]
 
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
@@ -1300,6 +1463,56 @@ class Integration:
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+async def async_prefetch_files(
+    hass: HomeAssistant, integrations: Iterable[Integration]
+) -> None:
+    """Read the module files of integrations ahead of importing them.
+
+    Reading the files in parallel executor jobs fills the page cache, so
+    the imports in the import executor do not have to wait on the disk
+    one file at a time.
+    """
+    await asyncio.gather(
+        *(
+            hass.async_add_executor_job(_prefetch_files, chunk)
+            for chunk in chunked(integrations, PREFETCH_CHUNK_SIZE)
+        )
+    )
+
+
+def _prefetch_files(integrations: list[Integration]) -> None:
+    """Read the bytecode or the source of the top level modules of integrations."""
+    for integration in integrations:
+        integration.prefetch_files()
+
+
+async def async_import_components(
+    hass: HomeAssistant, integrations: Iterable[Integration]
+) -> None:
+    """Import the components of integrations in a few import executor jobs.
+
+    The components are imported in chunks of IMPORT_CHUNK_SIZE, one import
+    executor job at a time. Integrations that are imported or being imported
+    are skipped. Callers of async_get_component wait until the component
+    they need is imported instead of scheduling their own import executor job.
+    """
+    for chunk in chunked(integrations, IMPORT_CHUNK_SIZE):
+        if batch := [
+            (integration, future)
+            for integration in chunk
+            if (future := integration.async_reserve_batch_import()) is not None
+        ]:
+            await hass.async_add_import_executor_job(_import_components, batch)
+
+
+def _import_components(
+    batch: list[tuple[Integration, asyncio.Future[ComponentProtocol]]],
+) -> None:
+    """Import components one after another in the import executor."""
+    for integration, future in batch:
+        integration.import_component_for_batch(future)
+
+
 def _version_blocked(
     integration_version: AwesomeVersion,
     blocked_integration: BlockedIntegration,
@@ -54,6 +54,10 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    startup_trace: bool = False
+    config_cache: bool = False
+    lazy_platforms: bool = False
+    storage_snapshot: bool = False
 
     safe_mode: bool = False
 
@@ -308,3 +308,203 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _recorder_insert_states(bulk: bool) -> float:
+    """Insert state changes for 100 entities into an in-memory database.
+
+    Returns the runtime. Every 500 events are committed together which is
+    similar to the default commit interval under a heavy load.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.table_managers.states import (
+        StatesBulkBuffer,
+        StatesManager,
+    )
+
+    events_to_record = 10**5
+    events_per_commit = 500
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine, expire_on_commit=False)
+    attributes = StateAttributes(shared_attrs="{}", hash=0)
+    session.add(attributes)
+    states_meta = [StatesMeta(entity_id=f"sensor.power_{i}") for i in range(100)]
+    session.add_all(states_meta)
+    session.commit()
+    attributes_id = attributes.attributes_id
+    metadata_ids = {meta.entity_id: meta.metadata_id for meta in states_meta}
+
+    events = []
+    old_states: dict[str, core.State] = {}
+    for i in range(events_to_record):
+        entity_id = f"sensor.power_{i % 100}"
+        new_state = core.State(entity_id, str(i))
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+
+    states_manager = StatesManager()
+    states_bulk_buffer = StatesBulkBuffer()
+    start = timer()
+    for i, event in enumerate(events, 1):
+        entity_id = event.data["entity_id"]
+        if bulk:
+            old_state_id = None
+            if (old_state_index := states_bulk_buffer.pop_pending(entity_id)) is None:
+                old_state_index = -1
+                old_state_id = states_manager.pop_committed(entity_id)
+            states_bulk_buffer.add(
+                event,
+                None,
+                old_state_id,
+                old_state_index,
+                attributes_id,
+                None,
+                metadata_ids[entity_id],
+                None,
+            )
+        else:
+            dbstate = States.from_event(event)
+            dbstate.entity_id = None
+            if pending_state := states_manager.pop_pending(entity_id):
+                dbstate.old_state = pending_state
+            elif old_state_id := states_manager.pop_committed(entity_id):
+                dbstate.old_state_id = old_state_id
+            states_manager.add_pending(entity_id, dbstate)
+            dbstate.attributes_id = attributes_id
+            dbstate.metadata_id = metadata_ids[entity_id]
+            session.add(dbstate)
+        if i % events_per_commit == 0:
+            if bulk:
+                states_bulk_buffer.insert(session)
+            session.commit()
+            states_manager.post_commit_pending()
+            if bulk:
+                states_bulk_buffer.post_commit_pending(states_manager)
+    runtime = timer() - start
+    session.close()
+    engine.dispose()
+    print(f"{events_to_record / runtime:.0f} events/s")
+    return runtime
+
+
+@benchmark
+async def recorder_insert_states_orm(hass):
+    """Record 100000 state changes with a States object per event."""
+    return _recorder_insert_states(False)
+
+
+@benchmark
+async def recorder_insert_states_bulk(hass):
+    """Record 100000 state changes with the states bulk buffer."""
+    return _recorder_insert_states(True)
+
+
+def _sensor_compile_mean_min_max(batched: bool) -> float:
+    """Compile mean, min and max of 5000 sensors with 30 states each.
+
+    Returns the runtime.
+    """
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+    import itertools
+
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.util import dt as dt_util
+
+    entities = 5000
+    states_per_entity = 30
+    end = dt_util.utcnow()
+    start = end - timedelta(minutes=5)
+    step = timedelta(minutes=5) / states_per_entity
+    fstates_by_entity: dict[str, list[tuple[float, core.State]]] = {}
+    for i in range(entities):
+        entity_id = f"sensor.power_{i}"
+        fstates_by_entity[entity_id] = [
+            (
+                float(i + j % 7),
+                core.State(entity_id, str(i + j % 7), last_updated=start + step * j),
+            )
+            for j in range(states_per_entity)
+        ]
+
+    start_timer = timer()
+    if batched:
+        sensor_recorder._batch_mean_min_max(  # noqa: SLF001
+            fstates_by_entity, start, end
+        )
+    else:
+        for fstates in fstates_by_entity.values():
+            sensor_recorder._time_weighted_average(  # noqa: SLF001
+                fstates, start, end
+            )
+            max(*itertools.islice(zip(*fstates, strict=False), 1))
+            min(*itertools.islice(zip(*fstates, strict=False), 1))
+    runtime = timer() - start_timer
+    print(f"{entities / runtime:.0f} sensors/s")
+    return runtime
+
+
+@benchmark
+async def sensor_compile_statistics_python(hass):
+    """Compile mean, min and max of 5000 sensors one sensor at a time."""
+    return _sensor_compile_mean_min_max(False)
+
+
+@benchmark
+async def sensor_compile_statistics_batched(hass):
+    """Compile mean, min and max of 5000 sensors in one vectorized pass."""
+    return _sensor_compile_mean_min_max(True)
+
+
+def _template_render(hass: core.HomeAssistant, native: bool) -> float:
+    """Render a simple template 100000 times.
+
+    Returns the runtime.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import template
+
+    hass.states.async_set("sensor.power", "21.5")
+    tpl = template.Template("{{ states('sensor.power') | float(0) * 2 }}", hass)
+    tpl.async_render()
+    if not native:
+        tpl._native = None  # noqa: SLF001
+    renders = 10**5
+
+    start = timer()
+    for _ in range(renders):
+        tpl.async_render_to_info()
+    runtime = timer() - start
+    print(f"{renders / runtime:.0f} renders/s")
+    return runtime
+
+
+@benchmark
+async def template_render_jinja(hass):
+    """Render a simple template 100000 times with Jinja."""
+    return _template_render(hass, False)
+
+
+@benchmark
+async def template_render_native(hass):
+    """Render a simple template 100000 times without Jinja."""
+    return _template_render(hass, True)
@@ -31,6 +31,13 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import (
+    SPAN_COMPONENT,
+    SPAN_IMPORT,
+    SPAN_REQUIREMENTS,
+    SPAN_WAIT_DEPENDENCIES,
+    async_trace_setup,
+)
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -162,7 +169,8 @@ async def async_setup_component(
     setup_futures[domain] = setup_future
 
     try:
-        result = await _async_setup_component(hass, domain, config)
+        with async_trace_setup(hass, SPAN_COMPONENT, domain):
+            result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
@@ -331,7 +339,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_trace_setup(hass, SPAN_IMPORT, domain):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -568,13 +577,16 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with async_trace_setup(hass, SPAN_WAIT_DEPENDENCIES, integration.domain):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_setup(hass, SPAN_REQUIREMENTS, integration.domain):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -705,12 +717,13 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         yield
         return
 
+    integration, group = running
     started = time.monotonic()
     try:
-        yield
+        with async_trace_setup(hass, phase, integration, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
-        integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -768,7 +781,8 @@ def async_start_setup(
     setup_started[current] = started
 
     try:
-        yield
+        with async_trace_setup(hass, phase, integration, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
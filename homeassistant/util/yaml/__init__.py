@@ -5,11 +5,13 @@ from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
 from .loader import (
     Secrets,
+    YamlDependencies,
     YamlTypeError,
     load_yaml,
     load_yaml_dict,
     parse_yaml,
     secret_yaml,
+    track_dependencies,
 )
 from .objects import Input
 
@@ -19,11 +21,13 @@ __all__ = [
     "dump",
     "save_yaml",
     "Secrets",
+    "YamlDependencies",
     "YamlTypeError",
     "load_yaml",
     "load_yaml_dict",
     "secret_yaml",
     "parse_yaml",
+    "track_dependencies",
     "UndefinedSubstitution",
     "extract_inputs",
     "substitute",
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
@@ -41,6 +44,55 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+@dataclass(slots=True)
+class YamlDependencies:
+    """Files, directories and environment variables YAML was loaded from."""
+
+    paths: dict[str, str | None] = field(default_factory=dict)
+    env: dict[str, str | None] = field(default_factory=dict)
+
+    def changed(self) -> bool:
+        """Return if loading the YAML again could give a different result."""
+        return any(
+            path_signature(path) != signature for path, signature in self.paths.items()
+        ) or any(os.environ.get(name) != value for name, value in self.env.items())
+
+
+_DEPENDENCIES: ContextVar[YamlDependencies | None] = ContextVar(
+    "yaml_dependencies", default=None
+)
+
+
+def path_signature(path: str) -> str | None:
+    """Return a signature that changes when a file or directory is modified.
+
+    Returns None if the path does not exist.
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
+
+@contextmanager
+def track_dependencies() -> Iterator[YamlDependencies]:
+    """Track what the YAML loaded inside the context manager depends on."""
+    dependencies = YamlDependencies()
+    token = _DEPENDENCIES.set(dependencies)
+    try:
+        yield dependencies
+    finally:
+        _DEPENDENCIES.reset(token)
+
+
+def _track_path(path: str | os.PathLike[str]) -> None:
+    """Record the signature of a path if dependencies are tracked."""
+    if (dependencies := _DEPENDENCIES.get()) is not None:
+        path = os.fspath(path)
+        dependencies.paths[path] = path_signature(path)
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
@@ -226,6 +278,9 @@ def load_yaml(
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
+    # Tracked before opening so missing files, like secrets.yaml files
+    # that were looked up but do not exist, are tracked as well
+    _track_path(fname)
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -397,6 +452,8 @@ def _is_file_valid(name: str) -> bool:
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
+        # Files added to or removed from a directory change its signature
+        _track_path(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -528,6 +585,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if (dependencies := _DEPENDENCIES.get()) is not None:
+        dependencies.env[args[0]] = os.environ.get(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -1,15 +1,19 @@
 """The tests the History component websocket_api."""
 
 import asyncio
+from collections.abc import Generator
 from datetime import timedelta
-from unittest.mock import ANY, patch
+from functools import partial
+import threading
+from typing import Any
+from unittest.mock import ANY, MagicMock, patch
 
 from freezegun import freeze_time
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -20,6 +24,8 @@ from tests.common import async_fire_time_changed
 from tests.components.recorder.common import (
     async_recorder_block_till_done,
     async_wait_recording_done,
+    do_adhoc_statistics,
+    get_start_time,
 )
 from tests.typing import WebSocketGenerator
 
@@ -173,6 +179,161 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sending the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.one", state, attributes={"any": "attr"})
+        hass.states.async_set("sensor.two", state, attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "significant_changes_only": False,
+    }
+    client = await hass_ws_client()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states",
+        partial(recorder_history.stream_significant_states, chunk_size=4),
+    ):
+        await client.send_json_auto_id({**request, "chunked": True})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        chunks = []
+        while True:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            chunks.append(response["event"]["states"])
+            if response["event"]["done"]:
+                break
+
+    assert [sum(map(len, chunk.values())) for chunk in chunks] == [4, 2]
+    assert {
+        entity_id: [state for chunk in chunks for state in chunk.get(entity_id, [])]
+        for entity_id in ("sensor.one", "sensor.two")
+    } == expected
+
+    # Nothing to send still ends the stream
+    await client.send_json_auto_id(
+        {
+            **request,
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "done": True}
+
+
+async def test_history_during_period_chunked_unsubscribe(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a chunked history_during_period stops reading once unsubscribed."""
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "1")
+    await async_wait_recording_done(hass)
+
+    read: list[int] = []
+    reached = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def _stream_significant_states(
+        *args: Any, **kwargs: Any
+    ) -> Generator[dict[str, list[dict[str, Any]]]]:
+        try:
+            for i in range(100):
+                if i == 2:
+                    reached.set()
+                    release.wait()
+                read.append(i)
+                yield {"sensor.one": [{"s": str(i)}]}
+        finally:
+            finished.set()
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states",
+        _stream_significant_states,
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": dt_util.utcnow().isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        stream_id = response["id"]
+        response = await client.receive_json()
+        assert response["event"] == {
+            "states": {"sensor.one": [{"s": "0"}]},
+            "done": False,
+        }
+
+        await hass.async_add_executor_job(reached.wait)
+        await client.send_json_auto_id(
+            {"type": "unsubscribe_events", "subscription": stream_id}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        release.set()
+        await hass.async_add_executor_job(finished.wait)
+
+    assert read == [0, 1, 2]
+
+
+async def test_history_chunk_stream_waits_for_client(hass: HomeAssistant) -> None:
+    """Test the chunks are only sent once the client has caught up."""
+    connection = MagicMock(hass=hass, backlogged=True)
+    stream = websocket_api.HistoryChunkStream(connection, 1)
+
+    task = hass.async_create_task(stream.async_send(b"1"))
+    await asyncio.sleep(0)
+    assert not task.done()
+    connection.send_message.assert_called_once_with(b"1")
+    drained = connection.async_on_drained.call_args[0][0]
+    drained()
+    assert await task is True
+
+    connection.backlogged = False
+    assert await stream.async_send(b"2") is True
+    assert connection.async_on_drained.call_count == 1
+
+    connection.backlogged = True
+    task = hass.async_create_task(stream.async_send(b"3"))
+    await asyncio.sleep(0)
+    assert not task.done()
+    stream.async_cancel()
+    assert await task is False
+    assert await stream.async_send(b"4") is False
+    assert [call[0][0] for call in connection.send_message.call_args_list] == [
+        b"1",
+        b"2",
+        b"3",
+    ]
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2154,3 +2315,55 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsampled from statistics."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    start = get_start_time(dt_util.utcnow() - timedelta(minutes=15))
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "kW",
+    }
+    hass.states.async_set("sensor.power", "10", attributes, timestamp=start.timestamp())
+    await async_wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=start)
+    await async_wait_recording_done(hass)
+    # Statistics keep no attributes, the current ones are returned
+    hass.states.async_set(
+        "sensor.power",
+        "10",
+        {**attributes, "friendly_name": "Power"},
+        force_update=True,
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=5)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.power": [
+            {
+                "s": "10.0",
+                "lu": start.timestamp(),
+                "min": 10.0,
+                "max": 10.0,
+                "a": {**attributes, "friendly_name": "Power"},
+            }
+        ]
+    }
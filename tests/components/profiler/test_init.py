@@ -1,5 +1,6 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
 import logging
@@ -16,6 +17,8 @@ from homeassistant.components.profiler import (
     _LRU_CACHE_WRAPPER_OBJECT,
     _SQLALCHEMY_LRU_OBJECT,
     CONF_ENABLED,
+    CONF_MAX_EVENT_TYPES,
+    CONF_MAX_TEMPLATES,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
@@ -23,6 +26,8 @@ from homeassistant.components.profiler import (
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
+    SERVICE_PROFILE_EVENTS,
+    SERVICE_PROFILE_TEMPLATES,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
@@ -34,6 +39,7 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import template
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -311,6 +317,79 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "_dummy_test_lru_stats" in caplog.text
     assert "CacheInfo" in caplog.text
     assert "sqlalchemy_test" in caplog.text
+    assert "Cache stats for compiled templates" in caplog.text
+
+
+async def test_profile_templates(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test profiling templates logs the most expensive templates."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_PROFILE_TEMPLATES)
+
+    profile_call = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_TEMPLATES,
+            {CONF_SECONDS: 0.1, CONF_MAX_TEMPLATES: 1},
+            blocking=True,
+        )
+    )
+    while not template.async_render_profiling_enabled(hass):
+        await asyncio.sleep(0)
+
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(DOMAIN, SERVICE_PROFILE_TEMPLATES, blocking=True)
+    template.Template("{{ 'cheap' }}", hass).async_render()
+    template.Template(
+        "{% for i in range(1000) %}{{ i }}{% endfor %}", hass
+    ).async_render()
+    await profile_call
+
+    assert not template.async_render_profiling_enabled(hass)
+    assert "range(1000)" in caplog.text
+    assert "'cheap'" not in caplog.text
+    assert "Template rendered 1 times (1.00/s) for unknown" in caplog.text
+
+
+async def test_profile_events(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test profiling events logs the dispatch timings of event types."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_PROFILE_EVENTS)
+
+    profile_call = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_EVENTS,
+            {CONF_SECONDS: 0.1, CONF_MAX_EVENT_TYPES: 1000},
+            blocking=True,
+        )
+    )
+    while "profile_events_running" not in hass.data[DOMAIN]:
+        await asyncio.sleep(0)
+
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(DOMAIN, SERVICE_PROFILE_EVENTS, blocking=True)
+    hass.bus.async_fire("profiled_event")
+    hass.bus.async_fire("profiled_event")
+    await profile_call
+
+    assert hass.bus.async_dispatch_stats() == {}
+    assert "Event profiled_event dispatched 2 times" in caplog.text
 
 
 async def test_log_object_sources(
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from copy import copy
 from datetime import datetime, timedelta
+from functools import partial
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -18,10 +19,12 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history import modern
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -31,6 +34,8 @@ from .common import (
     assert_states_equal_without_context,
     async_recorder_block_till_done,
     async_wait_recording_done,
+    do_adhoc_statistics,
+    get_start_time,
 )
 
 from tests.typing import RecorderInstanceGenerator
@@ -1014,3 +1019,127 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_significant_states_downsampled(hass: HomeAssistant) -> None:
+    """Test numeric states are downsampled to the mean, min and max of buckets."""
+    start = dt_util.utcnow() - timedelta(minutes=10)
+    start_ts = start.timestamp()
+    for offset, state in (
+        (1, "1"),
+        (11, "2"),
+        (21, "3"),
+        (31, "4"),
+        (41, "5"),
+        (51, "unavailable"),
+        (61, "10"),
+        (71, "20"),
+    ):
+        hass.states.async_set("sensor.power", state, timestamp=start_ts + offset)
+    hass.states.async_set("sensor.other", "1", timestamp=start_ts + 1)
+    await async_wait_recording_done(hass)
+
+    states = history.get_significant_states_downsampled(
+        hass,
+        start,
+        start + timedelta(seconds=100),
+        ["sensor.power", "sensor.other"],
+        2,
+    )
+    assert list(states) == ["sensor.power", "sensor.other"]
+    assert [
+        (state["s"], state["lu"], state.get("min"), state.get("max"))
+        for state in states["sensor.power"]
+    ] == [
+        ("3.0", start_ts + 1, 1.0, 5.0),
+        ("unavailable", start_ts + 51, None, None),
+        ("15.0", start_ts + 61, 10.0, 20.0),
+    ]
+    # Entities with fewer states than max_points are not downsampled
+    assert [state["s"] for state in states["sensor.other"]] == ["1"]
+    assert "min" not in states["sensor.other"][0]
+
+    # The states are folded into the buckets as they are read
+    with (
+        patch.object(
+            modern,
+            "stream_significant_states",
+            partial(modern.stream_significant_states, chunk_size=3),
+        ),
+        patch.object(modern, "get_significant_states", side_effect=AssertionError),
+    ):
+        assert (
+            history.get_significant_states_downsampled(
+                hass,
+                start,
+                start + timedelta(seconds=100),
+                ["sensor.power", "sensor.other"],
+                2,
+            )
+            == states
+        )
+
+
+async def test_get_significant_states_downsampled_from_statistics(
+    hass: HomeAssistant,
+) -> None:
+    """Test downsampled states are read from the short term statistics."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    start = get_start_time(dt_util.utcnow() - timedelta(minutes=15))
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "kW",
+    }
+    hass.states.async_set("sensor.power", "10", attributes, timestamp=start.timestamp())
+    await async_wait_recording_done(hass)
+    do_adhoc_statistics(hass, start=start)
+    await async_wait_recording_done(hass)
+
+    end = start + timedelta(minutes=5)
+    current_attributes = {"sensor.power": {**attributes, "friendly_name": "Power"}}
+    assert history.get_significant_states_downsampled(
+        hass,
+        start,
+        end,
+        ["sensor.power"],
+        1,
+        current_attributes=current_attributes,
+    ) == {
+        "sensor.power": [
+            {
+                "s": "10.0",
+                "lu": start.timestamp(),
+                "min": 10.0,
+                "max": 10.0,
+                "a": current_attributes["sensor.power"],
+            }
+        ]
+    }
+    # Buckets shorter than the statistics period are read from the states
+    states = history.get_significant_states_downsampled(
+        hass,
+        start,
+        end,
+        ["sensor.power"],
+        2,
+        current_attributes=current_attributes,
+    )
+    assert [state["s"] for state in states["sensor.power"]] == ["10"]
+    # Without the current attributes the states are used
+    states = history.get_significant_states_downsampled(
+        hass, start, end, ["sensor.power"], 1
+    )
+    assert [state["s"] for state in states["sensor.power"]] == ["10"]
+    # The statistics are not used if the unit of the entity changed
+    states = history.get_significant_states_downsampled(
+        hass,
+        start,
+        end,
+        ["sensor.power"],
+        1,
+        current_attributes={"sensor.power": {**attributes, "unit_of_measurement": "W"}},
+    )
+    assert [state["s"] for state in states["sensor.power"]] == ["10"]
+    assert "min" not in states["sensor.power"][0]
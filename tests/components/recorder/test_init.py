@@ -20,6 +20,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT_STATES,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -1469,6 +1470,64 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize(
+    "recorder_config",
+    [
+        {CONF_BULK_INSERT_STATES: True},
+        {CONF_BULK_INSERT_STATES: True, CONF_COMMIT_INTERVAL: 30},
+    ],
+)
+async def test_bulk_insert_states_sets_old_state(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test bulk inserting states links old states and shares attributes."""
+    instance = get_instance(hass)
+    assert instance.states_bulk_buffer is not None
+
+    hass.states.async_set("test.one", "s1", {"name": "one"})
+    hass.states.async_set("test.two", "s2", {"name": "two"})
+    hass.states.async_set("test.one", "s3", {"name": "one"})
+    hass.states.async_set("test.one", "s4", {"name": "one"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.two", "s5", {"name": "two"})
+    hass.states.async_remove("test.one")
+    await async_wait_recording_done(hass)
+    assert len(instance.states_bulk_buffer) == 0
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes,
+                States.attributes_id == StateAttributes.attributes_id,
+            )
+        )
+        assert len(states) == 6
+        assert session.query(StateAttributes).count() == 3
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s5"].entity_id == "test.two"
+        assert states_by_state["s1"].shared_attrs == '{"name":"one"}'
+        assert states_by_state["s5"].shared_attrs == '{"name":"two"}'
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state[None].entity_id == "test.one"
+        assert states_by_state[None].old_state_id == states_by_state["s4"].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -12,7 +12,11 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
-from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
+from homeassistant.components.recorder import (
+    CONF_AUTO_PURGE_INCREMENTAL,
+    DOMAIN as RECORDER_DOMAIN,
+    Recorder,
+)
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
@@ -25,7 +29,11 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    INCREMENTAL_PURGE_BUCKET,
+    purge_old_data,
+    purge_old_data_incremental,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -208,6 +216,77 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
 
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{CONF_AUTO_PURGE_INCREMENTAL: True}])
+async def test_purge_old_data_incremental(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging old states one bucket at a time."""
+    now = dt_util.utcnow()
+    eleven_days_ago = now - timedelta(days=11)
+    five_days_ago = now - timedelta(days=5)
+    shared_attributes = {"shared": True}
+
+    for entity_id, state, attributes, timestamp in (
+        ("test.one", "old", {"old": True}, eleven_days_ago),
+        ("test.two", "old", shared_attributes, eleven_days_ago),
+        ("test.one", "older", {"older": True}, five_days_ago),
+        ("test.one", "new", {"new": True}, now),
+        ("test.two", "new", shared_attributes, now),
+    ):
+        hass.states.async_set(
+            entity_id, state, attributes, timestamp=timestamp.timestamp()
+        )
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 5
+        assert session.query(StateAttributes).count() == 4
+
+    purge_before = now - timedelta(days=4)
+    progress = recorder_mock.incremental_purge_progress
+
+    # The first run purges the bucket of eleven days ago, the shared
+    # attributes are known to be in use without checking the database
+    assert not purge_old_data_incremental(
+        recorder_mock, purge_before, repack=False, cleanup=False
+    )
+    bucket_start = (
+        eleven_days_ago.timestamp()
+        - eleven_days_ago.timestamp() % INCREMENTAL_PURGE_BUCKET
+    )
+    assert progress.purged_before == bucket_start + INCREMENTAL_PURGE_BUCKET
+    assert progress.states == 2
+    assert progress.state_attributes == 1
+    assert progress.in_use_from_cache == 1
+    with session_scope(hass=hass) as session:
+        assert {state.state for state in session.query(States)} == {
+            "older",
+            "new",
+        }
+        assert session.query(StateAttributes).count() == 3
+
+    # The second run purges the bucket of five days ago
+    assert not purge_old_data_incremental(
+        recorder_mock, purge_before, repack=False, cleanup=False
+    )
+    assert progress.states == 3
+    assert progress.state_attributes == 2
+    with session_scope(hass=hass) as session:
+        assert {state.state for state in session.query(States)} == {"new"}
+        assert session.query(StateAttributes).count() == 2
+
+    # Nothing older than purge_before is left
+    assert purge_old_data_incremental(
+        recorder_mock, purge_before, repack=False, cleanup=True
+    )
+    assert progress.purged_before == purge_before.timestamp()
+    assert progress.finished
+    assert progress.runs == 3
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        assert session.query(StateAttributes).count() == 2
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant,
 ) -> None:
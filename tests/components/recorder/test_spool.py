@@ -0,0 +1,290 @@
+"""The tests for the recorder spool."""
+
+import asyncio
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import CONF_SPOOL_MAX_SIZE, Recorder
+from homeassistant.components.recorder.const import SPOOL_DIRECTORY
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.spool import (
+    RecorderSpool,
+    event_from_spool_record,
+    event_to_spool_record,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    CoreState,
+    Event,
+    EventOrigin,
+    HomeAssistant,
+    State,
+)
+from homeassistant.helpers import recorder as recorder_helper
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _state_changed_event(entity_id: str, state: str) -> Event:
+    """Return a state changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": State(entity_id, state, {"unit_of_measurement": "W"}),
+        },
+    )
+
+
+def _recorded_states(hass: HomeAssistant, entity_id: str) -> list[States]:
+    """Return the recorded states of an entity, oldest first."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return list(
+            session.query(States.state_id, States.old_state_id, States.state)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
+            .order_by(States.state_id)
+        )
+
+
+def test_event_round_trip() -> None:
+    """Test events survive being spooled."""
+    old_state = State("sensor.power", "1", {"friendly_name": "Power"})
+    new_state = State(
+        "sensor.power",
+        "2",
+        {"friendly_name": "Power", "icon": "mdi:flash"},
+        context=Context(user_id="abc", parent_id="def"),
+        state_info={"unrecorded_attributes": frozenset({"icon"})},
+    )
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.power", "old_state": old_state, "new_state": new_state},
+        EventOrigin.remote,
+    )
+
+    record = event_to_spool_record(event)
+    assert record is not None
+    spooled = event_from_spool_record(record)
+    assert spooled is not None
+    assert spooled.event_type == EVENT_STATE_CHANGED
+    assert spooled.origin is EventOrigin.remote
+    assert spooled.time_fired_timestamp == event.time_fired_timestamp
+    assert spooled.context.id == event.context.id
+    assert spooled.data["old_state"].as_dict() == old_state.as_dict()
+    spooled_state = spooled.data["new_state"]
+    assert spooled_state.as_dict() == new_state.as_dict()
+    assert spooled_state.last_updated_timestamp == new_state.last_updated_timestamp
+    assert spooled_state.context.user_id == "abc"
+    assert spooled_state.context.parent_id == "def"
+    assert spooled_state.state_info == {"unrecorded_attributes": frozenset({"icon"})}
+
+    event = Event("test_event", {"number": 1}, context=Context(user_id="abc"))
+    record = event_to_spool_record(event)
+    assert record is not None
+    spooled = event_from_spool_record(record)
+    assert spooled is not None
+    assert spooled.event_type == "test_event"
+    assert spooled.data == {"number": 1}
+    assert spooled.context.user_id == "abc"
+
+
+def test_event_not_serializable(caplog: pytest.LogCaptureFixture) -> None:
+    """Test events that cannot be serialized are not spooled."""
+    assert event_to_spool_record(Event("test_event", {"bad": object()})) is None
+    assert "Event is not JSON serializable" in caplog.text
+
+
+def test_spool_append_and_read(tmp_path: Path) -> None:
+    """Test events are read back in order across segments."""
+    spool = RecorderSpool(str(tmp_path / "spool"), 1024**2)
+    assert spool.read_events(10) == []
+
+    with patch("homeassistant.components.recorder.spool.SPOOL_SEGMENT_MAX_SIZE", 100):
+        for i in range(5):
+            assert spool.append_events(
+                [_state_changed_event("sensor.power", f"{i}{j}") for j in range(2)]
+            )
+    assert len(list((tmp_path / "spool").iterdir())) == 5
+    assert spool.size > 0
+
+    events = spool.read_events(3)
+    assert [event.data["new_state"].state for event in events] == ["00", "01", "10"]
+    # The first segment has been read completely and is removed
+    assert len(list((tmp_path / "spool").iterdir())) == 4
+
+    events = spool.read_events(10)
+    assert [event.data["new_state"].state for event in events] == [
+        "11",
+        "20",
+        "21",
+        "30",
+        "31",
+        "40",
+        "41",
+    ]
+    assert spool.size == 0
+    assert list((tmp_path / "spool").iterdir()) == []
+
+
+def test_spool_full(tmp_path: Path) -> None:
+    """Test nothing is appended once the spool is full."""
+    spool = RecorderSpool(str(tmp_path), 1024**2)
+    assert spool.append_events([_state_changed_event("sensor.power", "1")])
+    size = spool.size
+    spool.max_size = size * 2
+    assert not spool.append_events(
+        [_state_changed_event("sensor.power", str(i)) for i in range(10)]
+    )
+    assert spool.size == size
+    assert len(spool.read_events(10)) == 1
+
+
+def test_spool_write_error(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test a failed write does not leave the spool unreadable."""
+    spool = RecorderSpool(str(tmp_path), 1024**2)
+    with patch(
+        "homeassistant.components.recorder.spool.open",
+        side_effect=OSError("No space left on device"),
+        create=True,
+    ):
+        assert not spool.append_events([_state_changed_event("sensor.power", "1")])
+    assert "No space left on device" in caplog.text
+    assert spool.size == 0
+    assert list(tmp_path.iterdir()) == []
+    assert spool.read_events(10) == []
+
+    assert spool.append_events([_state_changed_event("sensor.power", "2")])
+    size = spool.size
+    with patch(
+        "homeassistant.components.recorder.spool.open",
+        side_effect=OSError("No space left on device"),
+        create=True,
+    ):
+        assert not spool.append_events([_state_changed_event("sensor.power", "3")])
+    assert spool.size == size
+    assert spool.append_events([_state_changed_event("sensor.power", "4")])
+    events = spool.read_events(10)
+    assert [event.data["new_state"].state for event in events] == ["2", "4"]
+
+
+def test_spool_load(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test loading segments left over from a previous run."""
+    assert not RecorderSpool(str(tmp_path / "missing"), 1024**2).load()
+
+    spool = RecorderSpool(str(tmp_path), 1024**2)
+    assert spool.append_events([_state_changed_event("sensor.power", "1")])
+    assert spool.append_events([_state_changed_event("sensor.power", "2")])
+    # Simulate an unclean shutdown while writing a record
+    segment = next(tmp_path.iterdir())
+    segment.write_bytes(segment.read_bytes()[:-10])
+    (tmp_path / "00000005.spool").write_bytes(b"")
+
+    spool = RecorderSpool(str(tmp_path), 1024**2)
+    assert spool.load()
+    assert not (tmp_path / "00000005.spool").exists()
+    events = spool.read_events(10)
+    assert [event.data["new_state"].state for event in events] == ["1"]
+    assert "Skipping truncated record" in caplog.text
+    assert spool.size == 0
+
+    # New segments continue after the numbers left over
+    assert spool.append_events([_state_changed_event("sensor.power", "3")])
+    assert (tmp_path / "00000006.spool").exists()
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_SPOOL_MAX_SIZE: 1}])
+async def test_spooled_events_are_recorded(
+    hass: HomeAssistant, recorder_mock: Recorder, tmp_path: Path
+) -> None:
+    """Test events are recorded in order after being spooled."""
+    spool_path = tmp_path / "spool"
+    recorder_mock._spool.path = str(spool_path)
+
+    with patch("homeassistant.components.recorder.core.SPOOL_WRITE_INTERVAL", 0):
+        recorder_mock._async_start_spooling()
+        assert recorder_mock._spooling
+        hass.states.async_set("test.one", "s1")
+        hass.states.async_set("test.one", "s2")
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await async_wait_recording_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert not recorder_mock._spooling
+    assert list(spool_path.iterdir()) == []
+
+    states = _recorded_states(hass, "test.one")
+    assert [state.state for state in states] == ["s1", "s2"]
+    assert states[1].old_state_id == states[0].state_id
+
+    # New events go straight to the queue again
+    hass.states.async_set("test.one", "s3")
+    await async_wait_recording_done(hass)
+    assert not spool_path.exists() or list(spool_path.iterdir()) == []
+
+
+async def test_spool_replayed_before_queued_events(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test events spooled before the last shutdown are recorded first."""
+    spool_path = hass.config.path(SPOOL_DIRECTORY)
+    spool = RecorderSpool(spool_path, 1024**2)
+    assert spool.append_events([_state_changed_event("test.one", "s1")])
+
+    hass.set_state(CoreState.not_running)
+    recorder_helper.async_initialize_recorder(hass)
+    hass.async_create_task(
+        async_setup_recorder_instance(hass, {CONF_SPOOL_MAX_SIZE: 1})
+    )
+    await recorder_helper.async_wait_recorder(hass)
+    # Fired during startup, before the spool is replayed
+    hass.states.async_set("test.one", "s2")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await async_wait_recording_done(hass)
+
+    states = _recorded_states(hass, "test.one")
+    assert [state.state for state in states] == ["s1", "s2"]
+    assert states[1].old_state_id == states[0].state_id
+    assert list(Path(spool_path).iterdir()) == []
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_SPOOL_MAX_SIZE: 1}])
+async def test_spool_write_canceled(
+    hass: HomeAssistant, recorder_mock: Recorder, tmp_path: Path
+) -> None:
+    """Test the batch being written when the write task is canceled is kept."""
+    spool = recorder_mock._spool
+    spool.path = str(tmp_path / "spool")
+    append_events = spool.append_events
+    writing = threading.Event()
+    release = threading.Event()
+
+    def _blocking_append_events(events: list[Event]) -> bool:
+        writing.set()
+        release.wait()
+        return append_events(events)
+
+    with (
+        patch("homeassistant.components.recorder.core.SPOOL_WRITE_INTERVAL", 0),
+        patch.object(spool, "append_events", _blocking_append_events),
+    ):
+        recorder_mock._async_spool_event(_state_changed_event("sensor.power", "1"))
+        write_task = recorder_mock._spool_write_task
+        await hass.async_add_executor_job(writing.wait)
+        write_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await write_task
+        # Shutdown waits for the batch being written
+        assert (write_future := recorder_mock._spool_write_future) is not None
+        release.set()
+        assert await write_future
+
+    assert [event.data["new_state"].state for event in spool.read_events(10)] == ["1"]
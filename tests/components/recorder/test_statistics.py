@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -17,6 +21,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     PlatformCompiledStatistics,
+    StatisticsRow,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
@@ -35,6 +40,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import StatisticsAggregatesTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -1844,6 +1850,287 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+async def test_statistics_query_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics are cached until they are modified."""
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    period1 = zero - timedelta(hours=2)
+    period2 = zero - timedelta(hours=1)
+    statistic_id = "test:total_energy_import"
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+    query_cache = statistics.get_statistics_query_cache(hass)
+
+    def get_sums(period: str = "hour") -> list[float]:
+        stats = statistics_during_period(
+            hass, period1, period=period, statistic_ids={statistic_id}
+        )
+        return [row["sum"] for row in stats.get(statistic_id, [])]
+
+    assert get_sums() == []
+    async_add_external_statistics(
+        hass, external_metadata, ({"start": period1, "state": 0, "sum": 2},)
+    )
+    await async_wait_recording_done(hass)
+    assert get_sums() == [2]
+    assert get_sums() == [2]
+    assert query_cache.as_dict() == {
+        "size": 1,
+        "max_size": 256,
+        "rows": 1,
+        "max_rows": statistics.STATISTICS_QUERY_CACHE_MAX_ROWS,
+        "hits": 1,
+        "misses": 1,
+    }
+
+    # Modifying a returned result does not modify the cached result
+    stats = statistics_during_period(
+        hass, period1, period="hour", statistic_ids={statistic_id}
+    )
+    stats[statistic_id][0]["sum"] = 100
+    stats[statistic_id].clear()
+    assert get_sums() == [2]
+    assert query_cache.hits == 3
+
+    # Importing statistics invalidates the cached results
+    async_add_external_statistics(
+        hass, external_metadata, ({"start": period2, "state": 1, "sum": 3},)
+    )
+    await async_wait_recording_done(hass)
+    assert query_cache.as_dict()["size"] == 0
+    assert get_sums() == [2, 3]
+
+    # So does adjusting them
+    recorder_mock.async_adjust_statistics(statistic_id, period2, 5, "kWh")
+    await async_wait_recording_done(hass)
+    assert get_sums() == [2, 8]
+    assert query_cache.misses == 3
+
+    # Short term statistics are not cached
+    assert get_sums("5minute") == []
+    assert query_cache.as_dict() == {
+        "size": 1,
+        "max_size": 256,
+        "rows": 2,
+        "max_rows": statistics.STATISTICS_QUERY_CACHE_MAX_ROWS,
+        "hits": 3,
+        "misses": 3,
+    }
+
+
+def test_statistics_query_cache_bounded_by_rows() -> None:
+    """Test the statistics query cache is bounded by the number of rows."""
+    query_cache = statistics.StatisticsQueryCache(
+        max_size=10, max_rows=5, max_result_rows=3
+    )
+    key_1 = (frozenset({1}), "hour")
+    key_2 = (frozenset({2}), "hour")
+    key_3 = (frozenset({3}), "hour")
+    key_4 = (frozenset({4}), "hour")
+
+    def rows(count: int) -> list[StatisticsRow]:
+        return [{"start": float(i), "end": float(i + 1)} for i in range(count)]
+
+    query_cache.set(key_1, 0, {"test:1": rows(2)})
+    query_cache.set(key_2, 0, {"test:2": rows(2)})
+    assert query_cache.get(key_1) == {"test:1": rows(2)}
+    # The least recently used result is evicted to make room
+    query_cache.set(key_3, 0, {"test:3": rows(2)})
+    assert query_cache.get(key_2) is None
+    assert query_cache.get(key_3) == {"test:3": rows(2)}
+    assert query_cache.as_dict()["rows"] == 4
+
+    # Large results are not cached
+    query_cache.set(key_4, 0, {"test:4": rows(4)})
+    assert query_cache.get(key_4) is None
+    assert query_cache.get(key_1) is not None
+
+    # Replacing a result does not count its rows twice
+    query_cache.set(key_1, 0, {"test:1": rows(3)})
+    assert query_cache.as_dict()["rows"] == 5
+
+    query_cache.invalidate([1])
+    assert query_cache.as_dict()["rows"] == 2
+    query_cache.clear()
+    assert query_cache.as_dict()["rows"] == 0
+
+
+async def test_statistics_aggregates(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test days and months are read from the daily and monthly statistics."""
+    await async_wait_recording_done(hass)
+    status = statistics.get_statistics_aggregates_status(hass)
+    assert status.usable()
+
+    zero = dt_util.as_local(dt_util.utcnow()).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    ) - timedelta(days=40)
+    sum_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    mean_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    hours = [zero + timedelta(hours=6 * i) for i in range(150)]
+    async_add_external_statistics(
+        hass,
+        sum_metadata,
+        [{"start": start, "state": i, "sum": i * 2} for i, start in enumerate(hours)],
+    )
+    async_add_external_statistics(
+        hass,
+        mean_metadata,
+        [
+            {"start": start, "mean": i % 7, "min": i % 7 - 1, "max": i % 7 + 2}
+            for i, start in enumerate(hours)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    def get_statistics(period: str) -> dict[str, list[dict[str, Any]]]:
+        statistics.get_statistics_query_cache(hass).clear()
+        return statistics_during_period(
+            hass,
+            zero,
+            period=period,
+            statistic_ids={"test:total_energy_import", "test:temperature"},
+            types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+        )
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 76
+        assert session.query(StatisticsMonthly).count() > 2
+
+    for period in ("day", "month"):
+        with patch.object(
+            statistics.StatisticsAggregatesStatus, "usable", return_value=False
+        ):
+            expected = get_statistics(period)
+        assert get_statistics(period) == expected
+
+    # Adjusting statistics updates the daily and monthly sums
+    recorder_mock.async_adjust_statistics(
+        "test:total_energy_import", hours[100], 5, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    for period in ("day", "month"):
+        with patch.object(
+            statistics.StatisticsAggregatesStatus, "usable", return_value=False
+        ):
+            expected = get_statistics(period)
+        assert get_statistics(period) == expected
+
+    # The hourly statistics are used until the tables are rebuilt for a new
+    # time zone
+    await hass.config.async_set_time_zone("Asia/Tokyo")
+    assert not status.usable()
+    assert not status.maintained()
+    expected = {period: get_statistics(period) for period in ("day", "month")}
+    # The rebuild is only queued once until it is done
+    with patch.object(
+        recorder_mock, "queue_task", wraps=recorder_mock.queue_task
+    ) as mock_queue_task:
+        recorder_mock._async_five_minute_tasks(dt_util.utcnow())
+        assert status.pending
+        recorder_mock._async_five_minute_tasks(dt_util.utcnow())
+    assert (
+        sum(
+            isinstance(queued[0][0], StatisticsAggregatesTask)
+            for queued in mock_queue_task.call_args_list
+        )
+        == 1
+    )
+    await async_wait_recording_done(hass)
+    assert status.usable()
+    assert not status.pending
+    for period in ("day", "month"):
+        assert get_statistics(period) == expected[period]
+
+
+async def test_statistics_aggregates_restart_gap(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test hours compiled before the tables are maintained are caught up."""
+    await async_wait_recording_done(hass)
+    status = statistics.get_statistics_aggregates_status(hass)
+    assert status.usable()
+
+    day_start = dt_util.as_local(dt_util.utcnow()).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    ) - timedelta(days=2)
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [{"start": day_start - timedelta(hours=1), "state": 0, "sum": 0}]
+        + [
+            {"start": day_start + timedelta(hours=i), "state": i, "sum": i}
+            for i in range(1, 3)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    # Hours of the same day compiled while the recorder was catching up
+    # after a restart, before the tables were checked
+    status.time_zone = None
+    assert not status.maintained()
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [
+            {"start": day_start + timedelta(hours=i), "state": i, "sum": i}
+            for i in range(3, 6)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    status.pending = True
+    recorder_mock.queue_task(StatisticsAggregatesTask())
+    await async_wait_recording_done(hass)
+    assert status.usable()
+    assert not status.pending
+
+    statistics.get_statistics_query_cache(hass).clear()
+    stats = statistics_during_period(
+        hass,
+        day_start - timedelta(days=1),
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+        types={"sum"},
+    )
+    assert [
+        (row["start"], row["sum"]) for row in stats["test:total_energy_import"]
+    ] == [
+        ((day_start - timedelta(days=1)).timestamp(), 0),
+        (day_start.timestamp(), 5),
+    ]
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -21,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     get_short_term_statistics_run_cache,
     list_statistic_ids,
 )
+from homeassistant.components.recorder.tasks import IncrementalPurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.components.sensor import UNIT_CONVERTERS
@@ -3635,3 +3636,87 @@ async def test_import_statistics_with_last_reset(
             },
         ]
     }
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{recorder.CONF_AUTO_PURGE_INCREMENTAL: True}]
+)
+async def test_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test reporting the progress of the incremental purge."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "enabled": True,
+        "purge_before": None,
+        "purged_before": None,
+        "finished": False,
+        "runs": 0,
+        "states": 0,
+        "events": 0,
+        "state_attributes": 0,
+        "event_data": 0,
+        "in_use_from_cache": 0,
+    }
+
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    recorder_mock.queue_task(
+        IncrementalPurgeTask(purge_before, repack=False, cleanup=False)
+    )
+    await async_recorder_block_till_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["finished"] is True
+    assert response["result"]["runs"] == 1
+    assert response["result"]["purge_before"] == purge_before.timestamp()
+
+
+async def test_statistics_cache_info(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test reporting the size and hit rate of the statistics query cache."""
+    client = await hass_ws_client()
+    period = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=1
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        ({"start": period, "state": 0, "sum": 2},),
+    )
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/statistics_cache_info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"size": 0, "max_size": 256, "hits": 0, "misses": 0}
+
+    for _ in range(2):
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/statistics_during_period",
+                "start_time": period.isoformat(),
+                "statistic_ids": ["test:total_energy_import"],
+                "period": "hour",
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert len(response["result"]["test:total_energy_import"]) == 1
+
+    await client.send_json_auto_id({"type": "recorder/statistics_cache_info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"size": 1, "max_size": 256, "hits": 1, "misses": 1}
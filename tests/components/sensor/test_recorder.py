@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 import math
 from statistics import mean
+import sys
 from typing import Any, Literal
 from unittest.mock import patch
 
@@ -34,7 +35,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -247,6 +253,90 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_batch_mean_min_max() -> None:
+    """Test the batched calculation matches the calculation per sensor."""
+    start = dt_util.utcnow()
+    end = start + timedelta(minutes=5)
+
+    def fstates(entity_id: str, *values: tuple[float, float]):
+        return [
+            (
+                value,
+                State(entity_id, str(value), last_updated=start + timedelta(seconds=t)),
+            )
+            for t, value in values
+        ]
+
+    fstates_by_entity = {
+        # The first state is older than the period
+        "sensor.before": fstates("sensor.before", (-30, 10), (60, 20), (200, -5)),
+        # No state at the start of the period
+        "sensor.after": fstates("sensor.after", (30, 1), (90, 4.5)),
+        "sensor.single": fstates("sensor.single", (120, 7)),
+        # The only state is at the end of the period
+        "sensor.end": fstates("sensor.end", (300, 3)),
+    }
+    batched = sensor_recorder._batch_mean_min_max(fstates_by_entity, start, end)
+    assert batched == {
+        entity_id: (
+            pytest.approx(sensor_recorder._time_weighted_average(states, start, end)),
+            min(value for value, _ in states),
+            max(value for value, _ in states),
+        )
+        for entity_id, states in fstates_by_entity.items()
+    }
+    assert batched["sensor.end"] == (0.0, 3, 3)
+
+
+@patch("homeassistant.components.sensor.recorder.BATCH_COMPILE_MIN_ENTITIES", 1)
+@pytest.mark.parametrize("modules", [{}, {"numpy": None}])
+async def test_compile_hourly_statistics_batched(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    modules: dict[str, None],
+) -> None:
+    """Test compiling hourly statistics of sensors in one batch.
+
+    Without NumPy the statistics are compiled sensor by sensor.
+    """
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        await async_record_states(
+            hass, freezer, zero, "sensor.test1", POWER_SENSOR_ATTRIBUTES
+        )
+        await async_record_states(
+            hass, freezer, zero, "sensor.test2", POWER_SENSOR_ATTRIBUTES, [5, 5, 5]
+        )
+    await async_wait_recording_done(hass)
+
+    with patch.dict(sys.modules, modules):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        entity_id: [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(expected_mean),
+                "min": pytest.approx(expected_min),
+                "max": pytest.approx(expected_max),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+        for entity_id, expected_mean, expected_min, expected_max in (
+            ("sensor.test1", 13.050847, -10, 30),
+            ("sensor.test2", 5, 5, 5),
+        )
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
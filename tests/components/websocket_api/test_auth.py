@@ -4,9 +4,11 @@ from unittest.mock import patch
 
 import aiohttp
 from aiohttp import WSMsgType
+import ormsgpack
 import pytest
 
 from homeassistant.auth.providers.homeassistant import HassAuthProvider
+from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_INVALID,
@@ -14,6 +16,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import (
+    ENCODING_MSGPACK,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
@@ -296,3 +299,116 @@ async def test_auth_sending_unknown_type_disconnects(
         await ws._writer._send_frame(b"1" * 130, 0x30)
         auth_msg = await ws.receive()
         assert auth_msg.type == WSMsgType.close
+
+
+async def test_auth_msgpack_encoding(
+    hass: HomeAssistant, no_auth_websocket_client, hass_access_token: str
+) -> None:
+    """Test large results are sent as MessagePack once negotiated."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+    state = hass.states.get("light.kitchen")
+
+    await no_auth_websocket_client.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": hass_access_token,
+            "encoding": ENCODING_MSGPACK,
+        }
+    )
+    auth_msg = await no_auth_websocket_client.receive_json()
+    assert auth_msg["type"] == TYPE_AUTH_OK
+    assert auth_msg["encoding"] == ENCODING_MSGPACK
+
+    await no_auth_websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = ormsgpack.unpackb(await no_auth_websocket_client.receive_bytes())
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == [state.as_dict()]
+
+    await no_auth_websocket_client.send_json({"id": 6, "type": "subscribe_entities"})
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    msg = ormsgpack.unpackb(await no_auth_websocket_client.receive_bytes())
+    assert msg == {
+        "id": 6,
+        "type": "event",
+        "event": {"a": {"light.kitchen": state.as_compressed_state}},
+    }
+
+    # Changes are still sent as JSON
+    hass.states.async_set("light.kitchen", "off", {"brightness": 255})
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+
+
+async def test_msgpack_get_states_cached(
+    hass: HomeAssistant,
+    no_auth_websocket_client,
+    hass_access_token: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test get_states reuses the packed states until they change."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+    hass.states.async_set("light.bad", "on", {"bad": object()})
+    hass.states.async_set("light.hall", "off")
+
+    await no_auth_websocket_client.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": hass_access_token,
+            "encoding": ENCODING_MSGPACK,
+        }
+    )
+    auth_msg = await no_auth_websocket_client.receive_json()
+    assert auth_msg["type"] == TYPE_AUTH_OK
+
+    with patch.object(
+        messages.MsgpackStatesEncoder,
+        "serialize",
+        autospec=True,
+        side_effect=messages.MsgpackStatesEncoder.serialize,
+    ) as serialize_mock:
+        await no_auth_websocket_client.send_json({"id": 5, "type": "get_states"})
+        msg = ormsgpack.unpackb(await no_auth_websocket_client.receive_bytes())
+        assert msg == {
+            "id": 5,
+            "type": "result",
+            "success": True,
+            "result": [
+                hass.states.get("light.kitchen").as_dict(),
+                hass.states.get("light.hall").as_dict(),
+            ],
+        }
+        assert serialize_mock.call_count == 3
+        assert "Unable to serialize light.bad to MessagePack" in caplog.text
+
+        await no_auth_websocket_client.send_json({"id": 6, "type": "get_states"})
+        msg = ormsgpack.unpackb(await no_auth_websocket_client.receive_bytes())
+        assert msg["id"] == 6
+        assert len(msg["result"]) == 2
+        assert serialize_mock.call_count == 3
+
+        hass.states.async_set("light.hall", "on")
+        await no_auth_websocket_client.send_json({"id": 7, "type": "get_states"})
+        msg = ormsgpack.unpackb(await no_auth_websocket_client.receive_bytes())
+        assert [state["state"] for state in msg["result"]] == ["on", "on"]
+        assert serialize_mock.call_count == 4
+
+
+async def test_auth_unknown_encoding(
+    hass: HomeAssistant, no_auth_websocket_client, hass_access_token: str
+) -> None:
+    """Test unknown encodings fall back to JSON."""
+    await no_auth_websocket_client.send_json(
+        {"type": TYPE_AUTH, "access_token": hass_access_token, "encoding": "cbor"}
+    )
+    auth_msg = await no_auth_websocket_client.receive_json()
+    assert auth_msg["type"] == TYPE_AUTH_OK
+    assert "encoding" not in auth_msg
+
+    await no_auth_websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
@@ -11,7 +11,7 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import const, messages
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -1310,6 +1310,70 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_batches_changes(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test state changes are serialized once and sent as one message."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("light.three", "off")
+    other_client = await hass_ws_client(hass)
+
+    for client in (websocket_client, other_client):
+        await client.send_json({"id": 7, "type": "subscribe_entities"})
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert set(msg["event"]["a"]) == {"light.one", "light.two", "light.three"}
+
+    with patch(
+        "homeassistant.components.websocket_api.messages._state_diff_event",
+        wraps=messages._state_diff_event,
+    ) as state_diff_event_mock:
+        hass.states.async_set("light.one", "on")
+        hass.states.async_set("light.two", "on")
+        hass.states.async_remove("light.three")
+        hass.states.async_set("light.four", "on")
+
+        for client in (websocket_client, other_client):
+            msg = await client.receive_json()
+            assert msg["id"] == 7
+            assert msg["type"] == "event"
+            assert msg["event"] == {
+                "c": {
+                    "light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+                    "light.two": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+                },
+                "r": ["light.three"],
+                "a": {
+                    "light.four": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+                },
+            }
+    assert state_diff_event_mock.call_count == 4
+
+    # Changes of an entity are relative to its previous state
+    # and are not merged
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.one": True}}})
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_set("light.one", "off", {"color": "blue"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.one": {"+": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "off"}}
+        }
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"a": {"color": "blue"}, "c": ANY, "lu": ANY}}}
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1359,6 +1423,70 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_render_template_profile(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test profiling the renders of templates."""
+    hass.states.async_set("light.test", "on")
+
+    await websocket_client.send_json(
+        {"id": 5, "type": "render_template/profile", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": True, "templates": []}
+
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "render_template",
+            "template": "State is: {{ states('light.test') }}",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "State is: on"
+
+    hass.states.async_set("light.test", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "State is: off"
+
+    await websocket_client.send_json({"id": 7, "type": "render_template/profile"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["enabled"] is True
+    [profile] = msg["result"]["templates"]
+    assert profile["template"] == "State is: {{ states('light.test') }}"
+    assert profile["source"] == "websocket subscription 6"
+    assert profile["renders"] == 2
+    assert profile["triggers"] == {"setup": 1, "light.test": 1}
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "render_template/profile", "enabled": False, "limit": 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["enabled"] is False
+    assert len(msg["result"]["templates"]) == 1
+
+    await websocket_client.send_json({"id": 9, "type": "render_template/profile"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"enabled": False, "templates": []}
+
+
+async def test_render_template_profile_requires_admin(
+    websocket_client: MockHAClientWebSocket, hass_admin_user: MockUser
+) -> None:
+    """Test profiling the renders of templates without being admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "render_template/profile"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -3,7 +3,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -12,14 +12,22 @@ from homeassistant.components.websocket_api import (
     async_register_command,
     const,
     http,
+    messages,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import TYPE_AUTH, TYPE_AUTH_OK
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -345,6 +353,76 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_pending_msg_coalesce_entity_updates(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test entity updates are merged while the client is not keeping up."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = cast(ActiveConnection, instance._connection)
+
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two"}
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 2):
+        instance._send_message({"filler": 1})
+        instance._send_message({"filler": 2})
+    assert connection.backlogged
+
+    hass.states.async_set("light.one", "on", {"color": "red"})
+    hass.states.async_set("light.one", "on", {"color": "blue"})
+    hass.states.async_remove("light.two")
+    hass.states.async_set("light.three", "on")
+
+    assert await websocket_client.receive_json() == {"filler": 1}
+    assert await websocket_client.receive_json() == {"filler": 2}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.one": {
+                "a": {"color": "blue"},
+                "c": ANY,
+                "lc": ANY,
+                "lu": ANY,
+                "s": "on",
+            },
+            "light.three": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+        },
+        "r": ["light.two"],
+    }
+    assert not connection.backlogged
+
+    # Updates are sent as changes again once the client has caught up
+    hass.states.async_set("light.one", "off", {"color": "blue"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+    assert "Client unable to keep up with pending messages" not in caplog.text
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -451,6 +529,61 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+@pytest.mark.parametrize("coalesce", [True, False])
+async def test_binary_frames_not_coalesced(
+    hass: HomeAssistant,
+    no_auth_websocket_client: MockHAClientWebSocket,
+    hass_access_token: str,
+    coalesce: bool,
+) -> None:
+    """Test MessagePack messages are sent in their own binary frames."""
+
+    @callback
+    @websocket_command({"type": "send_mixed"})
+    def send_mixed(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        connection.send_message(messages.BinaryMessage(b"\x90"))
+        connection.send_event(msg["id"], "after")
+
+    async_register_command(hass, send_mixed)
+    ws = no_auth_websocket_client
+    await ws.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": hass_access_token,
+            "encoding": const.ENCODING_MSGPACK,
+        }
+    )
+    assert (await ws.receive_json())["type"] == TYPE_AUTH_OK
+    if coalesce:
+        await ws.send_json(
+            {
+                "id": 1,
+                "type": "supported_features",
+                "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+            }
+        )
+        assert (await ws.receive_json())["success"]
+
+    await ws.send_json({"id": 2, "type": "send_mixed"})
+    msg = await ws.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {
+        "id": 2,
+        "type": "result",
+        "success": True,
+        "result": None,
+    }
+    msg = await ws.receive()
+    assert msg.type is WSMsgType.BINARY
+    assert msg.data == b"\x90"
+    msg = await ws.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 2, "type": "event", "event": "after"}
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -523,3 +656,37 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_compressed_initial_states_sorted(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test the initial states are grouped by entity id when compressed."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.b", "1")
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("sensor.a", "2")
+
+    client = await hass_client()
+    async with client.ws_connect(const.URL, compress=15) as ws:
+        assert ws.compress == 15
+        assert (await ws.receive_json())["type"] == "auth_required"
+        await ws.send_json({"type": "auth", "access_token": hass_access_token})
+        assert (await ws.receive_json())["type"] == "auth_ok"
+
+        await ws.send_json({"id": 5, "type": "subscribe_entities"})
+        msg = await ws.receive_json()
+        assert msg["success"]
+        msg = await ws.receive_json()
+        assert list(msg["event"]["a"]) == ["light.a", "sensor.a", "sensor.b"]
+
+        await ws.send_json({"id": 6, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert [state["entity_id"] for state in msg["result"]] == [
+            "light.a",
+            "sensor.a",
+            "sensor.b",
+        ]
@@ -6,10 +6,13 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_change,
     message_to_json_bytes,
+    state_diffs_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -281,6 +284,47 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_state_diffs_message(hass: HomeAssistant) -> None:
+    """Test joining the changes of several state changed events."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.window", "off", {"brightness": 10})
+    hass.states.async_set("light.kitchen", "on", {"name": '"quoted"'})
+    hass.states.async_set("light.removed", "on")
+    hass.states.async_remove("light.removed")
+    await hass.async_block_till_done()
+
+    events = [
+        state_change_events[1],
+        state_change_events[2],
+        state_change_events[4],
+    ]
+    changes = [cached_state_diff_change(event) for event in events]
+    assert [change[0] for change in changes] == [b"c", b"a", b"r"]
+
+    message = json_loads(state_diffs_message(b"5", changes))
+    expected_event: dict = {}
+    for event in events:
+        for kind, change in _state_diff_event(event).items():
+            if kind == "r":
+                expected_event.setdefault(kind, []).extend(change)
+            else:
+                expected_event.setdefault(kind, {}).update(change)
+    assert message == {"id": 5, "type": "event", "event": expected_event}
+
+
+async def test_state_diff_change_unserializable(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a change that cannot be serialized is skipped."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"bad": _Unserializeable()})
+    await hass.async_block_till_done()
+
+    assert cached_state_diff_change(state_change_events[0]) is None
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -50,7 +50,13 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import (
+    StatesAggregate,
+    Template,
+    async_start_render_profiling,
+    async_stop_render_profiling,
+    result_as_boolean,
+)
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -651,6 +657,67 @@ async def test_async_track_state_added_domain_with_empty_list(
     unsub_single()
 
 
+async def test_keyed_trackers_use_bus_keyed_listeners(hass: HomeAssistant) -> None:
+    """Test keyed trackers register keyed listeners on the event bus."""
+    calls = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        calls.append(event.data["entity_id"])
+
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    unsub_entity = async_track_state_change_event(
+        hass, ["light.Bowl", "light.bowl"], run_callback
+    )
+    unsub_domain = async_track_state_added_domain(hass, "switch", run_callback)
+    unsub_match_all = async_track_state_added_domain(hass, MATCH_ALL, run_callback)
+
+    keyed_listeners = hass.bus._keyed_listeners[EVENT_STATE_CHANGED]
+    assert len(keyed_listeners["entity_id"]["light.bowl"]) == 1
+    assert len(keyed_listeners["domain"]["switch"]) == 1
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 3
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert sorted(calls) == [
+        "light.bowl",
+        "light.bowl",
+        "switch.kitchen",
+        "switch.kitchen",
+    ]
+
+    unsub_entity()
+    unsub_domain()
+    unsub_match_all()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+
+
+async def test_state_change_listener_removed_before_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test a listener removed after the event fired is not called."""
+    calls = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        calls.append(event)
+
+    unsub = async_track_state_change_event(hass, "light.bowl", run_callback)
+    unsub_kept = async_track_state_change_event(hass, "light.bowl", run_callback)
+    hass.states.async_set("light.bowl", "on")
+    # The listeners are dispatched on the next event loop iteration
+    assert calls == []
+    unsub()
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub_kept()
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
 async def test_async_track_state_removed_domain_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -3119,6 +3186,185 @@ async def test_track_template_result_refresh_cancel(hass: HomeAssistant) -> None
     assert refresh_runs == ["duck"]
 
 
+async def test_track_template_result_coalesced(hass: HomeAssistant) -> None:
+    """Test state changes in one loop iteration re-render a template once."""
+    template_sum = Template(
+        "{{ (states('sensor.one') | int(0)) + (states('sensor.two') | int(0)) }}",
+        hass,
+    )
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append((event and event.data["entity_id"], int(updates.pop().result)))
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_sum, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("sensor.unrelated", "3")
+    await hass.async_block_till_done()
+    assert runs == [("sensor.two", 3)]
+
+    hass.states.async_set("sensor.one", "5")
+    await hass.async_block_till_done()
+    assert runs == [("sensor.two", 3), ("sensor.one", 7)]
+
+    info.async_remove()
+    hass.states.async_set("sensor.one", "6")
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+
+async def test_track_template_result_profiling(hass: HomeAssistant) -> None:
+    """Test renders of tracked templates are profiled with their source."""
+    template_state = Template("{{ states('sensor.one') }}", hass)
+    async_start_render_profiling(hass)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_state, None)],
+        ha.callback(lambda event, updates: None),
+        source="sensor.owner",
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    info.async_refresh()
+
+    report = async_stop_render_profiling(hass)
+    assert len(report) == 1
+    assert report[0]["template"] == template_state.template
+    assert report[0]["source"] == "sensor.owner"
+    assert report[0]["renders"] == 3
+    assert report[0]["triggers"] == {"setup": 1, "sensor.one": 1, "refresh": 1}
+    info.async_remove()
+
+
+async def test_track_template_result_aggregate(hass: HomeAssistant) -> None:
+    """Test templates aggregating a domain are updated from state changes."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.three", "4", {"unit_of_measurement": "kW"})
+    template_sum = Template(
+        "{{ states.sensor | selectattr('attributes.unit_of_measurement', 'eq', 'W')"
+        " | map(attribute='state') | map('float') | sum }}",
+        hass,
+    )
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_sum, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+    assert info.listeners == {
+        "all": False,
+        "domains": {"sensor"},
+        "entities": set(),
+        "time": False,
+    }
+
+    # The states are not iterated again, the state changes are applied
+    # during the domain rate limit and rendered once it is released
+    with patch(
+        "homeassistant.helpers.template._state_generator"
+    ) as state_generator_mock:
+        hass.states.async_set("sensor.two", "5", {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.three", "4", {"unit_of_measurement": "W"})
+        await hass.async_block_till_done()
+        hass.states.async_remove("sensor.one")
+        await hass.async_block_till_done()
+        hass.states.async_set("sensor.four", "2", {"unit_of_measurement": "W"})
+        hass.states.async_set("light.one", "on")
+        await hass.async_block_till_done()
+        assert runs == []
+        assert info.listeners["domains"] == {"sensor"}
+
+        next_time = dt_util.utcnow() + timedelta(seconds=1.1)
+        with patch(
+            "homeassistant.helpers.ratelimit.time.time",
+            return_value=next_time.timestamp(),
+        ):
+            async_fire_time_changed(hass, next_time)
+            await hass.async_block_till_done()
+        assert runs == [11.0]
+
+    assert not state_generator_mock.called
+    assert template_sum.async_render() == 11.0
+
+    info.async_remove()
+
+
+async def test_track_template_result_aggregate_cost(hass: HomeAssistant) -> None:
+    """Test the cost of an aggregate update does not grow with the states."""
+    for i in range(100):
+        hass.states.async_set(f"sensor.s{i}", str(i))
+    template_sum = Template(
+        "{{ states.sensor | map(attribute='state') | map('float') | sum }}", hass
+    )
+    runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_sum, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    with (
+        patch.object(
+            StatesAggregate,
+            "_evaluate",
+            autospec=True,
+            side_effect=StatesAggregate._evaluate,
+        ) as evaluate_mock,
+        patch.object(
+            StatesAggregate,
+            "_render",
+            autospec=True,
+            side_effect=StatesAggregate._render,
+        ) as render_mock,
+    ):
+        for i in range(10):
+            hass.states.async_set(f"sensor.s{i}", str(i + 1))
+            await hass.async_block_till_done()
+        # Only the changed states are evaluated, the aggregate is
+        # rendered at most once per rate limit
+        assert evaluate_mock.call_count == 10
+        assert render_mock.call_count == 0
+
+        next_time = dt_util.utcnow() + timedelta(seconds=1.1)
+        with patch(
+            "homeassistant.helpers.ratelimit.time.time",
+            return_value=next_time.timestamp(),
+        ):
+            async_fire_time_changed(hass, next_time)
+            await hass.async_block_till_done()
+        assert render_mock.call_count == 1
+        assert evaluate_mock.call_count == 10
+
+    assert runs == [sum(range(100)) + 10.0]
+    info.async_remove()
+
+
 async def test_async_track_template_result_multiple_templates(
     hass: HomeAssistant,
 ) -> None:
@@ -12,6 +12,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
+    async_load_lazy_integration_platforms,
     async_process_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
@@ -99,6 +100,45 @@ async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     assert len(processed) == 2
 
 
+async def test_process_lazy_integration_platforms(hass: HomeAssistant) -> None:
+    """Test lazy integration platforms are only processed when loaded."""
+    loader.async_enable_lazy_platforms(hass)
+    hass.data[loader.DATA_LAZY_PLATFORMS].add("platform_to_check")
+
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    processed = []
+
+    async def _process_platform(
+        hass: HomeAssistant, domain: str, platform: Any
+    ) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "platform_to_check", _process_platform
+    )
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    assert processed == []
+    assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+    await async_load_lazy_integration_platforms(hass, "platform_to_check", ["event"])
+    assert processed == [("event", event_platform)]
+
+    await async_load_lazy_integration_platforms(hass, "platform_to_check")
+    assert processed == [("event", event_platform), ("loaded", loaded_platform)]
+
+    # Platforms are only processed once
+    await async_load_lazy_integration_platforms(hass, "platform_to_check")
+    assert len(processed) == 2
+
+
 async def test_process_integration_platforms_import_fails(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -0,0 +1,51 @@
+"""Test the startup trace helpers."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+async def test_startup_trace(hass: HomeAssistant) -> None:
+    """Test the setup of integrations is traced."""
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(hass, MockModule("comp_b", dependencies=["comp_a"]))
+    mock_integration(hass, MockModule("comp_c"))
+
+    assert await async_setup_component(hass, "comp_c", {})
+    startup_trace.async_enable_startup_trace(hass)
+    assert await async_setup_component(hass, "comp_b", {})
+
+    tracer = startup_trace.async_pop_startup_tracer(hass)
+    assert tracer is not None
+    assert startup_trace.async_pop_startup_tracer(hass) is None
+
+    spans = {(span.domain, span.name) for span in tracer.spans}
+    assert spans >= {
+        ("comp_a", startup_trace.SPAN_COMPONENT),
+        ("comp_a", startup_trace.SPAN_IMPORT),
+        ("comp_b", startup_trace.SPAN_COMPONENT),
+        ("comp_b", startup_trace.SPAN_IMPORT),
+        ("comp_b", startup_trace.SPAN_REQUIREMENTS),
+        ("comp_b", startup_trace.SPAN_WAIT_DEPENDENCIES),
+    }
+    assert not any(span.domain == "comp_c" for span in tracer.spans)
+
+    assert [domain for domain, _ in tracer.critical_path(hass)] == [
+        "comp_b",
+        "comp_a",
+    ]
+
+    trace = tracer.as_chrome_trace()
+    tracks = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert tracks.keys() == {"comp_a", "comp_b"}
+    assert {
+        (event["tid"], event["name"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    } == {(tracks[domain], name) for domain, name in spans}
@@ -0,0 +1,193 @@
+"""Test state snapshot helpers."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import state_snapshot
+from homeassistant.helpers.state_snapshot import (
+    StatesEncoder,
+    async_get_states_encoded,
+    async_get_states_json,
+)
+from homeassistant.util.json import json_loads
+
+from tests.common import MockUser
+
+
+async def test_states_json_cached(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test the snapshot is shared until a state changes."""
+    hass.states.async_set("sensor.b", "1")
+    hass.states.async_set("light.a", "on")
+
+    states_json = async_get_states_json(hass, hass_admin_user)
+    assert json_loads(states_json) == [
+        json_loads(hass.states.get("sensor.b").as_dict_json),
+        json_loads(hass.states.get("light.a").as_dict_json),
+    ]
+    assert async_get_states_json(hass, hass_admin_user) is states_json
+
+    sorted_json = async_get_states_json(hass, hass_admin_user, True)
+    assert [state["entity_id"] for state in json_loads(sorted_json)] == [
+        "light.a",
+        "sensor.b",
+    ]
+    assert async_get_states_json(hass, hass_admin_user) is states_json
+
+    hass.states.async_set("sensor.b", "2")
+    states_json = async_get_states_json(hass, hass_admin_user)
+    assert [state["state"] for state in json_loads(states_json)] == ["2", "on"]
+
+    hass.states.async_remove("light.a")
+    states_json = async_get_states_json(hass, hass_admin_user)
+    assert [state["entity_id"] for state in json_loads(states_json)] == ["sensor.b"]
+
+
+async def test_states_json_updated_per_entity(
+    hass: HomeAssistant, hass_admin_user: MockUser, hass_read_only_user: MockUser
+) -> None:
+    """Test only the changed entity is serialized again."""
+    hass.states.async_set("sensor.c", "1")
+    hass.states.async_set("light.a", "on")
+    hass_read_only_user.mock_policy({"entities": {"entity_ids": {"light.a": True}}})
+    async_get_states_json(hass, hass_admin_user)
+    async_get_states_json(hass, hass_admin_user, True)
+    async_get_states_json(hass, hass_read_only_user)
+
+    with patch(
+        "homeassistant.helpers.state_snapshot._serialize_state",
+        wraps=state_snapshot._serialize_state,
+    ) as serialize_mock:
+        hass.states.async_set("sensor.c", "2")
+        hass.states.async_set("sensor.b", "1")
+        hass.states.async_set("light.a", "off")
+        assert serialize_mock.call_count == 0
+
+        states_json = async_get_states_json(hass, hass_admin_user)
+        assert serialize_mock.call_count == 3
+        assert [
+            (state["entity_id"], state["state"]) for state in json_loads(states_json)
+        ] == [("sensor.c", "2"), ("light.a", "off"), ("sensor.b", "1")]
+
+        sorted_json = async_get_states_json(hass, hass_admin_user, True)
+        assert [state["entity_id"] for state in json_loads(sorted_json)] == [
+            "light.a",
+            "sensor.b",
+            "sensor.c",
+        ]
+
+        serialize_mock.reset_mock()
+        read_only_json = async_get_states_json(hass, hass_read_only_user)
+        assert serialize_mock.call_count == 1
+        assert [
+            (state["entity_id"], state["state"]) for state in json_loads(read_only_json)
+        ] == [("light.a", "off")]
+
+    # A removed and added again entity moves to the end like in the state machine
+    hass.states.async_remove("sensor.c")
+    hass.states.async_set("sensor.c", "3")
+    states_json = async_get_states_json(hass, hass_admin_user)
+    assert [state["entity_id"] for state in json_loads(states_json)] == [
+        state.entity_id for state in hass.states.async_all()
+    ]
+
+
+async def test_states_json_permissions(
+    hass: HomeAssistant, hass_admin_user: MockUser, hass_read_only_user: MockUser
+) -> None:
+    """Test the snapshot only contains the states a user can read."""
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("light.b", "off")
+    admin_json = async_get_states_json(hass, hass_admin_user)
+
+    hass_read_only_user.mock_policy({"entities": {"entity_ids": {"light.a": True}}})
+    states_json = async_get_states_json(hass, hass_read_only_user)
+    assert [state["entity_id"] for state in json_loads(states_json)] == ["light.a"]
+    assert async_get_states_json(hass, hass_read_only_user) is states_json
+    assert async_get_states_json(hass, hass_admin_user) is admin_json
+
+    # A new policy is applied right away
+    hass_read_only_user.mock_policy({"entities": {"entity_ids": {"light.b": True}}})
+    states_json = async_get_states_json(hass, hass_read_only_user)
+    assert [state["entity_id"] for state in json_loads(states_json)] == ["light.b"]
+
+
+async def test_states_json_not_serializable(
+    hass: HomeAssistant, hass_admin_user: MockUser, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test states that cannot be serialized are left out."""
+    hass.states.async_set("light.a", "on", {"bad": object()})
+    hass.states.async_set("light.b", "off")
+
+    states_json = async_get_states_json(hass, hass_admin_user)
+    assert [state["entity_id"] for state in json_loads(states_json)] == ["light.b"]
+    assert "Unable to serialize to JSON. Bad data found" in caplog.text
+
+
+async def test_states_encoded(
+    hass: HomeAssistant, hass_admin_user: MockUser, hass_read_only_user: MockUser
+) -> None:
+    """Test snapshots are kept per encoder."""
+
+    class StateEncoder(StatesEncoder):
+        """Encode the state values only."""
+
+        __slots__ = ()
+
+        def serialize(self, state: State) -> bytes | None:
+            return state.state.encode()
+
+        def join(self, serialized: list[bytes]) -> bytes:
+            return b"|".join(serialized)
+
+    encoder = StateEncoder()
+    hass.states.async_set("sensor.b", "1")
+    hass.states.async_set("light.a", "on")
+    hass_read_only_user.mock_policy({"entities": {"entity_ids": {"light.a": True}}})
+
+    states_json = async_get_states_json(hass, hass_admin_user)
+    encoded = async_get_states_encoded(hass, hass_admin_user, encoder)
+    assert encoded == b"1|on"
+    assert async_get_states_encoded(hass, hass_admin_user, encoder) is encoded
+    assert async_get_states_encoded(hass, hass_admin_user, encoder, True) == b"on|1"
+    assert async_get_states_encoded(hass, hass_read_only_user, encoder) == b"on"
+    assert async_get_states_json(hass, hass_admin_user) is states_json
+
+    hass.states.async_set("sensor.b", "2")
+    assert async_get_states_encoded(hass, hass_admin_user, encoder) == b"2|on"
+
+
+async def test_idle_snapshots_dropped(
+    hass: HomeAssistant,
+    hass_admin_user: MockUser,
+    hass_read_only_user: MockUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test snapshots not requested for a while are dropped."""
+    hass.states.async_set("light.a", "on")
+    hass_read_only_user.mock_policy({"entities": {"entity_ids": {"light.a": True}}})
+    async_get_states_json(hass, hass_admin_user)
+    async_get_states_json(hass, hass_read_only_user)
+    snapshots = hass.data[state_snapshot.DATA_STATE_SNAPSHOTS]._snapshots
+    assert len(snapshots) == 2
+
+    freezer.tick(timedelta(seconds=state_snapshot.SNAPSHOT_IDLE_TIMEOUT - 100))
+    async_get_states_json(hass, hass_admin_user)
+    hass.states.async_set("light.a", "off")
+    assert len(snapshots) == 2
+
+    freezer.tick(timedelta(seconds=200))
+    hass.states.async_set("light.a", "on")
+    assert [key[0] for key in snapshots] == [None]
+
+    # A dropped snapshot is created again when requested
+    read_only_json = async_get_states_json(hass, hass_read_only_user)
+    assert [
+        (state["entity_id"], state["state"]) for state in json_loads(read_only_json)
+    ] == [("light.a", "on")]
+    assert len(snapshots) == 2
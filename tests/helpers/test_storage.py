@@ -1071,6 +1071,82 @@ async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_store_manager_snapshot(tmpdir: py.path.local) -> None:
+    """Test store manager preloads keys from the storage snapshot."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        storage_dir = config_dir.mkdir(".storage")
+        for key in ("integration1", "integration2"):
+            storage_dir.join(key).write_binary(
+                json_bytes({"data": {key: key}, "version": 1})
+            )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+    snapshot_path = config_dir.join(".storage", storage.STORAGE_SNAPSHOT_FILE)
+
+    async def _async_load_keys(start: bool = True) -> dict[str, Any]:
+        async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+            store_manager = storage.get_internal_store_manager(hass)
+            store_manager.async_enable_snapshot(["integration1", "integration2"])
+            await store_manager.async_initialize()
+            result = {
+                key: await storage.Store(hass, 1, key).async_load()
+                for key in ("integration1", "integration2")
+            }
+            if start:
+                hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+                await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+        return result
+
+    expected = {
+        "integration1": {"integration1": "integration1"},
+        "integration2": {"integration2": "integration2"},
+    }
+    # The snapshot is not written before startup is done
+    assert await _async_load_keys(start=False) == expected
+    assert not await loop.run_in_executor(None, snapshot_path.exists)
+
+    with patch.object(
+        storage.json_util, "load_json", wraps=storage.json_util.load_json
+    ) as mock_load_json:
+        assert await _async_load_keys() == expected
+    assert mock_load_json.call_count == 2
+    assert os.stat(snapshot_path.strpath).st_mode & 0o077 == 0
+
+    with patch.object(
+        storage.json_util, "load_json", wraps=storage.json_util.load_json
+    ) as mock_load_json:
+        assert await _async_load_keys() == expected
+    assert mock_load_json.call_count == 0
+
+    # Edits to the JSON files are picked up
+    await loop.run_in_executor(
+        None,
+        config_dir.join(".storage", "integration2").write_binary,
+        json_bytes({"data": {"integration2": "changed"}, "version": 1}),
+    )
+    expected["integration2"] = {"integration2": "changed"}
+    with patch.object(
+        storage.json_util, "load_json", wraps=storage.json_util.load_json
+    ) as mock_load_json:
+        assert await _async_load_keys() == expected
+    assert mock_load_json.call_count == 1
+
+    # A snapshot written by another Python version is not used
+    with (
+        patch.object(storage, "_STORAGE_SNAPSHOT_HEADER", (1, (2, 7))),
+        patch.object(
+            storage.json_util, "load_json", wraps=storage.json_util.load_json
+        ) as mock_load_json,
+    ):
+        assert await _async_load_keys() == expected
+    assert mock_load_json.call_count == 2
+
+
 async def test_store_manager_cleanup_after_started(
     tmpdir: py.path.local, freezer: FrozenDateTimeFactory
 ) -> None:
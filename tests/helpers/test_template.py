@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+import gc
 import json
 import logging
 import math
@@ -22,6 +23,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -53,7 +55,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import UnitSystem
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, async_capture_events, async_fire_time_changed
 
 
 def _set_up_units(hass: HomeAssistant) -> None:
@@ -5152,22 +5154,250 @@ async def test_cache_garbage_collection() -> None:
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    cache = template.CompiledTemplateCache(2)
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE", cache):
+        tpl = template.Template(
+            (template_string),
+        )
+        tpl.ensure_valid()
+        assert cache.get(template_string, "normal")
+
+        tpl2 = template.Template(
+            (template_string),
+        )
+        tpl2.ensure_valid()
+        assert cache.get(template_string, "normal")
+
+        del tpl
+        gc.collect()
+        assert cache.get(template_string, "normal")
+        del tpl2
+        gc.collect()
+        # Recently compiled templates are kept alive up to the LRU size
+        assert cache.get(template_string, "normal")
+
+        other_strings = ["{{ 'other' }} {{ 1 }}", "{{ 'other' }} {{ 2 }}"]
+        for other_string in other_strings:
+            template.Template(other_string).ensure_valid()
+        gc.collect()
+        assert all(cache.get(other_string, "normal") for other_string in other_strings)
+        # Evicted from the LRU and no longer used by any template
+        assert not cache.get(template_string, "normal")
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') | float(0) * 2 }}",
+        "{{ states('sensor.missing') | float(0) + 1 }}",
+        "{{ is_state('binary_sensor.door', 'on') }}",
+        "{{ is_state('binary_sensor.door', ['off', 'open']) }}",
+        "{{ state_attr('sensor.power', 'unit_of_measurement') }}",
+        "{{ is_state_attr('sensor.power', 'unit_of_measurement', 'W') }}",
+        "{{ has_value('sensor.power') and not has_value('sensor.missing') }}",
+        "{{ states('sensor.power', with_unit=True) }}",
+        "{{ -float(states('sensor.power')) // 2 if 1 < 2 <= 3 else 0 }}",
+        "{{ (states('sensor.power') | float) in (21.5, 22) }}",
+        "Power: {{ states('sensor.power') | float | round(0) }} W",
+        "{{ states('sensor.missing') | float }}",
+        "{{ 1 / 0 }}",
+    ],
+)
+async def test_native_template(hass: HomeAssistant, template_str: str) -> None:
+    """Test native templates render like Jinja templates."""
+    hass.states.async_set("sensor.power", "21.5", {"unit_of_measurement": "W"})
+    hass.states.async_set("binary_sensor.door", "on")
+
+    tpl = template.Template(template_str, hass)
+    info = tpl.async_render_to_info()
+    assert tpl._native is not None
+
+    jinja_tpl = template.Template(template_str, hass)
+    jinja_tpl.ensure_valid()
+    jinja_tpl._ensure_compiled()
+    jinja_tpl._native = None
+    jinja_info = jinja_tpl.async_render_to_info()
+
+    if jinja_info.exception:
+        assert str(info.exception) == str(jinja_info.exception)
+    else:
+        assert info.result() == jinja_info.result()
+        assert type(info.result()) is type(jinja_info.result())
+    assert info.entities == jinja_info.entities
+    assert info.domains == jinja_info.domains
+    assert info.domains_lifecycle == jinja_info.domains_lifecycle
+    assert info.all_states == jinja_info.all_states
+    assert info.rate_limit == jinja_info.rate_limit
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ value }}",
+        "{{ states.sensor.power.state }}",
+        "{{ states('sensor.power') ~ 'W' }}",
+        "{{ states('sensor.power') | state_attr('unit_of_measurement') }}",
+        "{{ now() }}",
+        "{% if true %}{{ states('sensor.power') }}{% endif %}",
+        "{{ '%s' % states('sensor.power') }}",
+    ],
+)
+async def test_native_template_unsupported(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates which are rendered by Jinja."""
+    tpl = template.Template(template_str, hass)
+    tpl.async_render_to_info()
+    assert tpl._native is None
+
+
+async def test_native_template_shadowed(hass: HomeAssistant) -> None:
+    """Test variables shadowing globals are used instead of native templates."""
+    hass.states.async_set("sensor.power", "21.5")
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    assert tpl.async_render() == 21.5
+    assert tpl._native is not None
+    assert tpl.async_render({"states": lambda entity_id: "shadowed"}) == "shadowed"
+    assert tpl.async_render({"power": 1}) == 21.5
+
+
+async def test_states_aggregate(hass: HomeAssistant) -> None:
+    """Test aggregates over states are updated from state changes."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("switch.one", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for template_str in (
+        "{{ states | selectattr('state', 'eq', 'on') | list | count }}",
+        "{{ states.light | map(attribute='entity_id') | join(', ') }}",
+        "{{ states.light | rejectattr('state', 'in', ['off']) | list | length }}",
+    ):
+        tpl = template.Template(template_str, hass)
+        aggregate = template.async_states_aggregate(tpl)
+        assert aggregate is not None
+        aggregate.async_reset()
+        info = tpl.async_render_to_info()
+        assert aggregate.async_render_to_info(info).result() == info.result()
+
     tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+        "{{ states.light | map(attribute='entity_id') | join(', ') }}", hass
+    )
+    aggregate = template.async_states_aggregate(tpl)
+    assert aggregate is not None
+    aggregate.async_reset()
+    info = tpl.async_render_to_info()
+    assert aggregate.domain == "light"
+
+    hass.states.async_remove("light.one")
+    hass.states.async_set("light.three", "on")
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("switch.two", "on")
+    await hass.async_block_till_done()
+    for event in events:
+        aggregate.async_apply(event)
+    assert aggregate.async_render_to_info(info).result() == tpl.async_render()
+    assert tpl.async_render() == "light.two, light.three, light.one"
+
+    # The aggregate renders with the environment of the template
+    tpl = template.Template(
+        "{{ states.light | map(attribute='missing') | join(', ') }}", hass
+    )
+    info = tpl.async_render_to_info(strict=True)
+    assert isinstance(info.exception, TemplateError)
+    aggregate = template.async_states_aggregate(tpl)
+    assert aggregate is not None
+    aggregate.async_reset()
+    assert isinstance(aggregate.async_render_to_info(info).exception, TemplateError)
+
+    for template_str in (
+        "{{ states.light | count }}",
+        "{{ states.light | list | count }} {{ states.switch | list | count }}",
+        "{{ states.light | map(attribute='entity_id') | map('area_name') | list }}",
+        "{{ states.light | selectattr('entity_id', 'is_state', 'on') | list }}",
+        "{{ states.light | selectattr('state', 'eq', value) | list }}",
+        "{{ states.light.one | list }}",
+        "{{ (states.light | list)[0] }}",
+    ):
+        tpl = template.Template(template_str, hass)
+        assert template.async_states_aggregate(tpl) is None
 
-    tpl2 = template.Template(
-        (template_string),
-    )
-    tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test templates with the same source share their compiled code."""
+    cache = template.COMPILED_TEMPLATE_CACHE
+    cache.clear()
+    template_string = "{{ 'shared' ~ states('sensor.compiled_cache') }}"
+    stats = cache.stats()
+
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+    assert tpl.async_render() == "sharedunknown"
+    assert tpl2.async_render() == "sharedunknown"
+    assert tpl._compiled_code is tpl2._compiled_code
+    assert cache.stats()["compiles"] == stats["compiles"] + 1
+    assert cache.stats()["hits"] == stats["hits"] + 1
+
+    # A template recreated after the others are gone reuses the code
+    del tpl, tpl2
+    gc.collect()
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    assert tpl._compiled_code is not None
+    assert cache.stats()["compiles"] == stats["compiles"] + 1
+
+    # The code is only shared with environments of the same kind
+    assert template.TemplateEnvironment(hass, limited=True).flavor == "limited"
+    assert template.TemplateEnvironment(hass, strict=True).flavor == "strict"
+    assert cache.get(template_string, "limited") is None
+
+
+async def test_render_profiling(hass: HomeAssistant) -> None:
+    """Test recording the render times of templates."""
+    cheap = template.Template("{{ states('sensor.cheap') }}", hass)
+    expensive = template.Template("{% for i in range(1000) %}{{ i }}{% endfor %}", hass)
+    assert template.async_render_profile_report(hass) == []
+
+    # Nothing is recorded until profiling is started
+    cheap.async_render()
+    assert not template.async_render_profiling_enabled(hass)
+
+    template.async_start_render_profiling(hass)
+    assert template.async_render_profiling_enabled(hass)
+    cheap.async_render()
+    token = template.template_render_source_cv.set(("sensor.owner", "sensor.cheap"))
+    try:
+        cheap.async_render()
+        cheap.async_render()
+        expensive.async_render()
+    finally:
+        template.template_render_source_cv.reset(token)
+    # Static templates are not rendered
+    template.Template("static", hass).async_render()
+
+    report = template.async_render_profile_report(hass)
+    assert report[0]["template"] == expensive.template
+    assert {
+        (profile["template"], profile["source"]): (
+            profile["renders"],
+            profile["triggers"],
+        )
+        for profile in report
+    } == {
+        (expensive.template, "sensor.owner"): (1, {"sensor.cheap": 1}),
+        (cheap.template, "sensor.owner"): (2, {"sensor.cheap": 2}),
+        (cheap.template, None): (1, {}),
+    }
+    for profile in report:
+        assert 0 < profile["mean_time"] <= profile["p99_time"] <= profile["max_time"]
+        assert profile["total_time"] >= profile["max_time"]
+        assert 0 < profile["renders_per_second"] <= profile["renders"]
+    assert len(template.async_render_profile_report(hass, 1)) == 1
+
+    assert template.async_stop_render_profiling(hass) == report
+    assert not template.async_render_profiling_enabled(hass)
+    assert template.async_render_profile_report(hass) == []
+    assert template.async_stop_render_profiling(hass) == []
 
 
 def test_is_template_string() -> None:
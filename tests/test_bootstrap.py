@@ -4,8 +4,10 @@ import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
 import glob
+import json
 import logging
 import os
+from pathlib import Path
 import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -22,6 +24,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import startup_trace
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
@@ -1524,3 +1527,21 @@ def test_should_rollover_is_always_false() -> None:
         ).shouldRollover(Mock())
         is False
     )
+
+
+async def test_startup_trace_written(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the startup trace is written once integrations are set up."""
+    hass.config.config_dir = str(tmp_path)
+    mock_integration(hass, MockModule("comp_a"))
+    startup_trace.async_enable_startup_trace(hass)
+
+    await bootstrap._async_set_up_integrations(hass, {"comp_a": {}})
+
+    assert "comp_a" in hass.config.components
+    assert startup_trace.DATA_STARTUP_TRACER not in hass.data
+    trace = json.loads((tmp_path / startup_trace.STARTUP_TRACE_FILE).read_text())
+    assert any(event.get("cat") == "comp_a" for event in trace["traceEvents"])
+    assert "Startup trace written to" in caplog.text
+    assert "comp_a (" in caplog.text
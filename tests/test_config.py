@@ -496,6 +496,76 @@ def test_load_yaml_config_preserves_key_order() -> None:
     ]
 
 
+def test_load_cached_yaml_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the parsed configuration is cached until a dependency changes."""
+    config_path = tmp_path / config_util.YAML_CONFIG_FILE
+    cache_path = str(tmp_path / ".storage" / config_util.CONFIG_CACHE_FILE)
+    config_path.write_text(
+        "sensor: !include sensor.yaml\n"
+        "password: !secret password\n"
+        "name: !env_var CONFIG_CACHE_NAME\n"
+    )
+    (tmp_path / "sensor.yaml").write_text("- platform: a\n")
+    (tmp_path / SECRET_YAML).write_text("password: pwd\n")
+    monkeypatch.setenv("CONFIG_CACHE_NAME", "home")
+
+    def load() -> dict:
+        return config_util.load_cached_yaml_config_file(
+            str(config_path), cache_path, config_util.Secrets(tmp_path)
+        )
+
+    expected = {"sensor": [{"platform": "a"}], "password": "pwd", "name": "home"}
+    assert load() == expected
+    assert os.stat(cache_path).st_mode & 0o077 == 0
+
+    with patch.object(config_util, "load_yaml_config_file") as mock_load:
+        assert load() == expected
+    assert len(mock_load.mock_calls) == 0
+
+    (tmp_path / "sensor.yaml").write_text("- platform: bb\n")
+    assert load()["sensor"] == [{"platform": "bb"}]
+
+    (tmp_path / SECRET_YAML).write_text("password: changed\n")
+    assert load()["password"] == "changed"
+
+    monkeypatch.setenv("CONFIG_CACHE_NAME", "away")
+    assert load()["name"] == "away"
+
+    config_path.write_text(
+        "sensor: !include sensor.yaml\n"
+        "password: !secret password\n"
+        "name: !env_var CONFIG_CACHE_NAME\n"
+        "extra: added\n"
+    )
+    assert load()["extra"] == "added"
+    with patch.object(config_util, "load_yaml_config_file") as mock_load:
+        config = load()
+    assert len(mock_load.mock_calls) == 0
+    assert config["extra"] == "added"
+    # The file and line of the nodes are kept in the cache
+    assert config["extra"].__config_file__ == str(config_path)
+    assert config["extra"].__line__ == 4
+
+    # A secrets.yaml added next to the file that uses the secret takes precedence
+    (tmp_path / "packages").mkdir()
+    (tmp_path / "packages" / "sensor.yaml").write_text("- platform: !secret password\n")
+    config_path.write_text("sensor: !include packages/sensor.yaml\n")
+    assert load()["sensor"] == [{"platform": "changed"}]
+    (tmp_path / "packages" / SECRET_YAML).write_text("password: nested\n")
+    assert load()["sensor"] == [{"platform": "nested"}]
+
+    with (
+        patch.object(config_util, "__version__", "0.0.0"),
+        patch.object(
+            config_util, "load_yaml_config_file", return_value={}
+        ) as mock_load,
+    ):
+        assert load() == {}
+    assert len(mock_load.mock_calls) == 1
+
+
 async def test_create_default_config_returns_none_if_write_error(
     hass: HomeAssistant,
 ) -> None:
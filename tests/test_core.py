@@ -60,7 +60,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     ServiceValidationError,
 )
-from homeassistant.helpers.json import json_dumps
+from homeassistant.helpers.json import json_bytes, json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
@@ -1011,6 +1011,28 @@ def test_state_as_dict_json() -> None:
     assert state.as_dict_json is as_dict_json_1
 
 
+async def test_state_attributes_json_fragment_shared(hass: HomeAssistant) -> None:
+    """Test states with unchanged attributes share their JSON."""
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    state_1 = hass.states.get("sensor.power")
+    assert state_1.as_dict_json == json_bytes(state_1.as_dict())
+    assert (
+        state_1.as_compressed_state_json
+        == (json_bytes({"sensor.power": state_1.as_compressed_state})[1:-1])
+    )
+
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    state_2 = hass.states.get("sensor.power")
+    assert state_2.attributes is state_1.attributes
+    assert state_2.attributes_json_fragment is state_1.attributes_json_fragment
+    assert state_2.as_dict_json == json_bytes(state_2.as_dict())
+
+    hass.states.async_set("sensor.power", "3", {"unit_of_measurement": "kW"})
+    state_3 = hass.states.get("sensor.power")
+    assert state_3.attributes_json_fragment is not state_2.attributes_json_fragment
+    assert state_3.as_dict_json == json_bytes(state_3.as_dict())
+
+
 def test_state_json_fragment() -> None:
     """Test state JSON fragments."""
     last_time = datetime(1984, 12, 8, 12, 0, 0)
@@ -1169,6 +1191,150 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners are only called for matching keys."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus._async_listen_filterable_job(
+        "test",
+        (ha.HassJob(listener), None),
+        ("entity_id", ["light.kitchen", "light.living_room"]),
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.living_room",
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    assert "test" not in hass.bus._keyed_listeners
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_eventbus_keyed_listener_domain_and_filter(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed listeners by domain still run the event filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    unsub = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(listener), mock_filter), ("domain", "light")
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_on"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert calls[0].data == {"entity_id": "light.kitchen"}
+    assert calls[1].data == {"domain": "light", "service": "turn_on"}
+
+    unsub()
+
+
+async def test_eventbus_keyed_listener_duplicate_keys(hass: HomeAssistant) -> None:
+    """Test a keyed listener with duplicate keys is only called once per event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(listener), None), ("entity_id", ["a.b", "a.b"])
+    )
+    assert len(hass.bus._keyed_listeners["test"]["entity_id"]["a.b"]) == 1
+
+    hass.bus.async_fire("test", {"entity_id": "a.b"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+    assert "test" not in hass.bus._keyed_listeners
+
+
+async def test_eventbus_keyed_listener_order(hass: HomeAssistant) -> None:
+    """Test keyed listeners are called after unkeyed listeners."""
+    calls = []
+
+    @ha.callback
+    def keyed_listener(event):
+        """Mock keyed listener."""
+        calls.append("keyed")
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append("unkeyed")
+
+    unsub_keyed = hass.bus._async_listen_filterable_job(
+        "test", (ha.HassJob(keyed_listener), None), ("entity_id", "a.b")
+    )
+    unsub = hass.bus.async_listen("test", listener)
+
+    hass.bus.async_fire("test", {"entity_id": "a.b"})
+    await hass.async_block_till_done()
+    assert calls == ["unkeyed", "keyed"]
+
+    unsub_keyed()
+    unsub()
+
+
+async def test_eventbus_dispatch_stats(hass: HomeAssistant) -> None:
+    """Test collecting dispatch timings per event type."""
+    assert hass.bus.async_dispatch_stats() == {}
+
+    hass.bus.async_set_dispatch_stats(True)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test_other")
+
+    stats = hass.bus.async_dispatch_stats()
+    assert stats["test"]["count"] == 2
+    assert stats["test_other"]["count"] == 1
+    assert stats["test"]["total"] >= stats["test"]["max"] >= 0
+    assert stats["test"]["mean"] == stats["test"]["total"] / 2
+
+    hass.bus.async_set_dispatch_stats(True)
+    assert hass.bus.async_dispatch_stats() == {}
+
+    hass.bus.async_set_dispatch_stats(False)
+    hass.bus.async_fire("test")
+    assert hass.bus.async_dispatch_stats() == {}
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+import importlib.util
 import os
 import pathlib
 import sys
@@ -14,7 +15,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
@@ -1347,6 +1348,151 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_lazy_platforms_are_not_preloaded(hass: HomeAssistant) -> None:
+    """Verify lazy platforms are not preloaded and unused preloads are reported."""
+    loader.async_enable_lazy_platforms(hass)
+    loader.async_register_preload_platform(hass, "diagnostics")
+    assert "diagnostics" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+    assert loader.async_is_lazy_platform(hass, "diagnostics")
+
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+    hass.set_state(CoreState.not_running)
+
+    with (
+        patch("homeassistant.loader.importlib.import_module") as mock_import,
+        patch.object(
+            executor_import_integration,
+            "platforms_exists",
+            lambda platforms: [
+                platform
+                for platform in platforms
+                if platform in ("config_flow", "diagnostics", "logbook")
+            ],
+        ),
+    ):
+        await executor_import_integration.async_get_component()
+        await executor_import_integration.async_get_platform("config_flow")
+
+    assert {call[0][0] for call in mock_import.call_args_list} == {
+        "homeassistant.components.executor_import",
+        "homeassistant.components.executor_import.config_flow",
+        "homeassistant.components.executor_import.logbook",
+    }
+    assert loader.async_pop_unused_preload_platforms(hass) == [
+        "executor_import.logbook"
+    ]
+    assert loader.async_pop_unused_preload_platforms(hass) == []
+
+
+async def test_async_import_components(hass: HomeAssistant) -> None:
+    """Verify components are imported in a batch import executor job."""
+    integrations = [
+        _get_test_integration(hass, f"batch_import_{idx}", False, import_executor=True)
+        for idx in range(3)
+    ]
+    modules = {
+        f"homeassistant.components.batch_import_{idx}": Mock() for idx in range(3)
+    }
+
+    def mock_import_module(name: str) -> Mock:
+        if name == "homeassistant.components.batch_import_1":
+            raise ImportError("failed")
+        if name not in modules:
+            raise ModuleNotFoundError(name)
+        return modules[name]
+
+    with (
+        patch(
+            "homeassistant.loader.importlib.import_module",
+            side_effect=mock_import_module,
+        ),
+        patch.object(
+            hass,
+            "async_add_import_executor_job",
+            wraps=hass.async_add_import_executor_job,
+        ) as mock_import_job,
+    ):
+        await loader.async_import_components(hass, integrations)
+        # One job for the batch and one to import the component
+        # that failed in the batch again
+        assert mock_import_job.call_count == 2
+
+        assert (
+            await integrations[0].async_get_component()
+            is modules["homeassistant.components.batch_import_0"]
+        )
+        assert (
+            await integrations[2].async_get_component()
+            is modules["homeassistant.components.batch_import_2"]
+        )
+        with pytest.raises(ImportError):
+            await integrations[1].async_get_component()
+
+        # Imported components are not imported again
+        import_job_count = mock_import_job.call_count
+        await loader.async_import_components(hass, integrations[::2])
+        assert mock_import_job.call_count == import_job_count
+
+
+async def test_async_import_components_chunks(hass: HomeAssistant) -> None:
+    """Verify components are imported in chunks of IMPORT_CHUNK_SIZE."""
+    integrations = [
+        _get_test_integration(hass, f"chunk_import_{idx}", False, import_executor=True)
+        for idx in range(5)
+    ]
+    modules = {
+        f"homeassistant.components.chunk_import_{idx}": Mock() for idx in range(5)
+    }
+
+    with (
+        patch.object(loader, "IMPORT_CHUNK_SIZE", 2),
+        patch("homeassistant.loader.importlib.import_module", side_effect=modules.get),
+        patch.object(
+            hass,
+            "async_add_import_executor_job",
+            wraps=hass.async_add_import_executor_job,
+        ) as mock_import_job,
+    ):
+        await loader.async_import_components(hass, integrations)
+
+    assert [len(call[0][1]) for call in mock_import_job.call_args_list] == [2, 2, 1]
+    for idx, integration in enumerate(integrations):
+        assert (
+            await integration.async_get_component()
+            is modules[f"homeassistant.components.chunk_import_{idx}"]
+        )
+
+
+async def test_async_prefetch_files(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Verify the bytecode of a module is read instead of the source if it exists."""
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "sensor.py").write_text("")
+    (tmp_path / "manifest.json").write_text("{}")
+    init_pyc = importlib.util.cache_from_source(str(tmp_path / "__init__.py"))
+    os.makedirs(os.path.dirname(init_pyc))
+    pathlib.Path(init_pyc).write_bytes(b"")
+    integration = loader.Integration(
+        hass,
+        "custom_components.prefetch",
+        tmp_path,
+        {"name": "prefetch", "domain": "prefetch"},
+        {"__init__.py", "sensor.py", "manifest.json"},
+    )
+
+    with patch("homeassistant.loader.open", side_effect=open, create=True) as mock_open:
+        await loader.async_prefetch_files(hass, [integration])
+
+    opened = {call[0][0] for call in mock_open.call_args_list}
+    assert init_pyc in opened
+    assert str(tmp_path / "__init__.py") not in opened
+    assert str(tmp_path / "sensor.py") in opened
+    assert str(tmp_path / "manifest.json") not in opened
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture